@@ -0,0 +1,44 @@
+"""fk indexes
+
+Revision ID: 0c67f9acfdff
+Revises: 5c1e2f0b9d4a
+Create Date: 2026-10-18 02:56:36.975436
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0c67f9acfdff'
+down_revision: Union[str, None] = '5c1e2f0b9d4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns). The association tables get an index in the reverse direction of their primary key.
+INDEXES = (
+    ('ix_fish_fishspecies_id', 'fish', ['fishspecies_id']),
+    ('ix_fish_fisherman_id', 'fish', ['fisherman_id']),
+    ('ix_fish_fishingwater_id_fishspecies_id', 'fish', ['fishingwater_id', 'fishspecies_id']),
+    ('ix_fishingwater_fisherman_fisherman_id', 'fishingwater_fisherman', ['fisherman_id']),
+    ('ix_fisherman_fishingday_fishingday_id', 'fisherman_fishingday', ['fishingday_id']),
+    ('ix_user_role_role_id', 'user_role', ['role_id']),
+    ('ix_role_acl_acl_id', 'role_acl', ['acl_id']),
+    ('ix_acl_scope_scope_id', 'acl_scope', ['scope_id']),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY does not lock the tables for writes, but it can not run in a transaction.
+    # IF NOT EXISTS: after an interrupted run the migration can be repeated
+    # (drop an INVALID index left behind by a failed build first).
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
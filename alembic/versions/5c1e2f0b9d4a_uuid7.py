@@ -0,0 +1,43 @@
+"""uuid7
+
+Revision ID: 5c1e2f0b9d4a
+Revises: 107add59f171
+Create Date: 2026-10-18 10:12:31.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e2f0b9d4a'
+down_revision: Union[str, None] = '107add59f171'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The existing (random) ids stay valid, only new ids are time-ordered.
+TABLES = ('acl', 'fish', 'fisherman', 'fishingday', 'fishingwater', 'fishspecies', 'role', 'scope', 'user')
+
+
+def upgrade() -> None:
+    op.execute("""
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(set_bit(
+                overlay(uuid_send(gen_random_uuid())
+                        placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                        FROM 1 FOR 6),
+                52, 1), 53, 1),
+            'hex')::uuid
+    $$ LANGUAGE sql VOLATILE
+    """)
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuid_generate_v7()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    op.execute('DROP FUNCTION IF EXISTS uuid_generate_v7()')
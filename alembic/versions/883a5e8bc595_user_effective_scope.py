@@ -0,0 +1,52 @@
+"""user_effective_scope
+
+Revision ID: 883a5e8bc595
+Revises: 0c67f9acfdff
+Create Date: 2026-10-18 14:21:09.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.domains.login.scope.models import USER_EFFECTIVE_SCOPE_DDL
+
+
+# revision identifiers, used by Alembic.
+revision: str = '883a5e8bc595'
+down_revision: Union[str, None] = '0c67f9acfdff'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LINK_TABLES = ('user_role', 'role_acl', 'acl_scope')
+TRIGGER_FUNCTIONS = (
+    'user_effective_scope_user_role', 'user_effective_scope_role_acl', 'user_effective_scope_acl_scope',
+    'user_effective_scope_scope', 'user_effective_scope_rebuild')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_effective_scope',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('entity', sa.String(), nullable=False),
+        sa.Column('access', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'entity', 'access')
+    )
+    # The functions and triggers, as created for the models.
+    for statement in USER_EFFECTIVE_SCOPE_DDL:
+        op.execute(statement)
+    # The existing links
+    op.execute('SELECT refresh_user_effective_scope(NULL)')
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS user_effective_scope_update ON scope')
+    for table_name in LINK_TABLES:
+        for trigger_name in ('insert', 'delete', 'truncate'):
+            op.execute(f'DROP TRIGGER IF EXISTS user_effective_scope_{trigger_name} ON {table_name}')
+    for function_name in TRIGGER_FUNCTIONS:
+        op.execute(f'DROP FUNCTION IF EXISTS {function_name}()')
+    op.execute('DROP FUNCTION IF EXISTS refresh_user_effective_scope(uuid[])')
+    op.drop_table('user_effective_scope')
@@ -0,0 +1,54 @@
+"""
+Benchmark: bcrypt cost (BCRYPT_ROUNDS). Per number of rounds, the time of one hash and the hashes per second
+of one core, and of all cores via the bcrypt thread pool (bcrypt releases the GIL). A login verifies one hash.
+Pick the highest cost whose hash time is acceptable for a login, and whose throughput covers the login peak.
+
+Usage: python -m benchmarks.bcrypt_cost [rounds...]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+PASSWORD = b'Benchmark_Password1!'
+MINIMUM_SECONDS = 1.0
+
+
+def hash_count(rounds: int, seconds: float) -> int:
+    """ The number of hashes in (at least) seconds. """
+    salt = bcrypt.gensalt(rounds=rounds)
+    count = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        bcrypt.hashpw(PASSWORD, salt)
+        count += 1
+    return count
+
+
+def run_one(rounds: int, cores: int) -> dict:
+    started_at = time.perf_counter()
+    count = hash_count(rounds, MINIMUM_SECONDS)
+    per_core = count / (time.perf_counter() - started_at)
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=cores) as executor:
+        count = sum(executor.map(hash_count, [rounds] * cores, [MINIMUM_SECONDS] * cores))
+    all_cores = count / (time.perf_counter() - started_at)
+    return {
+        'rounds': rounds,
+        'hash_ms': round(1000 / per_core, 1),
+        'hashes_per_second_per_core': round(per_core, 1),
+        f'hashes_per_second_{cores}_cores': round(all_cores, 1),
+    }
+
+
+def main(*rounds: int):
+    cores = os.cpu_count() or 1
+    print(f'Current BCRYPT_ROUNDS: {os.getenv("BCRYPT_ROUNDS", 12)}')
+    for value in rounds or (10, 11, 12, 13, 14):
+        print(run_one(value, cores))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
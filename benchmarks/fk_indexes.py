@@ -0,0 +1,136 @@
+"""
+Benchmark: relationship loads and cascade deletes on fish, without and with the foreign key indexes.
+Per size a scratch copy of the fish table (with fishing waters and fishermen) is filled, then the timings are
+measured before and after the indexes of migration "fk indexes" are created.
+The deletes run in a transaction that is rolled back, so every run deletes the same rows.
+
+Usage (DATABASE_URI from .env): python -m benchmarks.fk_indexes [rows...]
+"""
+import asyncio
+import random
+import sys
+import time
+import uuid
+
+from sqlalchemy import Table, Column, MetaData, Uuid, String, ForeignKey, Index, insert, text
+
+from src.db.db import get_async_engine, dispose_engines
+from src.domains.entities.enums import FishStatus
+from src.utils.functions import get_uuid7
+
+FISHINGWATERS = 100
+FISHERMEN = 1000
+SPECIES = 10
+BATCH_SIZE = 10_000
+REPEAT = 5
+
+
+def get_tables(metadata) -> tuple[Table, Table, Table]:
+    fishingwater = Table('benchmark_fishingwater', metadata, Column('id', Uuid, primary_key=True))
+    fisherman = Table('benchmark_fisherman', metadata, Column('id', Uuid, primary_key=True))
+    fish = Table(
+        'benchmark_fish', metadata,
+        Column('id', Uuid, primary_key=True),
+        Column('fishspecies_id', Uuid, nullable=False),
+        Column('status', String, nullable=False),
+        Column('fisherman_id', ForeignKey('benchmark_fisherman.id'), nullable=True),
+        Column('fishingwater_id', ForeignKey('benchmark_fishingwater.id'), nullable=True),
+    )
+    return fishingwater, fisherman, fish
+
+
+def get_indexes(fish: Table) -> list[Index]:
+    """ The indexes of table "fish" in migration "fk indexes". """
+    return [
+        Index('ix_benchmark_fish_fishspecies_id', fish.c.fishspecies_id),
+        Index('ix_benchmark_fish_fisherman_id', fish.c.fisherman_id),
+        Index('ix_benchmark_fish_fishingwater_id_fishspecies_id', fish.c.fishingwater_id, fish.c.fishspecies_id),
+    ]
+
+
+async def populate(engine, fishingwater, fisherman, fish, rows: int) -> tuple[list, list, list]:
+    fishingwater_ids = [get_uuid7() for _ in range(FISHINGWATERS)]
+    fisherman_ids = [get_uuid7() for _ in range(FISHERMEN)]
+    species_ids = [uuid.uuid4() for _ in range(SPECIES)]
+    async with engine.begin() as conn:
+        await conn.execute(insert(fishingwater), [{'id': id} for id in fishingwater_ids])
+        await conn.execute(insert(fisherman), [{'id': id} for id in fisherman_ids])
+    for i in range(0, rows, BATCH_SIZE):
+        values = [
+            {'id': get_uuid7(), 'fishspecies_id': random.choice(species_ids), 'status': FishStatus.Sleeping,
+             # Most fishes have not been caught.
+             'fisherman_id': random.choice(fisherman_ids) if random.random() < 0.1 else None,
+             'fishingwater_id': random.choice(fishingwater_ids)}
+            for _ in range(min(BATCH_SIZE, rows - i))]
+        async with engine.begin() as conn:
+            await conn.execute(insert(fish), values)
+    async with engine.begin() as conn:
+        await conn.execute(text(f'ANALYZE {fishingwater.name}, {fisherman.name}, {fish.name}'))
+    return fishingwater_ids, fisherman_ids, species_ids
+
+
+async def get_timings(engine, fishingwater, fisherman, fish, fishingwater_ids, fisherman_ids, species_ids) -> dict:
+    """ Median milliseconds per operation. """
+    selectin_ids = ', '.join(f"'{id}'" for id in fishingwater_ids[:10])
+    statements = {
+        # selectinload(FishingWater.fishes) for a page of fishing waters
+        'selectin_load': [f'SELECT id FROM {fish.name} WHERE fishingwater_id IN ({selectin_ids})'],
+        # Simulation: the fishes of one species in a fishing water
+        'species_in_water': [
+            f"SELECT id FROM {fish.name} WHERE fishingwater_id = '{fishingwater_ids[0]}' "
+            f"AND fishspecies_id = '{species_ids[0]}'"],
+        # Cascade delete of a fishing water: its fishes, then the water itself (foreign key check on fish).
+        'delete_fishingwater': [
+            f"DELETE FROM {fish.name} WHERE fishingwater_id = '{fishingwater_ids[0]}'",
+            f"DELETE FROM {fishingwater.name} WHERE id = '{fishingwater_ids[0]}'"],
+        # A fisherman: release the caught fishes, then delete (foreign key check on fish).
+        'delete_fisherman': [
+            f"UPDATE {fish.name} SET fisherman_id = NULL WHERE fisherman_id = '{fisherman_ids[0]}'",
+            f"DELETE FROM {fisherman.name} WHERE id = '{fisherman_ids[0]}'"],
+    }
+    timings = {}
+    for name, statement_list in statements.items():
+        durations = []
+        for _ in range(REPEAT):
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                start_time = time.perf_counter()
+                for statement in statement_list:
+                    await conn.execute(text(statement))
+                durations.append(time.perf_counter() - start_time)
+                await transaction.rollback()
+        timings[name] = round(sorted(durations)[len(durations) // 2] * 1000, 2)
+    return timings
+
+
+async def run_one(engine, rows: int) -> dict:
+    metadata = MetaData()
+    fishingwater, fisherman, fish = get_tables(metadata)
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+    ids = await populate(engine, fishingwater, fisherman, fish, rows)
+
+    result = {'rows': rows}
+    result['without_indexes_ms'] = await get_timings(engine, fishingwater, fisherman, fish, *ids)
+    async with engine.begin() as conn:
+        for index in get_indexes(fish):
+            await conn.run_sync(index.create)
+        await conn.execute(text(f'ANALYZE {fish.name}'))
+    result['with_indexes_ms'] = await get_timings(engine, fishingwater, fisherman, fish, *ids)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+    return result
+
+
+async def main(*sizes: int):
+    engine = get_async_engine()
+    engine.echo = False
+    for rows in sizes or (100_000, 1_000_000):
+        print(await run_one(engine, rows))
+    await dispose_engines()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*[int(arg) for arg in sys.argv[1:]]))
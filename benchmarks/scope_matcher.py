@@ -0,0 +1,61 @@
+"""
+Benchmark: scope check of a request, splitting the user scopes per request versus the compiled ScopeMatcher.
+Per number of user scopes, a request checks one endpoint scope that the user does not have (the worst case:
+every user scope is evaluated). The one-off compile time of the ScopeMatcher is reported separately.
+
+Usage: python -m benchmarks.scope_matcher [scopes...]
+"""
+import sys
+import timeit
+
+from src.constants import ALL
+from src.domains.login.scope.scope_matcher import ScopeMatcher
+
+REPEAT = 10_000
+
+
+def is_valid_scope(endpoint_scope, user_scopes) -> bool:
+    """ The former implementation (token functions _is_valid_scope) """
+    if not endpoint_scope or not user_scopes:
+        return False
+    ep_entity, ep_access = endpoint_scope.split('_', maxsplit=1)
+    if not ep_entity or not ep_access:
+        return False
+    for scope in user_scopes:
+        entity, access = scope.split('_', maxsplit=1)
+        if not entity or not access:
+            continue
+        if entity == ALL:
+            if access in (ALL, ep_access):
+                return True
+        else:
+            if entity == ep_entity or ep_entity == ALL:
+                if access in (ALL, ep_access):
+                    return True
+    return False
+
+
+def run_one(scope_count: int) -> dict:
+    accesses = ('read', 'readall', 'update', 'create')
+    user_scopes = [f'entity{i}_{access}' for i in range(scope_count // len(accesses)) for access in accesses]
+    endpoint_scope = 'fish_delete'
+    compile_seconds = timeit.timeit(lambda: ScopeMatcher(user_scopes), number=100) / 100
+    matcher = ScopeMatcher(user_scopes)
+    split_seconds = timeit.timeit(lambda: is_valid_scope(endpoint_scope, user_scopes), number=REPEAT) / REPEAT
+    matcher_seconds = timeit.timeit(lambda: matcher.is_allowed(endpoint_scope), number=REPEAT) / REPEAT
+    return {
+        'scopes': len(user_scopes),
+        'split_us': round(split_seconds * 1e6, 2),
+        'matcher_us': round(matcher_seconds * 1e6, 2),
+        'speedup': round(split_seconds / matcher_seconds, 1),
+        'compile_us': round(compile_seconds * 1e6, 1),
+    }
+
+
+def main(*sizes: int):
+    for scope_count in sizes or (12, 100, 500, 1000):
+        print(run_one(scope_count))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
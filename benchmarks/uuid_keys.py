@@ -0,0 +1,76 @@
+"""
+Benchmark: random (v4) versus time-ordered (v7) primary keys for fish inserts.
+Per key type the fish rows are inserted in batches into a scratch copy of the fish table,
+then throughput and the size of the primary key index are reported.
+
+Usage (DATABASE_URI from .env): python -m benchmarks.uuid_keys [rows] [batch_size]
+"""
+import asyncio
+import sys
+import time
+import uuid
+
+from sqlalchemy import Table, Column, MetaData, Uuid, String, Integer, insert, text
+
+from src.db.db import get_async_engine, dispose_engines
+from src.domains.entities.enums import FishStatus
+from src.utils.functions import get_uuid7
+
+KEY_GENERATORS = {'uuid4': uuid.uuid4, 'uuid7': get_uuid7}
+
+
+def get_fish_table(metadata, name) -> Table:
+    """ Columns of table "fish", without the foreign keys. """
+    return Table(
+        name, metadata,
+        Column('id', Uuid, primary_key=True),
+        Column('fishspecies_id', Uuid, nullable=False),
+        Column('status', String, nullable=False),
+        Column('age', Integer),
+        Column('length_cm', Integer),
+        Column('weight_g', Integer),
+        Column('caught_count', Integer),
+    )
+
+
+async def run_one(engine, key_name, rows: int, batch_size: int) -> dict:
+    metadata = MetaData()
+    table = get_fish_table(metadata, f'benchmark_fish_{key_name}')
+    get_key = KEY_GENERATORS[key_name]
+    fishspecies_id = uuid.uuid4()
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    start_time = time.perf_counter()
+    for i in range(0, rows, batch_size):
+        values = [
+            {'id': get_key(), 'fishspecies_id': fishspecies_id, 'status': FishStatus.Sleeping,
+             'age': 1, 'length_cm': 10, 'weight_g': 100, 'caught_count': 0}
+            for _ in range(min(batch_size, rows - i))]
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), values)
+    seconds = time.perf_counter() - start_time
+
+    async with engine.begin() as conn:
+        index_bytes = (await conn.execute(text(f"SELECT pg_relation_size('{table.name}_pkey')"))).scalar()
+        await conn.run_sync(metadata.drop_all)
+    return {
+        'key': key_name,
+        'rows': rows,
+        'seconds': round(seconds, 1),
+        'rows_per_second': round(rows / seconds),
+        'pkey_index_mb': round(index_bytes / 1024 / 1024, 1),
+    }
+
+
+async def main(rows: int = 1_000_000, batch_size: int = 10_000):
+    engine = get_async_engine()
+    engine.echo = False
+    for key_name in KEY_GENERATORS:
+        print(await run_one(engine, key_name, rows, batch_size))
+    await dispose_engines()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*[int(arg) for arg in sys.argv[1:3]]))
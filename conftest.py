@@ -9,6 +9,8 @@ from sqlalchemy.orm import sessionmaker
 from src.utils.client import get_async_client
 from src.utils.tests.constants import PASSWORD, LOGIN, SCOPES
 from src.db.db import get_async_engine
+from src.db.reference_cache import reference_cache
+from src.domains.login.user.status_cache import user_status_cache
 from src.domains.base.models import Base
 from src.main import app
 from src.utils.tests.functions import get_json, get_fixture_path
@@ -17,6 +19,7 @@ from tests.tdd.tdd_scopes import get_tdd_test_scenarios_scopes
 
 load_dotenv()
 os.environ['DATABASE_URI'] = os.getenv('DATABASE_URI_TEST')
+os.environ['DATABASE_REPLICA_URI'] = os.getenv('DATABASE_REPLICA_URI_TEST', '')
 async_engine = get_async_engine()
 
 
@@ -37,6 +40,8 @@ async def db() -> AsyncSession:
     async with session() as s:
         async with async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        reference_cache.clear()
+        user_status_cache.clear()
         yield s
 
     async with async_engine.begin() as conn:
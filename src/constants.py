@@ -2,6 +2,8 @@ UNKNOWN = '*unknown'
 # Headers
 AUTHORIZATION = 'authorization'
 X_REFRESH_TOKEN = 'x-refresh-token'
+X_NEXT_CURSOR = 'x-next-cursor'
+ETAG = 'etag'
 # Authentication
 EMAIL = 'email'
 ROLE_NAMES = 'role_names'
@@ -0,0 +1,40 @@
+from sqlalchemy import text
+
+from src.db.reference_cache import invalidate_on_commit
+from src.domains.base.models import get_session_email
+
+"""
+COPY loader for large bulk inserts, e.g. a synthetic world of a million fishes.
+The rows are streamed with the COPY protocol into a temporary staging table (not WAL-logged), then moved into the
+target table with one INSERT ... SELECT. This is much faster than INSERT statements, but the ORM events and Python
+column defaults do not apply: the rows must contain every non-nullable column without a server default.
+It runs in the transaction of the session and does not commit: use crud.commit(db) when done.
+"""
+
+
+async def copy_rows(db, obj_def, columns: list[str], rows) -> int:
+    """
+    Insert the rows (dicts, any iterable: a generator keeps the memory use flat) into the table of the model or
+    Table obj_def. The audit columns created_at, created_by and updated_at are set here. Returns the number of rows.
+    """
+    table = getattr(obj_def, '__table__', obj_def)
+    staging_name = f'staging_{table.name}'
+    column_names = ', '.join(f'"{column}"' for column in columns)
+    insert_names, select_names = column_names, column_names
+    if 'created_by' in table.c:
+        insert_names = f'{column_names}, "created_at", "created_by", "updated_at"'
+        select_names = f"{column_names}, timezone('UTC', now()), :created_by, timezone('UTC', now())"
+
+    # Same column types as the target, but without its constraints.
+    await db.execute(text(
+        f'CREATE TEMPORARY TABLE "{staging_name}" AS SELECT {column_names} FROM "{table.name}" WITH NO DATA'))
+    connection = await (await db.connection()).get_raw_connection()
+    await connection.driver_connection.copy_records_to_table(
+        staging_name, records=(tuple(row[column] for column in columns) for row in rows), columns=columns)
+    result = await db.execute(
+        text(f'INSERT INTO "{table.name}" ({insert_names}) SELECT {select_names} FROM "{staging_name}"'),
+        {'created_by': get_session_email()} if 'created_by' in table.c else {})
+    await db.execute(text(f'DROP TABLE "{staging_name}"'))
+    if table is not obj_def:
+        invalidate_on_commit(db, obj_def)
+    return result.rowcount
@@ -1,28 +1,83 @@
 from typing import cast
 
 from pydantic import SecretStr
+from sqlalchemy import insert, update, func, inspect, text, delete as sql_delete
 from sqlalchemy.future import select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
 
 from src.constants import ID
+from src.db.pagination import Page, encode_cursor, decode_cursor
+from src.db.reference_cache import invalidate_on_commit
+from src.db.unit_of_work import is_unit_of_work
+from src.domains.base.models import get_session_email, AUDIT_COLUMNS
 from src.domains.login.scope.models import Access
 
 """
 CRUD on SQLAlchemy
+Every change is committed, except within a unit of work (see unit_of_work.py): then it is only flushed.
 """
 
 
+async def commit(db):
+    """ Commit, or within a unit of work only flush: the unit of work commits at the end. """
+    if is_unit_of_work(db):
+        await db.flush()
+    else:
+        await db.commit()
+
+
 # C
 async def add(db, obj):
+    """ The id is generated client side (get_uuid7), so the new object does not have to be refreshed. """
     db.add(obj)
-    await db.commit()
-    await db.refresh(obj)  # Get the new ID
+    await commit(db)
+    _set_empty_collections(obj)
     return obj
 
 
+def _set_empty_collections(obj):
+    """ A new object has no related rows yet: mark its unloaded collections as loaded, so they are not lazy loaded. """
+    state = inspect(obj)
+    for relationship in state.mapper.relationships:
+        if relationship.uselist and relationship.key in state.unloaded:
+            set_committed_value(obj, relationship.key, [])
+
+
+async def add_many(db, obj_def, rows: list, chunk_size: int = 1000) -> list:
+    """
+    Bulk insert in one transaction: per chunk one multi-row INSERT ... RETURNING id.
+    Rows are dicts or new model objects. Returns the new ids in the order of the rows.
+    N.B. ORM insert events do not fire for bulk inserts, so "created_by" is set here.
+    """
+    created_by = get_session_email()
+    ids = []
+    for i in range(0, len(rows), chunk_size):
+        values = [{**_get_insert_values(obj_def, row), 'created_by': created_by} for row in rows[i:i + chunk_size]]
+        result = await db.execute(insert(obj_def).returning(obj_def.id, sort_by_parameter_order=True), values)
+        ids.extend(result.scalars().all())
+    invalidate_on_commit(db, obj_def)
+    await commit(db)
+    return ids
+
+
+def _get_insert_values(obj_def, row) -> dict:
+    if isinstance(row, dict):
+        return row
+    # Model object: only the attributes that have been set, the column defaults do the rest.
+    return {key: getattr(row, key) for key in obj_def.__table__.columns.keys() if key in row.__dict__}
+
+
 # R
-async def get_all(db, obj_def, skip: int = 0, limit: int = 9999):
+# Relations are not loaded by default (lazy='raise_on_sql'). Pass the loader options of a loading profile,
+# e.g. options=get_fishingwater_detail_profile(), to load the relations the caller needs.
+
+
+async def get_all(db, obj_def, skip: int = 0, limit: int = 9999, options=()):
     result = await db.execute(
         select(obj_def)
+        .options(*options)
         .offset(skip)
         .limit(limit)
     )
@@ -30,47 +85,166 @@ async def get_all(db, obj_def, skip: int = 0, limit: int = 9999):
     return objects
 
 
-async def get_one(db, obj_def, id):
+async def get_page(db, obj_def, skip: int = 0, limit: int = 10, cursor: str = None, options=()) -> Page:
+    """
+    Get a page ordered by id. With a cursor the page starts right after the last id of the previous page (keyset),
+    so deep pages cost the same as the first one. Without a cursor the offset is used.
+    """
+    statement = select(obj_def).options(*options).order_by(obj_def.id).limit(limit)
+    if cursor:
+        statement = statement.where(cast('ColumnElement[bool]', obj_def.id > decode_cursor(cursor)))
+    else:
+        statement = statement.offset(skip)
+    result = await db.execute(statement)
+    objects = result.scalars().all()
+    next_cursor = encode_cursor(objects[-1].id) if objects and len(objects) == limit else None
+    return Page(objects, next_cursor)
+
+
+async def stream(db, obj_def, columns, cursor: str = None, limit: int = None, chunk_size: int = 1000):
+    """
+    Stream the rows ordered by id, as dicts of the columns, in chunks of chunk_size rows.
+    A server-side cursor is used: only one chunk is in memory. The cursor is the one of get_page.
+    Raises ValueError when the cursor is invalid.
+    """
+    statement = select(*columns).order_by(obj_def.id).limit(limit)
+    if cursor:
+        statement = statement.where(cast('ColumnElement[bool]', obj_def.id > decode_cursor(cursor)))
+    result = await db.stream(statement.execution_options(yield_per=chunk_size))
+    async for rows in result.mappings().partitions():
+        yield rows
+
+
+async def get_one(db, obj_def, id, options=()):
     """ Get one by id """
-    result = await db.execute(select(obj_def).where(cast('ColumnElement[bool]', obj_def.id == id)))
+    result = await db.execute(
+        select(obj_def).options(*options).where(cast('ColumnElement[bool]', obj_def.id == id)))
     return result.scalars().first()
 
 
-async def get_where(db, obj_def, att_name, att_value):
-    result = await db.execute(select(obj_def).where(cast('ColumnElement[bool]', att_name == att_value)))
+async def get_where(db, obj_def, att_name, att_value, options=()):
+    result = await db.execute(
+        select(obj_def).options(*options).where(cast('ColumnElement[bool]', att_name == att_value)))
     objects = result.scalars().all()
     return objects
 
 
-async def get_one_where(db, obj_def, att_name, att_value):
-    result = await db.execute(select(obj_def).where(cast('ColumnElement[bool]', att_name == att_value)))
+async def get_one_where(db, obj_def, att_name, att_value, options=()):
+    result = await db.execute(
+        select(obj_def).options(*options).where(cast('ColumnElement[bool]', att_name == att_value)))
     return result.scalars().first()
 
 
 # U
-async def upd(db, obj_def, obj_upd):
-    """ SQlAlchemy direct update (test purpose) """
-    # Get the record
-    obj = await get_one(db, obj_def, obj_upd.id)
-    # Copy the updated attributes to SQLAlchemy model
-    for key in obj_def.__table__.columns.keys():
-        value = getattr(obj_upd, key, None)
-        if value is not None and key != ID:
-            if isinstance(value, SecretStr):
-                value = value.get_secret_value()
-            elif isinstance(value, Access):
-                value = Access.get_access_value(value)
-            setattr(obj, key, value)
-    # Increment update_count
-    obj.update_count = 1 if not obj.update_count else obj.update_count + 1
-    await db.commit()
-    await db.refresh(obj)  # Get the new values
+async def upd(db, obj_def, obj_upd, expected_update_count: int = None):
+    """
+    Partial update in one statement: UPDATE ... SET <changed fields>, update_count = update_count + 1 ... RETURNING.
+    - A model object loaded in the session: only its changed (dirty) attributes are sent.
+    - Else (e.g. pydantic): the attributes that are not None.
+    With expected_update_count the update is conditional (optimistic concurrency): StaleDataError on a conflict.
+    Returns None if the record does not exist.
+    """
+    table = obj_def.__table__
+    id = obj_upd.id
+    where = [table.c.id == id]
+    if expected_update_count is not None:
+        where.append(func.coalesce(table.c.update_count, 0) == expected_update_count)
+    statement = (
+        update(table)
+        .where(*where)
+        .values(
+            **_get_update_values(obj_def, obj_upd),
+            update_count=func.coalesce(table.c.update_count, 0) + 1,
+            updated_by=get_session_email())
+        .returning(*table.columns))
+    # The changes are in the statement. Do not flush them separately.
+    with db.no_autoflush:
+        row = (await db.execute(statement)).mappings().first()
+    if row is None:
+        # Nothing updated: discard the pending changes of the object, not the other work in the session.
+        _discard_changes(db, obj_upd)
+        if expected_update_count is not None and await _exists(db, obj_def, id):
+            raise StaleDataError(
+                f'{obj_def.__tablename__} record "{id}" has been changed by someone else '
+                f'(expected update_count {expected_update_count}).')
+        return None
+    obj = _set_committed_values(db, obj_def, obj_upd, row)
+    invalidate_on_commit(db, obj_def)
+    await commit(db)
+    return obj
+
+
+def _discard_changes(db, obj_upd):
+    state = inspect(obj_upd, raiseerr=False)
+    if state is not None and state.persistent:
+        db.expire(obj_upd)
+
+
+def _set_committed_values(db, obj_def, obj_upd, row):
+    """ Store the returned row in the session object as its committed state, so it is not flushed again. """
+    state = inspect(obj_upd, raiseerr=False)
+    if state is not None and state.persistent:
+        obj = obj_upd
+    else:
+        obj = db.sync_session.identity_map.get(db.sync_session.identity_key(obj_def, row[ID]))
+    attach = obj is None
+    if attach:
+        # Not in the session (e.g. updated from pydantic): attach a clean instance without a SELECT.
+        obj = obj_def()
+    for key, value in row.items():
+        set_committed_value(obj, key, value)
+    if attach:
+        make_transient_to_detached(obj)
+        db.add(obj)
     return obj
 
 
+def _get_update_values(obj_def, obj_upd) -> dict:
+    state = inspect(obj_upd, raiseerr=False)
+    if state is not None and state.persistent:
+        # Dirty attributes only
+        keys = [key for key in obj_def.__table__.columns.keys() if state.attrs[key].history.has_changes()]
+        values = {key: state.dict.get(key) for key in keys}
+    else:
+        values = {key: getattr(obj_upd, key, None) for key in obj_def.__table__.columns.keys()}
+        values = {key: value for key, value in values.items() if value is not None}
+    # Converted from pydantic to SA. Audit columns are maintained by the update itself.
+    for key, value in values.items():
+        if isinstance(value, SecretStr):
+            values[key] = value.get_secret_value()
+        elif isinstance(value, Access):
+            values[key] = Access.get_access_value(value)
+    return {key: value for key, value in values.items() if key not in (ID, *AUDIT_COLUMNS)}
+
+
+async def _exists(db, obj_def, id) -> bool:
+    result = await db.execute(select(obj_def.id).where(cast('ColumnElement[bool]', obj_def.id == id)))
+    return result.first() is not None
+
+
 # D
 async def delete(db, obj_def, id) -> bool:
     obj = await get_one(db, obj_def, id)
     await db.delete(obj)
-    await db.commit()
+    await commit(db)
     return True
+
+
+async def delete_where(db, obj_def, *criteria) -> int:
+    """
+    Set-based delete: one DELETE statement for all rows matching the criteria (no criteria = all rows).
+    N.B. Only the database ON DELETE rules apply, not the ORM cascades. Returns the number of deleted rows.
+    """
+    result = await db.execute(
+        sql_delete(obj_def).where(*criteria).execution_options(synchronize_session=False))
+    invalidate_on_commit(db, obj_def)
+    await commit(db)
+    return result.rowcount
+
+
+async def truncate(db, *obj_defs):
+    """ Empty the tables at once. CASCADE also empties the tables that refer to them. """
+    table_names = ', '.join(f'"{obj_def.__tablename__}"' for obj_def in obj_defs)
+    await db.execute(text(f'TRUNCATE TABLE {table_names} CASCADE'))
+    invalidate_on_commit(db, *obj_defs)
+    await commit(db)
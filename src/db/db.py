@@ -1,23 +1,65 @@
 import os
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
 
+from src.db.pool import InstrumentedPool
 from src.domains.base.models import Base
 
 # Needed here for alembic
 load_dotenv()
 
+# Process-wide engines (each with its own connection pool) and session factories, keyed by database URI.
+_engines: dict[str, AsyncEngine] = {}
+_session_makers: dict[str, sessionmaker] = {}
 
-def get_async_engine():
-    """ In pytest osenviron DATABASE_URI is changed, so the engine should be retrieved dynamically. """
-    return create_async_engine(os.getenv("DATABASE_URI"), echo=True, future=True)
+
+def get_async_engine(uri: str = None) -> AsyncEngine:
+    """
+    Return the engine of the database URI, default the current DATABASE_URI. It is created lazily, once per process.
+    In pytest os.environ DATABASE_URI is changed, so the engine is looked up by URI on every call.
+    """
+    uri = uri or os.getenv('DATABASE_URI')
+    engine = _engines.get(uri)
+    if engine is None:
+        engine = create_async_engine(
+            uri, echo=os.getenv('DB_ECHO', 'False') == 'True', future=True, **_get_pool_settings())
+        _engines[uri] = engine
+    return engine
+
+
+def get_session_maker(uri: str = None) -> sessionmaker:
+    """ Return the session factory bound to the engine of the database URI, default the current DATABASE_URI. """
+    uri = uri or os.getenv('DATABASE_URI')
+    session_maker = _session_makers.get(uri)
+    if session_maker is None:
+        session_maker = sessionmaker(bind=get_async_engine(uri), class_=AsyncSession, expire_on_commit=False)
+        _session_makers[uri] = session_maker
+    return session_maker
+
+
+def _get_pool_settings() -> dict:
+    return {
+        'poolclass': InstrumentedPool,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.getenv('DB_POOL_MAX_OVERFLOW', 20)),
+        'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT_SECONDS', 30)),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE_SECONDS', 1800)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'True') == 'True',
+    }
+
+
+async def dispose_engines():
+    """ Close the pooled connections of all engines, e.g. on app shutdown. """
+    for engine in _engines.values():
+        await engine.dispose()
+    _engines.clear()
+    _session_makers.clear()
 
 
 async def get_db_session() -> AsyncSession:
-    # Create a configured "Session" class
-    async_session = sessionmaker(bind=get_async_engine(), class_=AsyncSession, expire_on_commit=False)
+    async_session = get_session_maker()
     async with async_session() as session:
         yield session
 
@@ -0,0 +1,26 @@
+import base64
+import json
+from uuid import UUID
+
+"""
+Keyset (cursor) pagination. Pages are ordered by id, the cursor is the opaque encoded id of the last row of a page.
+"""
+
+
+class Page:
+    def __init__(self, items: list, next_cursor: str | None = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(last_id) -> str:
+    return base64.urlsafe_b64encode(json.dumps({'id': str(last_id)}).encode('utf-8')).decode('utf-8').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> UUID:
+    """ Raises ValueError when the cursor is invalid. """
+    try:
+        padded_cursor = cursor + '=' * (-len(cursor) % 4)
+        return UUID(json.loads(base64.urlsafe_b64decode(padded_cursor))['id'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f'Invalid cursor "{cursor}".') from e
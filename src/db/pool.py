@@ -0,0 +1,73 @@
+import os
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolStatistics:
+    """ Connection checkout counters of a pool. """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.slow_checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def add_checkout(self, wait_seconds: float):
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        if wait_seconds * 1000 >= int(os.getenv('DB_POOL_SLOW_CHECKOUT_MS', 100)):
+            self.slow_checkouts += 1
+
+    def add_failure(self):
+        self.checkout_failures += 1
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """ Queue pool that measures how long a connection checkout waits, and counts failed checkouts. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def connect(self):
+        start_time = time.perf_counter()
+        try:
+            connection = super().connect()
+        except Exception:
+            self.statistics.add_failure()
+            raise
+        self.statistics.add_checkout(time.perf_counter() - start_time)
+        return connection
+
+    def recreate(self):
+        # Engine.dispose() replaces the pool. Keep counting from where we were.
+        pool = super().recreate()
+        pool.statistics = self.statistics
+        return pool
+
+
+def get_pool_status(pool) -> dict:
+    """ Live pool usage plus the checkout counters (when the pool is instrumented). """
+    status = {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'idle': pool.checkedin(),
+        'overflow': max(pool.overflow(), 0),
+    }
+    statistics: PoolStatistics = getattr(pool, 'statistics', None)
+    if statistics:
+        status.update({
+            'checkouts': statistics.checkouts,
+            'checkout_failures': statistics.checkout_failures,
+            'slow_checkouts': statistics.slow_checkouts,
+            'average_wait_ms': round(statistics.average_wait_seconds * 1000, 3),
+            'max_wait_ms': round(statistics.max_wait_seconds * 1000, 3),
+        })
+    return status
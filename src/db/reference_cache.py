@@ -0,0 +1,129 @@
+import os
+
+from sqlalchemy import event
+from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload, Session
+
+from src.db.db import get_session_maker
+from src.db.pagination import Page, encode_cursor, decode_cursor
+from src.utils.cache import TTLCache
+from src.utils.logging.log import logger
+
+"""
+Reference data cache. The reference tables are small and rarely change, so they are read completely and kept
+in memory for REFERENCE_CACHE_TTL_SECONDS. The cache of a table is invalidated when a transaction that changed it
+is committed. ORM changes are collected on flush, Core statements are registered by crud (invalidate_on_commit).
+The cached objects are detached and read-only: their relationships are not loaded (raiseload).
+The security tables (role, acl, scope) are not cached: a change must apply at once, in every process.
+"""
+
+REFERENCE_TABLES = ('fishspecies', 'fishingday')
+CHANGED_REFERENCE_TABLES = 'changed_reference_tables'
+
+
+class ReferenceCache:
+    def __init__(self):
+        self._cache = TTLCache(float(os.getenv('REFERENCE_CACHE_TTL_SECONDS', 300)))
+
+    @staticmethod
+    def is_reference(obj_def) -> bool:
+        return getattr(obj_def, '__tablename__', None) in REFERENCE_TABLES
+
+    async def get_all(self, obj_def) -> list:
+        """ All rows ordered by id. """
+        return (await self._get_entry(obj_def))[0]
+
+    async def get_one(self, obj_def, id):
+        return (await self._get_entry(obj_def))[1].get(id)
+
+    async def get_page(self, obj_def, skip: int = 0, limit: int = 10, cursor: str = None) -> Page:
+        """ Like crud.get_page, from memory. Raises ValueError when the cursor is invalid. """
+        rows = await self.get_all(obj_def)
+        if cursor:
+            last_id = decode_cursor(cursor)
+            rows = [row for row in rows if row.id > last_id][:limit]
+        else:
+            rows = rows[skip:skip + limit]
+        next_cursor = encode_cursor(rows[-1].id) if rows and len(rows) == limit else None
+        return Page(rows, next_cursor)
+
+    def invalidate(self, *obj_defs):
+        for obj_def in obj_defs:
+            if self.is_reference(obj_def):
+                self._cache.invalidate(obj_def.__tablename__)
+
+    def invalidate_tables(self, table_names):
+        for table_name in table_names:
+            self._cache.invalidate(table_name)
+
+    def clear(self):
+        self._cache.clear()
+
+    async def warm_up(self, *obj_defs):
+        for obj_def in obj_defs:
+            await self._get_entry(obj_def)
+
+    def get_statistics(self) -> dict:
+        return {
+            'hits': self._cache.hits,
+            'misses': self._cache.misses,
+            'tables': [
+                {'name': table_name,
+                 'cached': table_name in self._cache,
+                 'version': self._cache.get_version(table_name),
+                 'age_seconds': self._cache.get_age_seconds(table_name)}
+                for table_name in REFERENCE_TABLES]
+        }
+
+    async def _get_entry(self, obj_def) -> tuple:
+        """ (rows ordered by id, {id: row}) """
+        table_name = obj_def.__tablename__
+        entry = self._cache.get(table_name)
+        if entry is None:
+            version = self._cache.get_version(table_name)
+            entry = await self._load(obj_def)
+            if not self._cache.put(table_name, entry, version):
+                logger.info(f'{__name__}: {table_name} changed while it was loaded. It is not cached.')
+        return entry
+
+    @staticmethod
+    async def _load(obj_def) -> tuple:
+        # A session of its own, the objects are shared by all requests.
+        async with get_session_maker()() as session:
+            result = await session.execute(select(obj_def).options(raiseload('*')).order_by(obj_def.id))
+            rows = result.scalars().all()
+        return rows, {row.id: row for row in rows}
+
+
+reference_cache = ReferenceCache()
+
+
+def invalidate_on_commit(session, *obj_defs):
+    """ For changes the ORM does not see (Core statements): invalidate the reference tables on commit. """
+    table_names = {obj_def.__tablename__ for obj_def in obj_defs if ReferenceCache.is_reference(obj_def)}
+    if table_names:
+        session.info.setdefault(CHANGED_REFERENCE_TABLES, set()).update(table_names)
+
+
+def collect_changed_reference_tables(session, _):
+    """ Event listener: remember the reference tables that are changed in the transaction. """
+    table_names = {
+        obj.__tablename__ for obj in (*session.new, *session.dirty, *session.deleted)
+        if ReferenceCache.is_reference(type(obj))}
+    if table_names:
+        session.info.setdefault(CHANGED_REFERENCE_TABLES, set()).update(table_names)
+
+
+def invalidate_changed_reference_tables(session):
+    """ Event listener """
+    reference_cache.invalidate_tables(session.info.pop(CHANGED_REFERENCE_TABLES, ()))
+
+
+def discard_changed_reference_tables(session):
+    """ Event listener """
+    session.info.pop(CHANGED_REFERENCE_TABLES, None)
+
+
+event.listen(Session, 'after_flush', collect_changed_reference_tables)
+event.listen(Session, 'after_commit', invalidate_changed_reference_tables)
+event.listen(Session, 'after_rollback', discard_changed_reference_tables)
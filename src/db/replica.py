@@ -0,0 +1,107 @@
+import asyncio
+import os
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.db.db import get_async_engine, get_session_maker
+from src.utils.logging.log import logger
+
+"""
+Read replica routing. Read-only requests may use the database of DATABASE_REPLICA_URI, but only while the replica
+is healthy: reachable and with a replay lag below DB_REPLICA_MAX_LAG_SECONDS. Otherwise the primary is used.
+The health is checked at most once per DB_REPLICA_CHECK_SECONDS.
+A database that is not in recovery (e.g. the primary under a second URI) counts as a replica without lag.
+"""
+
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+class ReplicaHealth:
+    def __init__(self):
+        self.healthy = False
+        self.lag_seconds: float | None = None
+        self.checked_at: float | None = None
+
+
+# Per replica URI
+_health: dict[str, ReplicaHealth] = {}
+
+
+async def get_read_session() -> AsyncSession:
+    """ For read-only requests: a session on the read replica when it is healthy, else on the primary. """
+    async with (await get_read_session_maker())() as session:
+        yield session
+
+
+async def get_read_session_maker() -> sessionmaker:
+    """ The session factory of the read replica when it is healthy, else of the primary. """
+    replica_uri = get_replica_uri()
+    if replica_uri and await is_replica_healthy(replica_uri, get_async_engine(replica_uri)):
+        return get_session_maker(replica_uri)
+    return get_session_maker()
+
+
+def get_replica_uri() -> str | None:
+    return os.getenv('DATABASE_REPLICA_URI') or None
+
+
+def get_replica_health(uri: str) -> ReplicaHealth:
+    return _health.setdefault(uri, ReplicaHealth())
+
+
+async def is_replica_healthy(uri: str, engine: AsyncEngine) -> bool:
+    """ The cached health of the replica, checked again when it is older than DB_REPLICA_CHECK_SECONDS. """
+    health = get_replica_health(uri)
+    now = time.monotonic()
+    if health.checked_at is not None and now - health.checked_at < float(os.getenv('DB_REPLICA_CHECK_SECONDS', 5)):
+        return health.healthy
+    # Concurrent requests keep using the previous result meanwhile.
+    health.checked_at = now
+    try:
+        health.lag_seconds = await asyncio.wait_for(
+            _get_replica_lag(engine), timeout=float(os.getenv('DB_REPLICA_CHECK_TIMEOUT_SECONDS', 2)))
+    except Exception as e:
+        if health.healthy:
+            logger.warning(f'{__name__}: Replica is not available, reading from the primary. {e}')
+        health.healthy, health.lag_seconds = False, None
+        return False
+    healthy = health.lag_seconds is not None and health.lag_seconds <= float(
+        os.getenv('DB_REPLICA_MAX_LAG_SECONDS', 10))
+    if health.healthy and not healthy:
+        logger.warning(f'{__name__}: Replica lag is {health.lag_seconds} seconds, reading from the primary.')
+    health.healthy = healthy
+    return healthy
+
+
+async def _get_replica_lag(engine: AsyncEngine) -> float | None:
+    async with engine.connect() as conn:
+        lag = (await conn.execute(REPLICA_LAG_QUERY)).scalar()
+    return None if lag is None else float(lag)
+
+
+async def is_replicated(db: AsyncSession, read_db: AsyncSession, timeout_seconds: float = 5) -> bool:
+    """
+    Read your own writes: wait until the replica behind read_db has replayed everything committed via db.
+    Returns False on timeout, then the caller should read from db.
+    """
+    if read_db.bind is db.bind:
+        return True
+    lsn = (await db.execute(text('SELECT pg_current_wal_lsn()'))).scalar()
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        replayed = (await read_db.execute(
+            text('SELECT NOT pg_is_in_recovery() OR pg_last_wal_replay_lsn() >= CAST(:lsn AS pg_lsn)'),
+            {'lsn': lsn})).scalar()
+        if replayed:
+            return True
+        if time.monotonic() > deadline:
+            return False
+        await asyncio.sleep(0.1)
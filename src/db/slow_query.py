@@ -0,0 +1,87 @@
+import contextvars
+import os
+import random
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.utils.logging.log import logger
+
+"""
+Slow query log. Every statement that takes DB_SLOW_QUERY_MS or longer is logged as a warning, with its duration,
+row count and the route of the request that executed it. DB_SLOW_QUERY_SAMPLE_RATE (0-1) limits how many of them
+are logged; they are all counted. The parameters are not logged, they may contain personal data.
+"""
+
+MAX_STATEMENT_LENGTH = 2000
+QUERY_START_TIMES = 'query_start_times'
+
+# The route of the current request, set by the middleware.
+route_var = contextvars.ContextVar('route', default=None)
+
+
+class SlowQueryStatistics:
+    def __init__(self):
+        self.statements = 0
+        self.slow_statements = 0
+        self.logged_statements = 0
+        self.max_duration_ms = 0.0
+
+    def add(self, duration_ms: float) -> bool:
+        """ Count the statement. Returns True when it is slow and sampled, i.e. it should be logged. """
+        self.statements += 1
+        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+        if duration_ms < float(os.getenv('DB_SLOW_QUERY_MS', 200)):
+            return False
+        self.slow_statements += 1
+        if random.random() >= float(os.getenv('DB_SLOW_QUERY_SAMPLE_RATE', 1)):
+            return False
+        self.logged_statements += 1
+        return True
+
+
+slow_query_statistics = SlowQueryStatistics()
+
+
+def get_slow_query_status() -> dict:
+    return {
+        'statements': slow_query_statistics.statements,
+        'slow_statements': slow_query_statistics.slow_statements,
+        'logged_statements': slow_query_statistics.logged_statements,
+        'max_duration_ms': round(slow_query_statistics.max_duration_ms, 3),
+    }
+
+
+def start_timer(conn, _cursor, _statement, _parameters, _context, _executemany):
+    """ Event listener """
+    conn.info.setdefault(QUERY_START_TIMES, []).append(time.perf_counter())
+
+
+def log_slow_query(conn, cursor, statement, _parameters, _context, executemany):
+    """ Event listener """
+    start_times = conn.info.get(QUERY_START_TIMES)
+    if not start_times:
+        return
+    duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+    if slow_query_statistics.add(duration_ms):
+        statement = ' '.join(statement.split())
+        if len(statement) > MAX_STATEMENT_LENGTH:
+            statement = f'{statement[:MAX_STATEMENT_LENGTH]}...'
+        logger.warning(
+            f'{__name__}: Slow query {round(duration_ms, 1)} ms, rows={cursor.rowcount}, '
+            f'{"executemany, " if executemany else ""}route="{route_var.get() or "-"}": {statement}')
+
+
+def discard_timer(exception_context):
+    """ Event listener: the statement failed. """
+    connection = exception_context.connection
+    start_times = connection.info.get(QUERY_START_TIMES) if connection is not None else None
+    if start_times:
+        start_times.pop()
+
+
+# All engines, also the ones created later.
+event.listen(Engine, 'before_cursor_execute', start_timer)
+event.listen(Engine, 'after_cursor_execute', log_slow_query)
+event.listen(Engine, 'handle_error', discard_timer)
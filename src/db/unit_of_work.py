@@ -0,0 +1,40 @@
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.db import get_session_maker
+
+"""
+Unit of work (opt-in per route): the whole request is one transaction.
+Within a unit of work the crud functions flush instead of commit. The get_unit_of_work dependency commits once
+at the end of the request, or rolls everything back when the request fails.
+Work that may fail without failing the request goes into a savepoint().
+"""
+
+UNIT_OF_WORK = 'unit_of_work'
+
+
+async def get_unit_of_work() -> AsyncSession:
+    async with get_session_maker()() as session:
+        session.info[UNIT_OF_WORK] = True
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+# The same for a block within a request, e.g. a step that must be committed before the next one.
+unit_of_work = asynccontextmanager(get_unit_of_work)
+
+
+def is_unit_of_work(db: AsyncSession) -> bool:
+    return db.info.get(UNIT_OF_WORK, False)
+
+
+@asynccontextmanager
+async def savepoint(db: AsyncSession):
+    """ Partial work: on an exception only the work in the block is rolled back (and the exception is raised). """
+    async with db.begin_nested():
+        yield
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+from enum import Enum
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+from starlette import status
+from starlette.responses import StreamingResponse
+
+from src.constants import ID
+from src.db import crud
+from src.db.pagination import decode_cursor
+from src.db.replica import get_read_session_maker
+
+"""
+Streaming export of a whole table as NDJSON (one JSON object per line) or CSV.
+The rows are read with a server-side cursor and written per chunk, so the memory use does not depend on the size
+of the table. The export has a session of its own: the request session is closed before the response is streamed.
+"""
+
+
+class ExportFormat(str, Enum):
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+
+MEDIA_TYPES = {ExportFormat.ndjson: 'application/x-ndjson', ExportFormat.csv: 'text/csv'}
+
+
+async def get_export_response(
+        obj_def, read_model: type[BaseModel], export_format: ExportFormat, cursor: str | None, limit: int | None
+) -> StreamingResponse:
+    """ Stream the rows ordered by id, with the fields of the read model. Cursor and limit as in the list. """
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    columns = [obj_def.__table__.c[name] for name in (ID, *(name for name in read_model.model_fields if name != ID))]
+    session_maker = await get_read_session_maker()
+    return StreamingResponse(
+        _get_chunks(session_maker, obj_def, columns, export_format, cursor, limit),
+        media_type=MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{obj_def.__tablename__}.{export_format.value}"'})
+
+
+async def _get_chunks(session_maker, obj_def, columns, export_format: ExportFormat, cursor, limit):
+    if export_format == ExportFormat.csv:
+        yield _get_csv_chunk([[column.name for column in columns]])
+    async with session_maker() as session:
+        async for rows in crud.stream(session, obj_def, columns, cursor=cursor, limit=limit):
+            if export_format == ExportFormat.csv:
+                yield _get_csv_chunk([row.values() for row in rows])
+            else:
+                yield ''.join(f'{json.dumps(dict(row), default=str)}\n' for row in rows)
+
+
+def _get_csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
@@ -1,9 +1,79 @@
 from fastapi import HTTPException
+from sqlalchemy.orm.exc import StaleDataError
 from starlette import status
 from starlette.responses import Response
 
+from src.constants import X_NEXT_CURSOR, ETAG
+from src.db import crud
+from src.db.pagination import Page
+from src.db.reference_cache import reference_cache
+
 
 def get_delete_response(success: bool, table_name):
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f'{table_name} record was not found')
-    return Response(status_code=status.HTTP_200_OK, content=f'The {table_name} record has been deleted.')
\ No newline at end of file
+    return Response(status_code=status.HTTP_200_OK, content=f'The {table_name} record has been deleted.')
+
+
+async def get_page_response(db, response: Response, obj_def, skip: int, limit: int, cursor: str | None) -> list:
+    """ Return a page of records. The cursor of the next page is returned in the X-Next-Cursor header. """
+    try:
+        page = await crud.get_page(db, obj_def, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    return _get_page_items(response, page)
+
+
+async def get_cached_page_response(response: Response, obj_def, skip: int, limit: int, cursor: str | None) -> list:
+    """ Like get_page_response, for reference data from the reference cache. """
+    try:
+        page = await reference_cache.get_page(obj_def, skip=skip, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    return _get_page_items(response, page)
+
+
+def _get_page_items(response: Response, page: Page) -> list:
+    if page.next_cursor:
+        response.headers[X_NEXT_CURSOR] = page.next_cursor
+    return page.items
+
+
+async def get_update_response(db, response: Response, obj_def, obj_upd, if_match: str | None, options=()):
+    """
+    Update the record in one conditional statement (optimistic concurrency, no read or lock first).
+    The precondition is the If-Match header (the ETag of a read), else the update_count in the body, if any.
+    412 when the record has been changed since, 404 when it does not exist. The new ETag is returned.
+    With options (a loading profile) the relations of the updated record are loaded for the response.
+    """
+    expected_update_count = _get_update_count(if_match) if if_match else getattr(obj_upd, 'update_count', None)
+    try:
+        obj = await crud.upd(db, obj_def, obj_upd, expected_update_count=expected_update_count)
+    except StaleDataError as e:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(e))
+    if obj is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f'{obj_def.__tablename__} record was not found')
+    if options:
+        obj = await crud.get_one(db, obj_def, obj.id, options=options)
+    set_etag(response, obj)
+    return obj
+
+
+def set_etag(response: Response, obj):
+    """ The ETag of a record is its update_count. Returns the record. """
+    if obj is not None:
+        response.headers[ETAG] = f'"{obj.update_count or 0}"'
+    return obj
+
+
+def _get_update_count(if_match: str) -> int | None:
+    """ From the If-Match header. "*" matches any version. """
+    if if_match.strip() == '*':
+        return None
+    try:
+        return int(if_match.strip().removeprefix('W/').strip('"'))
+    except ValueError:
+        # Not an ETag of ours, so it can not match.
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED, detail=f'If-Match "{if_match}" does not match.')
@@ -1,6 +1,6 @@
 import contextvars
 
-from sqlalchemy import Column, DateTime, String, func, Integer
+from sqlalchemy import Column, DateTime, String, func, Integer, DDL
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.orm import DeclarativeBase
@@ -11,6 +11,8 @@ from src.domains.login.token.models import SessionData
 # Create a context variable for the session data
 session_data_var = contextvars.ContextVar('session_data')
 
+AUDIT_COLUMNS = ('created_at', 'created_by', 'updated_at', 'updated_by', 'update_count')
+
 
 class AuditMixin(object):
     created_at = Column(DateTime(timezone=True), default=func.timezone('UTC', func.now()))
@@ -25,19 +27,38 @@ class Base(AsyncAttrs, AuditMixin, DeclarativeBase):
     pass
 
 
+def get_session_email() -> str:
+    """ Get the current user from the context variable """
+    token_data: SessionData = session_data_var.get(None)
+    return token_data.email if token_data else UNKNOWN
+
+
 def set_created_by(mapper, connection, target):
     """ Event listener """
-    # Get the current user from the context variable
-    token_data: SessionData = session_data_var.get(None)
-    target.created_by = token_data.email if token_data else UNKNOWN
+    target.created_by = get_session_email()
 
 
 def set_updated_by(mapper, connection, target):
     """ Event listener """
-    token_data: SessionData = session_data_var.get(None)
-    target.updated_by = token_data.email if token_data else UNKNOWN
+    target.updated_by = get_session_email()
 
 
 # Attach event listeners to SQLAlchemy models
 event.listen(AuditMixin, 'before_insert', set_created_by, propagate=True)
 event.listen(AuditMixin, 'before_update', set_updated_by, propagate=True)
+
+
+# Database side default of the primary keys, for rows that are not inserted via the models (see get_uuid7).
+# Equals the function created in alembic migration "uuid7".
+UUID_GENERATE_V7 = DDL("""
+CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid())
+                    placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$ LANGUAGE sql VOLATILE
+""")
+event.listen(Base.metadata, 'before_create', UUID_GENERATE_V7)
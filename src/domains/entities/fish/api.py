@@ -1,12 +1,15 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response, StreamingResponse
 
 from src.db import crud
 from src.db.db import get_db_session
-from src.domains.base.functions import get_delete_response
+from src.db.replica import get_read_session
+from src.domains.base.export import ExportFormat, get_export_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
 from src.domains.entities.fish.models import Fish, FishReadModel, FishModel
 from src.domains.login.token.functions import is_authorized
 
@@ -32,32 +35,48 @@ async def create_fish(
 
 @fish.get('/', response_model=list[FishReadModel])
 async def read_fishes(
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
+        db: Annotated[AsyncSession, Depends(get_read_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['fish_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
+):
+    return await get_page_response(db, response, Fish, skip=skip, limit=limit, cursor=cursor)
+
+
+@fish.get('/export', response_class=StreamingResponse)
+async def export_fishes(
+        _: Annotated[bool, Security(is_authorized, scopes=['fish_readall'])],
+        format: ExportFormat = ExportFormat.ndjson,
+        cursor: str | None = None,
+        limit: int | None = None
 ):
-    return await crud.get_all(db, Fish, skip=skip, limit=limit)
+    """ All records as NDJSON or CSV, streamed. """
+    return await get_export_response(Fish, FishReadModel, format, cursor=cursor, limit=limit)
 
 
 @fish.get('/{id}', response_model=FishReadModel)
 async def read_fish(
         id: UUID,
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
+        db: Annotated[AsyncSession, Depends(get_read_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['fish_read'])]
 ):
-    return await crud.get_one(db, Fish, id)
+    return set_etag(response, await crud.get_one(db, Fish, id))
 
 
 @fish.put('/{id}', response_model=FishReadModel)
 async def update_fish(
         id: UUID,
         fish_update: FishReadModel,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['fish_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['fish_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     fish_update.id = id
-    return await crud.upd(db, Fish, fish_update)
+    return await get_update_response(db, response, Fish, fish_update, if_match)
 
 
 @fish.delete('/{id}')
@@ -1,19 +1,23 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field
-from sqlalchemy import (Column, String, func, Integer, ForeignKey)
+from pydantic import BaseModel, Field
+from sqlalchemy import (Column, String, func, Integer, ForeignKey, Index)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.db import Base
 from src.domains.entities.enums import FishStatus
+from src.utils.functions import get_uuid7
 
 
 # SqlAlchemy model
 class Fish(Base):
     __tablename__ = 'fish'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
-    fishspecies_id: Mapped[UUID] = mapped_column(ForeignKey('fishspecies.id'), nullable=False)
+    # The composite index also serves the queries on fishingwater_id only.
+    __table_args__ = (Index('ix_fish_fishingwater_id_fishspecies_id', 'fishingwater_id', 'fishspecies_id'),)
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
+    fishspecies_id: Mapped[UUID] = mapped_column(ForeignKey('fishspecies.id'), nullable=False, index=True)
     status = Column(String, nullable=False, default=FishStatus.Sleeping)
     age = Column(Integer, nullable=True, default=1)
     length_cm = Column(Integer, nullable=True)
@@ -21,27 +25,28 @@ class Fish(Base):
     caught_count = Column(Integer, nullable=True, default=0)
 
     # Relations
-    fisherman_id: Mapped[UUID] = mapped_column(ForeignKey('fisherman.id'), nullable=True)
+    fisherman_id: Mapped[UUID] = mapped_column(ForeignKey('fisherman.id'), nullable=True, index=True)
     fishingwater_id: Mapped[UUID] = mapped_column(ForeignKey('fishingwater.id'), nullable=True)
-    fisherman = relationship('Fisherman', back_populates='fishes')
-    fishingwater = relationship('FishingWater', back_populates='fishes')
+    fisherman = relationship('Fisherman', back_populates='fishes', lazy='raise_on_sql')
+    fishingwater = relationship('FishingWater', back_populates='fishes', lazy='raise_on_sql')
 
 
 # Pydantic models
 class FishModel(BaseModel):
-    fishspecies_id: UUID4
+    fishspecies_id: UUID
     status: FishStatus
     age: int = Field(ge=1, le=50)
     length_cm: int = Field(ge=1, le=1000)
     weight_g: int = Field(ge=1, le=100000)
     caught_count: Optional[int] = Field(le=100)
     # Relations
-    fisherman_id: Optional[UUID4]
-    fishingwater_id: Optional[UUID4]
+    fisherman_id: Optional[UUID]
+    fishingwater_id: Optional[UUID]
 
 
 class FishReadModel(FishModel):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
     # Relations
     # fishingwater: Optional['FishingWaterBase'] = []
     # fisherman: Optional['FishermanBase'] = []
@@ -1,12 +1,14 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
 from src.db import crud
 from src.db.db import get_db_session
-from src.domains.base.functions import get_delete_response
+from src.db.reference_cache import reference_cache
+from src.domains.base.functions import get_delete_response, get_cached_page_response, get_update_response, set_etag
 from src.domains.entities.fish_species.models import FishSpeciesReadModel, FishSpeciesModel, FishSpecies
 from src.domains.login.token.functions import is_authorized
 
@@ -35,32 +37,35 @@ async def create_fish_species(
 
 @fish_species.get('/', response_model=list[FishSpeciesReadModel])
 async def read_fish_specieses(
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
         _: Annotated[bool, Security(is_authorized, scopes=['fishspecies_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
 ):
-    return await crud.get_all(db, FishSpecies, skip=skip, limit=limit)
+    return await get_cached_page_response(response, FishSpecies, skip=skip, limit=limit, cursor=cursor)
 
 
 @fish_species.get('/{id}', response_model=FishSpeciesReadModel)
 async def read_fish_species(
         id: UUID,
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
         _: Annotated[bool, Security(is_authorized, scopes=['fishspecies_read'])]
 ):
-    return await crud.get_one(db, FishSpecies, id)
+    return set_etag(response, await reference_cache.get_one(FishSpecies, id))
 
 
 @fish_species.put('/{id}', response_model=FishSpeciesReadModel)
 async def update_fish_species(
         id: UUID,
         fish_species_update: FishSpeciesReadModel,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['fishspecies_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['fishspecies_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     fish_species_update.id = id
-    return await crud.upd(db, FishSpecies, fish_species_update)
+    return await get_update_response(db, response, FishSpecies, fish_species_update, if_match)
 
 
 @fish_species.delete('/{id}')
@@ -1,12 +1,13 @@
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field, model_validator
+from pydantic import BaseModel, Field, model_validator
 from sqlalchemy import (Column, String, func, Integer, ARRAY)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.db.db import Base
 from src.domains.entities.enums import ActiveAt, CarpSubspecies
+from src.utils.functions import get_uuid7
 
 HOURS_OF_ACTIVITY = {
     ActiveAt.Day: [7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17],
@@ -18,7 +19,8 @@ HOURS_OF_ACTIVITY = {
 # SqlAlchemy model
 class FishSpecies(Base):
     __tablename__ = 'fishspecies'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     species_name = Column(String, nullable=False, index=True)
     subspecies_name = Column(String, nullable=True)
     active_at = Column(String, nullable=False, default=ActiveAt.Day)
@@ -53,4 +55,5 @@ class FishSpeciesModel(BaseModel):
 
 
 class FishSpeciesReadModel(FishSpeciesModel):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
@@ -1,13 +1,17 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response, StreamingResponse
 
 from src.db import crud
 from src.db.db import get_db_session
-from src.domains.base.functions import get_delete_response
-from src.domains.entities.fisherman.models import Fisherman, FishermanRead, FishermanBase
+from src.db.replica import get_read_session
+from src.domains.base.export import ExportFormat, get_export_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
+from src.domains.entities.fisherman.models import (
+    Fisherman, FishermanRead, FishermanBase, FishermanSummary, get_fisherman_detail_profile)
 from src.domains.login.token.functions import is_authorized
 
 fisherman = APIRouter()
@@ -30,34 +34,51 @@ async def create_fisherman(
     return await crud.add(db, new_fisherman)
 
 
-@fisherman.get('/', response_model=list[FishermanRead])
+@fisherman.get('/', response_model=list[FishermanSummary])
 async def read_fishermen(
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
+        db: Annotated[AsyncSession, Depends(get_read_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['fisherman_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
+):
+    return await get_page_response(db, response, Fisherman, skip=skip, limit=limit, cursor=cursor)
+
+
+@fisherman.get('/export', response_class=StreamingResponse)
+async def export_fishermen(
+        _: Annotated[bool, Security(is_authorized, scopes=['fisherman_readall'])],
+        format: ExportFormat = ExportFormat.ndjson,
+        cursor: str | None = None,
+        limit: int | None = None
 ):
-    return await crud.get_all(db, Fisherman, skip=skip, limit=limit)
+    """ All records as NDJSON or CSV, streamed. """
+    return await get_export_response(Fisherman, FishermanSummary, format, cursor=cursor, limit=limit)
 
 
 @fisherman.get('/{id}', response_model=FishermanRead)
 async def read_fisherman(
         id: UUID,
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
+        db: Annotated[AsyncSession, Depends(get_read_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['fisherman_read'])]
 ):
-    return await crud.get_one(db, Fisherman, id)
+    return set_etag(response, await crud.get_one(db, Fisherman, id, options=get_fisherman_detail_profile()))
 
 
 @fisherman.put('/{id}', response_model=FishermanRead)
 async def update_fisherman(
         id: UUID,
         fisherman_update: FishermanRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['fisherman_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['fisherman_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     fisherman_update.id = id
-    return await crud.upd(db, Fisherman, fisherman_update)
+    return await get_update_response(
+        db, response, Fisherman, fisherman_update, if_match, options=get_fisherman_detail_profile())
 
 
 @fisherman.delete('/{id}')
@@ -1,27 +1,28 @@
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field
+from pydantic import BaseModel, Field
 from sqlalchemy import (Column, String, func, Table, ForeignKey, Integer)
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
 
 from src.db.db import Base
 from src.domains.entities.enums import SpeciesEnum, Frequency, FishermanStatus
 from src.domains.entities.fish.models import FishModel
 from src.domains.entities.fishingday.models import FishingDayBase, fisherman_fishingday
-from src.utils.functions import get_random_name
+from src.utils.functions import get_uuid7, get_random_name
 from src.utils.security.input_validation import REGEX_ALPHANUM_PLUS
 
 # SqlAlchemy model
 fishingwater_fisherman = Table(
     'fishingwater_fisherman', Base.metadata,
     Column('fishingwater_id', ForeignKey('fishingwater.id', ondelete='CASCADE'), primary_key=True),
-    Column('fisherman_id', ForeignKey('fisherman.id', ondelete='CASCADE'), primary_key=True))
+    Column('fisherman_id', ForeignKey('fisherman.id', ondelete='CASCADE'), primary_key=True, index=True))
 
 
 class Fisherman(Base):
     __tablename__ = 'fisherman'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     forename = Column(String, nullable=False, default=get_random_name(8))
     surname = Column(String, nullable=False, default=get_random_name(20))
     fish_species = Column(String, nullable=False, default=SpeciesEnum.Roach)
@@ -31,11 +32,20 @@ class Fisherman(Base):
     # Relations
     fishingwaters = relationship(
         'FishingWater', secondary=fishingwater_fisherman, back_populates='fishermen',
-        passive_deletes=True, lazy='selectin')
+        passive_deletes=True, lazy='raise_on_sql')
     fishes = relationship(
-        'Fish', back_populates='fisherman', cascade='all, delete-orphan', lazy='selectin')
+        'Fish', back_populates='fisherman', cascade='all, delete-orphan', lazy='raise_on_sql')
     fishing_days = relationship(
-        'FishingDay', secondary=fisherman_fishingday, back_populates='fisherman', lazy='selectin')
+        'FishingDay', secondary=fisherman_fishingday, back_populates='fisherman', lazy='raise_on_sql')
+
+
+# Loading profiles. Built on use, the options need all mappers to be configured.
+def get_fisherman_detail_profile() -> tuple:
+    return selectinload(Fisherman.fishes), selectinload(Fisherman.fishing_days)
+
+
+def get_fisherman_simulation_profile() -> tuple:
+    return selectinload(Fisherman.fishingwaters), selectinload(Fisherman.fishing_days)
 
 
 # Pydantic models
@@ -48,8 +58,13 @@ class FishermanBase(BaseModel):
     status: FishermanStatus
 
 
-class FishermanRead(FishermanBase):
-    id: UUID4
+class FishermanSummary(FishermanBase):
+    """ Without relations, e.g. for lists. """
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
+
+
+class FishermanRead(FishermanSummary):
     # Relations
     # fishingwaters: Optional[List['FishingWaterBase']] = []
     fishes: Optional[List[FishModel]] = []
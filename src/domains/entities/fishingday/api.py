@@ -1,12 +1,14 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
 from src.db import crud
 from src.db.db import get_db_session
-from src.domains.base.functions import get_delete_response
+from src.db.reference_cache import reference_cache
+from src.domains.base.functions import get_delete_response, get_cached_page_response, get_update_response, set_etag
 from src.domains.entities.fishingday.models import FishingDay, FishingDayRead, FishingDayBase
 from src.domains.login.token.functions import is_authorized
 
@@ -27,32 +29,35 @@ async def create_fishingday(
 
 @fishingday.get('/', response_model=list[FishingDayRead])
 async def read_fishingdays(
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
         _: Annotated[bool, Security(is_authorized, scopes=['fishingday_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
 ):
-    return await crud.get_all(db, FishingDay, skip=skip, limit=limit)
+    return await get_cached_page_response(response, FishingDay, skip=skip, limit=limit, cursor=cursor)
 
 
 @fishingday.get('/{id}', response_model=FishingDayRead)
 async def read_fishingday(
         id: UUID,
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
         _: Annotated[bool, Security(is_authorized, scopes=['fishingday_read'])]
 ):
-    return await crud.get_one(db, FishingDay, id)
+    return set_etag(response, await reference_cache.get_one(FishingDay, id))
 
 
 @fishingday.put('/{id}', response_model=FishingDayRead)
 async def update_fishingday(
         id: UUID,
         fishingday_update: FishingDayRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['fishingday_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['fishingday_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     fishingday_update.id = id
-    return await crud.upd(db, FishingDay, fishingday_update)
+    return await get_update_response(db, response, FishingDay, fishingday_update, if_match)
 
 
 @fishingday.delete('/{id}')
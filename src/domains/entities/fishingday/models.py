@@ -1,28 +1,31 @@
+from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel
 from sqlalchemy import (Column, String, func, Table, ForeignKey)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.db import Base
 from src.domains.entities.enums import Day
+from src.utils.functions import get_uuid7
 
 
 # SqlAlchemy model
 fisherman_fishingday = Table(
     'fisherman_fishingday', Base.metadata,
     Column('fisherman_id', ForeignKey('fisherman.id', ondelete='CASCADE'), primary_key=True),
-    Column('fishingday_id', ForeignKey('fishingday.id', ondelete='CASCADE'), primary_key=True))
+    Column('fishingday_id', ForeignKey('fishingday.id', ondelete='CASCADE'), primary_key=True, index=True))
 
 
 class FishingDay(Base):
     __tablename__ = 'fishingday'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     name = Column(String, nullable=False, index=True)
     # Relations
     fisherman = relationship(
         'Fisherman', secondary=fisherman_fishingday,  back_populates='fishing_days', passive_deletes=True,
-        lazy='selectin')
+        lazy='raise_on_sql')
 
 
 # Pydantic models
@@ -31,4 +34,5 @@ class FishingDayBase(BaseModel):
 
 
 class FishingDayRead(FishingDayBase):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
@@ -1,13 +1,17 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response, StreamingResponse
 
 from src.db import crud
 from src.db.db import get_db_session
-from src.domains.base.functions import get_delete_response
-from src.domains.entities.fishingwater.models import FishingWater, FishingWaterRead, FishingWaterBase
+from src.db.replica import get_read_session
+from src.domains.base.export import ExportFormat, get_export_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
+from src.domains.entities.fishingwater.models import (
+    FishingWater, FishingWaterRead, FishingWaterBase, FishingWaterSummary, get_fishingwater_detail_profile)
 from src.domains.login.token.functions import is_authorized
 
 fishingwater = APIRouter()
@@ -29,34 +33,51 @@ async def create_fishingwater(
     return await crud.add(db, new_fishing)
 
 
-@fishingwater.get('/', response_model=list[FishingWaterRead])
+@fishingwater.get('/', response_model=list[FishingWaterSummary])
 async def read_fishingwaters(
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
+        db: Annotated[AsyncSession, Depends(get_read_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['fishing_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
+):
+    return await get_page_response(db, response, FishingWater, skip=skip, limit=limit, cursor=cursor)
+
+
+@fishingwater.get('/export', response_class=StreamingResponse)
+async def export_fishingwaters(
+        _: Annotated[bool, Security(is_authorized, scopes=['fishing_readall'])],
+        format: ExportFormat = ExportFormat.ndjson,
+        cursor: str | None = None,
+        limit: int | None = None
 ):
-    return await crud.get_all(db, FishingWater, skip=skip, limit=limit)
+    """ All records as NDJSON or CSV, streamed. """
+    return await get_export_response(FishingWater, FishingWaterSummary, format, cursor=cursor, limit=limit)
 
 
 @fishingwater.get('/{id}', response_model=FishingWaterRead)
 async def read_fishingwater(
         id: UUID,
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        response: Response,
+        db: Annotated[AsyncSession, Depends(get_read_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['fishing_read'])]
 ):
-    return await crud.get_one(db, FishingWater, id)
+    return set_etag(response, await crud.get_one(db, FishingWater, id, options=get_fishingwater_detail_profile()))
 
 
 @fishingwater.put('/{id}', response_model=FishingWaterRead)
 async def update_fishingwater(
         id: UUID,
         fishing_update: FishingWaterRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['fishing_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['fishing_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     fishing_update.id = id
-    return await crud.upd(db, FishingWater, fishing_update)
+    return await get_update_response(
+        db, response, FishingWater, fishing_update, if_match, options=get_fishingwater_detail_profile())
 
 
 @fishingwater.delete('/{id}')
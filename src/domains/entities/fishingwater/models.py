@@ -1,14 +1,15 @@
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field, model_validator
+from pydantic import BaseModel, Field, model_validator
 from sqlalchemy import (Column, String, func, Float, Integer)
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
 
 from src.db.db import Base
 from src.domains.entities.enums import WaterType
 from src.domains.entities.fish.models import FishModel
 from src.domains.entities.fisherman.models import FishermanBase, fishingwater_fisherman
+from src.utils.functions import get_uuid7
 from src.utils.security.input_validation import REGEX_ALPHANUM_PLUS
 
 FLOATING_WATER = (WaterType.Canal, WaterType.River, WaterType.Brook, WaterType.Sea)
@@ -17,7 +18,8 @@ FLOATING_WATER = (WaterType.Canal, WaterType.River, WaterType.Brook, WaterType.S
 # SqlAlchemy model
 class FishingWater(Base):
     __tablename__ = 'fishingwater'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     water_type = Column(String, nullable=False, index=True)
     location = Column(String, nullable=False)
     fishes_count = Column(Integer, nullable=True)  # null for floating water or sea
@@ -25,9 +27,9 @@ class FishingWater(Base):
     m3 = Column(Integer, nullable=True)  # null for floating water or sea
     # Relations
     fishermen = relationship(
-        'Fisherman', secondary=fishingwater_fisherman, back_populates='fishingwaters', lazy='selectin')
+        'Fisherman', secondary=fishingwater_fisherman, back_populates='fishingwaters', lazy='raise_on_sql')
     fishes = relationship(
-        'Fish', back_populates='fishingwater', cascade='all, delete-orphan', lazy='selectin')
+        'Fish', back_populates='fishingwater', cascade='all, delete-orphan', lazy='raise_on_sql')
 
     def add_fishes_to_still_water(self, number: int = 0):
         if self.water_type in FLOATING_WATER or self.m3 == 0:
@@ -41,6 +43,11 @@ class FishingWater(Base):
         self.density = self.fishes_count / self.m3
 
 
+# Loading profiles. Built on use, the options need all mappers to be configured.
+def get_fishingwater_detail_profile() -> tuple:
+    return selectinload(FishingWater.fishes), selectinload(FishingWater.fishermen)
+
+
 # Pydantic models
 class FishingWaterBase(BaseModel):
     location: str = Field(min_length=1, max_length=50, pattern=REGEX_ALPHANUM_PLUS)
@@ -66,8 +73,13 @@ class FishingWaterBase(BaseModel):
         return self
 
 
-class FishingWaterRead(FishingWaterBase):
-    id: UUID4
+class FishingWaterSummary(FishingWaterBase):
+    """ Without relations, e.g. for lists. """
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
+
+
+class FishingWaterRead(FishingWaterSummary):
     # Relations
     fishes: Optional[List[FishModel]] = []
     fishermen: Optional[List[FishermanBase]] = []
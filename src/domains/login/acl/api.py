@@ -1,13 +1,14 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
 from src.db import crud
 from src.db.db import get_db_session
 from src.domains.login.acl.models import ACLRead, ACL, ACLBase
-from src.domains.base.functions import get_delete_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
 from src.domains.login.token.functions import is_authorized
 from src.utils.logging.log import logger
 
@@ -27,32 +28,37 @@ async def create_acl(
 
 @acl.get('/', response_model=list[ACLRead])
 async def read_acls(
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['acls_readall'])],
         skip: int = 0,
         limit: int = 10,
+        cursor: str | None = None
 ):
-    return await crud.get_all(db, ACL, skip=skip, limit=limit)
+    return await get_page_response(db, response, ACL, skip=skip, limit=limit, cursor=cursor)
 
 
 @acl.get('/{id}', response_model=ACLRead)
 async def read_acl(
         id: UUID,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['acl_read'])]
 ):
-    return await crud.get_one(db, ACL, id)
+    return set_etag(response, await crud.get_one(db, ACL, id))
 
 
 @acl.put('/{id}', response_model=ACLRead)
 async def update_acl(
         id: UUID,
         acl_update: ACLRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['acl_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['acl_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     acl_update.id = id
-    return await crud.upd(db, ACL, acl_update)
+    return await get_update_response(db, response, ACL, acl_update, if_match)
 
 
 @acl.delete('/{id}')
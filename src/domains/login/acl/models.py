@@ -1,29 +1,31 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field
+from pydantic import BaseModel, Field
 from sqlalchemy import (Column, String, func, Table, ForeignKey)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.domains.base.models import Base
 from src.domains.login.scope.models import acl_scope
+from src.utils.functions import get_uuid7
 from src.utils.security.input_validation import REGEX_ALPHANUM_PLUS
 
 # SqlAlchemy model
 role_acl = Table('role_acl', Base.metadata,
                  Column('role_id', ForeignKey('role.id', ondelete='CASCADE'), primary_key=True),
-                 Column('acl_id', ForeignKey('acl.id', ondelete='CASCADE'), primary_key=True))
+                 Column('acl_id', ForeignKey('acl.id', ondelete='CASCADE'), primary_key=True, index=True))
 
 
 # noinspection PyUnresolvedReferences
 class ACL(Base):
     __tablename__ = 'acl'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     name = Column(String, nullable=False)
     # Relations
     roles: Mapped[List['Role']] = relationship(
-        secondary=role_acl, back_populates='acls', passive_deletes=True, lazy='selectin')
+        secondary=role_acl, back_populates='acls', passive_deletes=True, lazy='raise_on_sql')
     scopes: Mapped[List['Scope']] = relationship(
-        secondary=acl_scope, back_populates='acls', passive_deletes=True, lazy='selectin')
+        secondary=acl_scope, back_populates='acls', passive_deletes=True, lazy='raise_on_sql')
 
 
 # Pydantic models
@@ -32,4 +34,5 @@ class ACLBase(BaseModel):
 
 
 class ACLRead(ACLBase):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
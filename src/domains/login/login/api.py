@@ -8,7 +8,7 @@ from starlette.responses import Response
 
 from src.constants import EMAIL, TOKEN, AUTHORIZATION
 from src.db import crud
-from src.db.db import get_db_session
+from src.db.unit_of_work import get_unit_of_work
 from src.domains.base.models import session_data_var
 from src.domains.login.login.models import Login
 from src.domains.login.login.models import LoginBase
@@ -16,7 +16,8 @@ from src.domains.login.token.functions import is_authorized, session_login
 from src.domains.login.user.functions import validate_user, set_user_status, send_otp
 from src.domains.login.user.models import User, UserStatus
 from src.utils.functions import get_otp_expiration
-from src.utils.security.crypto import get_salted_hash, verify_hash, get_random_password
+from src.utils.security.crypto import get_salted_hash_async, verify_hash_async, get_random_password, needs_rehash
+from src.utils.security.link_token import verify_link_token
 
 login_register = APIRouter()
 login_acknowledge = APIRouter()
@@ -27,7 +28,7 @@ login_logout = APIRouter()
 @login_register.post('/')
 async def register(
         payload: LoginBase,
-        db: AsyncSession = Depends(get_db_session)
+        db: AsyncSession = Depends(get_unit_of_work)
 ):
     """
     Create the user record.
@@ -45,7 +46,7 @@ async def register(
     # Insert the user with a short expiration
     user = User(
         email=payload.email,
-        password=get_salted_hash(otp),
+        password=await get_salted_hash_async(otp),
         password_expiration=get_otp_expiration(),
         status=UserStatus.Inactive
     )
@@ -56,7 +57,7 @@ async def register(
 @login_acknowledge.get('/')
 async def acknowledge(
         request: Request,
-        db: AsyncSession = Depends(get_db_session)
+        db: AsyncSession = Depends(get_unit_of_work)
 ):
     """
     Validate email link to get a handshake which expires after a short time.
@@ -66,12 +67,12 @@ async def acknowledge(
             or EMAIL not in request.query_params
             or TOKEN not in request.query_params):
         raise HTTPException(status.HTTP_403_FORBIDDEN)
-    # Check Email and hashed email from the link.
+    # Check Email and the signed token from the link.
     username = request.query_params[EMAIL]
     user = await crud.get_one_where(db, User, att_name=User.email, att_value=username)
     if not user:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
-    if not verify_hash(username, request.query_params[TOKEN]):
+    if not verify_link_token(username, request.query_params[TOKEN]):
         await set_user_status(db, user, 'Invalid login attempt.')
     # Acknowledge user.
     await set_user_status(db, user, target_status=UserStatus.Acknowledged)
@@ -80,7 +81,7 @@ async def acknowledge(
 @login_login_with_credentials.post('/')
 async def login_with_credentials(
         credentials: Login,
-        db: AsyncSession = Depends(get_db_session)
+        db: AsyncSession = Depends(get_unit_of_work)
 ):
     """
     Log in with email and password (not OTP).
@@ -94,8 +95,11 @@ async def login_with_credentials(
     # - Validate credentials.
     if not credentials.password.get_secret_value() == credentials.password_repeat.get_secret_value():
         await set_user_status(db, user, 'Repeated password must be the same.')
-    if not verify_hash(credentials.password.get_secret_value(), user.password):
+    if not await verify_hash_async(credentials.password.get_secret_value(), user.password):
         await set_user_status(db, user, 'Invalid login attempt.')
+    # - Hashed with a lower cost than BCRYPT_ROUNDS: rehash. It is saved with the login.
+    if needs_rehash(user.password):
+        user.password = await get_salted_hash_async(credentials.password.get_secret_value())
 
     # Log in - session and db
     response = await session_login(db, user, set_status=True)
@@ -106,7 +110,7 @@ async def login_with_credentials(
 async def logout(
         response: Response,
         login_base: LoginBase,
-        db: Annotated[AsyncSession, Depends(get_db_session)],
+        db: Annotated[AsyncSession, Depends(get_unit_of_work)],
         _: Annotated[bool, Security(is_authorized, scopes=['login_delete'])]
 ):
     """ Logout with email """
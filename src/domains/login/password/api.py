@@ -9,7 +9,7 @@ from src.domains.login.password.models import ChangePassword
 from src.domains.login.password.models import Password, PasswordEncrypted, ChangePasswordBase
 from src.domains.login.user.functions import validate_user, set_user_status
 from src.domains.login.user.models import User, UserStatus
-from src.utils.security.crypto import get_salted_hash, verify_hash
+from src.utils.security.crypto import get_salted_hash_async, verify_hash_async
 
 password_hash = APIRouter()
 password_verify = APIRouter()
@@ -29,14 +29,14 @@ async def change_password(
     user = await crud.get_one_where(db, User, att_name=User.email, att_value=credentials.email)
     user = await validate_user(db, user, minimum_status=UserStatus.Acknowledged)
     # a. Verify old password
-    if not verify_hash(credentials.password.get_secret_value(), user.password):
+    if not await verify_hash_async(credentials.password.get_secret_value(), user.password):
         await set_user_status(db, user, 'Invalid login attempt.')
     # b. Validate new password (various kinds of restrictions)
-    error_message = validate_new_password(credentials=credentials, old_password_hashed=user.password)
+    error_message = await validate_new_password(credentials=credentials, old_password_hashed=user.password)
     if error_message:
         await set_user_status(db, user, error_message)
     # Set new password.
-    user.password = get_salted_hash(credentials.new_password.get_secret_value())
+    user.password = await get_salted_hash_async(credentials.new_password.get_secret_value())
     # Activate user.
     await set_user_status(db, user, target_status=UserStatus.Active, renew_expiration=True)
 
@@ -57,24 +57,24 @@ async def forgot_password(
 
 
 @password_hash.post('/', response_model=PasswordEncrypted)
-def encrypt(
+async def encrypt(
         payload: Password
 ):
     """ Hashing. Used for test purposes only. """
     if not payload:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
-    encrypted_text = get_salted_hash(payload.plain_text.get_secret_value())
+    encrypted_text = await get_salted_hash_async(payload.plain_text.get_secret_value())
     return PasswordEncrypted(encrypted_text=encrypted_text)
 
 
 @password_verify.post('/')
-def validate_hash(
+async def validate_hash(
         payload: Password
 ):
     """ Hash validation. Used for test purposes only. """
     if not payload:
         raise HTTPException(status.HTTP_403_FORBIDDEN)
-    success = verify_hash(
+    success = await verify_hash_async(
         payload.plain_text.get_secret_value(),
         payload.encrypted_text
     )
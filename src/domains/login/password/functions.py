@@ -1,8 +1,8 @@
 from src.domains.login.password.models import ChangePassword
-from src.utils.security.crypto import verify_hash, is_valid_password
+from src.utils.security.crypto import verify_hash_async, is_valid_password
 
 
-def validate_new_password(credentials: ChangePassword, old_password_hashed=None) -> str | None:
+async def validate_new_password(credentials: ChangePassword, old_password_hashed=None) -> str | None:
     """ Change password extra validation """
     detail = None
     new_password_plain_text = credentials.new_password.get_secret_value()
@@ -14,7 +14,7 @@ def validate_new_password(credentials: ChangePassword, old_password_hashed=None)
     if not detail and not (new_password_plain_text == new_password_repeated_plain_text):
         detail = f'New password must be the same as the repeated one.'
     # c. New password must differ from old one.
-    if not detail and old_password_hashed and verify_hash(new_password_plain_text, old_password_hashed):
+    if not detail and old_password_hashed and await verify_hash_async(new_password_plain_text, old_password_hashed):
         detail = f'New password must differ from the old one.'
     # d. New password must be valid.
     if not detail and not is_valid_password(new_password_plain_text):
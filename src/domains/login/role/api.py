@@ -1,10 +1,11 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
-from src.domains.base.functions import get_delete_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
 from src.db import crud
 from src.db.db import get_db_session
 from src.domains.login.role.models import RoleRead, Role, RoleBase
@@ -25,31 +26,36 @@ async def create_role(
 
 @role.get('/', response_model=list[RoleRead])
 async def read_roles(
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['role_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
 ):
-    return await crud.get_all(db, Role, skip=skip, limit=limit)
+    return await get_page_response(db, response, Role, skip=skip, limit=limit, cursor=cursor)
 
 
 @role.get('/{id}', response_model=RoleRead)
 async def read_role(
         id: UUID,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['role_read'])],
 ):
-    return await crud.get_one(db, Role, id)
+    return set_etag(response, await crud.get_one(db, Role, id))
 
 
 @role.put('/{id}', response_model=RoleRead)
 async def update_role(
         id: UUID, role_update: RoleRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['role_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['role_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     role_update.id = id
-    return await crud.upd(db, Role, role_update)
+    return await get_update_response(db, response, Role, role_update, if_match)
 
 
 @role.delete('/{id}')
@@ -1,13 +1,14 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field
+from pydantic import BaseModel, Field
 from sqlalchemy import (Column, String, func)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domains.login.acl.models import role_acl
 from src.domains.base.models import Base
 from src.domains.login.user.models import user_role
+from src.utils.functions import get_uuid7
 from src.utils.security.input_validation import REGEX_ALPHANUM_PLUS
 
 
@@ -15,12 +16,13 @@ from src.utils.security.input_validation import REGEX_ALPHANUM_PLUS
 # noinspection PyUnresolvedReferences
 class Role(Base):
     __tablename__ = 'role'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     name = Column(String, nullable=False, index=True, unique=True)
     # Relations
     users: Mapped[List['User']] = relationship(
-        secondary=user_role, back_populates='roles', passive_deletes=True, lazy='selectin')
-    acls: Mapped[List['ACL']] = relationship(secondary=role_acl, back_populates='roles', lazy='selectin')
+        secondary=user_role, back_populates='roles', passive_deletes=True, lazy='raise_on_sql')
+    acls: Mapped[List['ACL']] = relationship(secondary=role_acl, back_populates='roles', lazy='raise_on_sql')
 
 
 # Pydantic models
@@ -29,4 +31,5 @@ class RoleBase(BaseModel):
 
 
 class RoleRead(RoleBase):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
@@ -1,12 +1,14 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
-from src.domains.base.functions import get_delete_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
 from src.db import crud
 from src.db.db import get_db_session
+from src.domains.login.scope.functions import get_scope_name
 from src.domains.login.scope.models import ScopeRead, Scope, Access, ScopeBase
 from src.domains.login.token.functions import is_authorized
 
@@ -25,31 +27,38 @@ async def create_scope(
 
 @scope.get('/', response_model=list[ScopeRead])
 async def read_scopes(
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['scope_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
 ):
-    return await crud.get_all(db, Scope, skip=skip, limit=limit)
+    return await get_page_response(db, response, Scope, skip=skip, limit=limit, cursor=cursor)
 
 
 @scope.get('/{id}', response_model=ScopeRead)
 async def read_scope(
         id: UUID,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['scope_read'])]
 ):
-    return await crud.get_one(db, Scope, id)
+    return set_etag(response, await crud.get_one(db, Scope, id))
 
 
 @scope.put('/{id}', response_model=ScopeRead)
 async def update_scope(
         id: UUID, scope_update: ScopeRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['scope_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['scope_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     scope_update.id = id
-    return await crud.upd(db, Scope, scope_update)
+    # The update is a single statement, so the before_update event does not derive the name.
+    scope_update.scope_name = get_scope_name(scope_update.entity, Access.get_access_value(scope_update.access))
+    return await get_update_response(db, response, Scope, scope_update, if_match)
 
 
 @scope.delete('/{id}')
@@ -0,0 +1,59 @@
+import asyncio
+import sys
+
+from sqlalchemy import select, text, func
+
+from src.db.db import get_session_maker
+from src.domains.login.acl.models import role_acl
+from src.domains.login.scope.models import Scope, acl_scope, user_effective_scope
+from src.domains.login.user.models import user_role
+
+"""
+Rebuild and consistency check of the user_effective_scope table (maintained by triggers, see scope models).
+Usage: python -m src.domains.login.scope.effective_scope [check|rebuild]
+"""
+
+
+def get_derived_scopes_statement(*columns):
+    """ The distinct columns of the scopes that are linked to users via user_role, role_acl and acl_scope. """
+    return (
+        select(*columns).distinct()
+        .select_from(Scope)
+        .join(acl_scope, acl_scope.c.scope_id == Scope.id)
+        .join(role_acl, role_acl.c.acl_id == acl_scope.c.acl_id)
+        .join(user_role, user_role.c.role_id == role_acl.c.role_id))
+
+
+async def rebuild_user_effective_scope(db) -> int:
+    """ Refresh the table for all users. Returns the number of rows. """
+    await db.execute(text('SELECT refresh_user_effective_scope(NULL)'))
+    await db.commit()
+    return (await db.execute(select(func.count()).select_from(user_effective_scope))).scalar_one()
+
+
+async def check_user_effective_scope(db) -> dict:
+    """ The number of rows that are missing in the table or should not be there. """
+    derived = get_derived_scopes_statement(user_role.c.user_id, Scope.entity, Scope.access)
+    stored = select(user_effective_scope.c.user_id, user_effective_scope.c.entity, user_effective_scope.c.access)
+    return {
+        'missing': await _count(db, derived.except_(stored)),
+        'extra': await _count(db, stored.except_(derived)),
+    }
+
+
+async def _count(db, statement) -> int:
+    return (await db.execute(select(func.count()).select_from(statement.subquery()))).scalar_one()
+
+
+async def main(command: str = 'check') -> int:
+    async with get_session_maker()() as db:
+        if command == 'rebuild':
+            print(f'user_effective_scope rebuilt: {await rebuild_user_effective_scope(db)} rows.')
+            return 0
+        differences = await check_user_effective_scope(db)
+        print(f'user_effective_scope: {differences}')
+        return 1 if any(differences.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main(*sys.argv[1:2])))
@@ -1,13 +1,14 @@
 from enum import Enum
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field, ConfigDict
-from sqlalchemy import (Column, String, func, Table, ForeignKey, event)
+from pydantic import BaseModel, Field, ConfigDict
+from sqlalchemy import (Column, String, func, Table, ForeignKey, event, DDL)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domains.base.models import Base
 from src.domains.login.scope.functions import get_scope_name
+from src.utils.functions import get_uuid7
 from src.utils.security.input_validation import REGEX_ALPHANUM_ASTERISK
 
 
@@ -53,19 +54,20 @@ class Access(str, Enum):
 # SqlAlchemy model
 acl_scope = Table('acl_scope', Base.metadata,
                   Column('acl_id', ForeignKey('acl.id', ondelete='CASCADE'), primary_key=True),
-                  Column('scope_id', ForeignKey('scope.id', ondelete='CASCADE'), primary_key=True))
+                  Column('scope_id', ForeignKey('scope.id', ondelete='CASCADE'), primary_key=True, index=True))
 
 
 # noinspection PyUnresolvedReferences
 class Scope(Base):
     __tablename__ = 'scope'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     entity = Column(String, nullable=False)
     access = Column(String, nullable=False)
     scope_name = Column(String, nullable=False, unique=True)
     # Relations
     acls: Mapped[List['ACL']] = relationship(
-        secondary=acl_scope, back_populates='scopes', passive_deletes=True, lazy='selectin')
+        secondary=acl_scope, back_populates='scopes', passive_deletes=True, lazy='raise_on_sql')
 
 
 # Function to automatically update full_name before insert and update
@@ -78,6 +80,101 @@ event.listen(Scope, 'before_insert', update_scope_name)
 event.listen(Scope, 'before_update', update_scope_name)
 
 
+# The distinct scopes of a user via user_role, role_acl and acl_scope (denormalized, see USER_EFFECTIVE_SCOPE_DDL).
+user_effective_scope = Table('user_effective_scope', Base.metadata,
+                             Column('user_id', ForeignKey('user.id', ondelete='CASCADE'), primary_key=True),
+                             Column('entity', String, primary_key=True),
+                             Column('access', String, primary_key=True))
+
+# Maintained by statement triggers, so Core statements, cascaded deletes and every worker are covered.
+# Inserts and deletes of the links and updates of a scope refresh the affected users, a truncate refreshes all users.
+# The only definition of the functions and triggers: alembic migration "user_effective_scope" executes it too.
+# A refresh locks the affected users, so concurrent link changes of a user can not interleave its DELETE and INSERT.
+# FOR NO KEY UPDATE does not conflict with the FOR KEY SHARE lock of the foreign key checks on "user".
+USER_EFFECTIVE_SCOPE_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION refresh_user_effective_scope(user_ids uuid[]) RETURNS void AS $$
+        SELECT id FROM "user" WHERE user_ids IS NULL OR id = ANY(user_ids) ORDER BY id FOR NO KEY UPDATE;
+        DELETE FROM user_effective_scope WHERE user_ids IS NULL OR user_id = ANY(user_ids);
+        INSERT INTO user_effective_scope (user_id, entity, access)
+        SELECT DISTINCT user_role.user_id, scope.entity, scope.access
+        FROM user_role
+        JOIN role_acl ON role_acl.role_id = user_role.role_id
+        JOIN acl_scope ON acl_scope.acl_id = role_acl.acl_id
+        JOIN scope ON scope.id = acl_scope.scope_id
+        WHERE user_ids IS NULL OR user_role.user_id = ANY(user_ids)
+        ON CONFLICT DO NOTHING;
+    $$ LANGUAGE sql VOLATILE
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_effective_scope_user_role() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_user_effective_scope(ARRAY(SELECT DISTINCT user_id FROM changed_rows));
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_effective_scope_role_acl() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_user_effective_scope(ARRAY(
+            SELECT DISTINCT user_role.user_id
+            FROM changed_rows
+            JOIN user_role ON user_role.role_id = changed_rows.role_id));
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_effective_scope_acl_scope() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_user_effective_scope(ARRAY(
+            SELECT DISTINCT user_role.user_id
+            FROM changed_rows
+            JOIN role_acl ON role_acl.acl_id = changed_rows.acl_id
+            JOIN user_role ON user_role.role_id = role_acl.role_id));
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_effective_scope_scope() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_user_effective_scope(ARRAY(
+            SELECT DISTINCT user_role.user_id
+            FROM changed_rows
+            JOIN old_rows ON old_rows.id = changed_rows.id
+            JOIN acl_scope ON acl_scope.scope_id = changed_rows.id
+            JOIN role_acl ON role_acl.acl_id = acl_scope.acl_id
+            JOIN user_role ON user_role.role_id = role_acl.role_id
+            WHERE (changed_rows.entity, changed_rows.access) IS DISTINCT FROM (old_rows.entity, old_rows.access)));
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION user_effective_scope_rebuild() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_user_effective_scope(NULL);
+        RETURN NULL;
+    END $$ LANGUAGE plpgsql
+    """,
+    *(f"""
+    CREATE OR REPLACE TRIGGER user_effective_scope_{event_name.lower()} AFTER {event_name} ON {table_name}
+    REFERENCING {transition} TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_scope_{table_name}()
+    """ for table_name in ('user_role', 'role_acl', 'acl_scope')
+      for event_name, transition in (('INSERT', 'NEW'), ('DELETE', 'OLD'))),
+    """
+    CREATE OR REPLACE TRIGGER user_effective_scope_update AFTER UPDATE ON scope
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_scope_scope()
+    """,
+    *(f"""
+    CREATE OR REPLACE TRIGGER user_effective_scope_truncate AFTER TRUNCATE ON {table_name}
+    FOR EACH STATEMENT EXECUTE FUNCTION user_effective_scope_rebuild()
+    """ for table_name in ('user_role', 'role_acl', 'acl_scope')),
+)
+for statement in USER_EFFECTIVE_SCOPE_DDL:
+    event.listen(Base.metadata, 'after_create', DDL(statement))
+
+
 # Pydantic models
 class ScopeBase(BaseModel):
     # Enables compatibility with SQLAlchemy models
@@ -89,4 +186,5 @@ class ScopeBase(BaseModel):
 
 
 class ScopeRead(ScopeBase):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
@@ -1,9 +1,26 @@
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.constants import ALL
-from src.db import crud
 from src.domains.login.role.models import Role
-from src.domains.login.user.models import User
+from src.domains.login.scope.effective_scope import get_derived_scopes_statement
+from src.domains.login.scope.models import Scope, user_effective_scope
+from src.domains.login.user.models import User, user_role
+
+
+def get_user_scopes_statement(email, role_names: list = None):
+    """ The distinct (entity, access) pairs of the user. Roles can be used as a filter. """
+    if not role_names:
+        # One indexed read of the denormalized scopes.
+        return (
+            select(user_effective_scope.c.entity, user_effective_scope.c.access)
+            .join(User, User.id == user_effective_scope.c.user_id)
+            .where(User.email == email))
+    return (
+        get_derived_scopes_statement(Scope.entity, Scope.access)
+        .join(User, User.id == user_role.c.user_id)
+        .join(Role, Role.id == user_role.c.role_id)
+        .where(User.email == email, Role.name.in_(role_names)))
 
 
 class ScopeManager:
@@ -17,8 +34,15 @@ class ScopeManager:
         self._user_scopes = {}
 
     async def get_user_scopes(self, roles: [Role] = None, compressed=True) -> list:
-        """ Return a User scope list. Roles can be used as a filter. """
-        user_scopes = await self._get_scopes_dict(compressed, roles)
+        """
+        Return a User scope list. Roles can be used as a filter.
+        Not cached in the process: without filter it is one indexed read of user_effective_scope, which is maintained
+        by triggers, so a role change in another worker is seen by the next login.
+        """
+        return self._get_scope_names(await self._get_scopes_dict(compressed, roles))
+
+    @staticmethod
+    def _get_scope_names(user_scopes: dict) -> list:
         # Set the unique set of scopes
         return list({
             f'{entity}_{access}'
@@ -30,11 +54,9 @@ class ScopeManager:
         """ Create a dict of User scopes. Roles can be used as a filter. Default all roles. """
         role_names = [role.name for role in roles] if roles else []
         # Populate
-        user = await crud.get_one_where(self._db, User, User.email, self._email)
-        [self._add_access(scope.entity, scope.access)
-         for role in user.roles if not role_names or role.name in role_names
-         for acl in role.acls
-         for scope in acl.scopes]
+        result = await self._db.execute(get_user_scopes_statement(self._email, role_names))
+        for entity, access in result:
+            self._add_access(entity, access)
 
         # Compress "*"-containing entities and accesses
         if compressed:
@@ -63,11 +85,12 @@ class ScopeManager:
         all_entity_accesses = list(self._user_scopes.get(ALL, {}))
 
         # Apply all generic entity ("*") accesses (except the generic access ("*")) to all other entities.
-        for entity, accesses in self._user_scopes.items():
+        for entity in list(self._user_scopes):
             if entity != ALL:
                 for access in all_entity_accesses:
                     if access in self._user_scopes[entity]:
                         self._user_scopes[entity].remove(access)
                         if not self._user_scopes[entity]:
                             del self._user_scopes[entity]
+                            break
 
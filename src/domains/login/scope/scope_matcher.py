@@ -0,0 +1,62 @@
+from functools import lru_cache
+
+from src.constants import ALL
+
+"""
+Scope matching for the authorization of every request. A scope is "<entity>_<access>", e.g. "fish_read".
+"*" is a wildcard for the entity and/or the access, e.g. "*_read", "fish_*" or "*_*".
+The user scopes of a token are compiled once into a ScopeMatcher (the session data is cached per token),
+and the endpoint scopes are parsed once (at startup, see warm_up_endpoint_scopes).
+"""
+
+
+@lru_cache(maxsize=1024)
+def parse_scope(scope: str) -> tuple[str, str] | None:
+    """ (entity, access), None if the scope is invalid. """
+    if not scope:
+        return None
+    entity, _, access = scope.partition('_')
+    return (entity, access) if entity and access else None
+
+
+class ScopeMatcher:
+    """ The user scopes, compiled to the accesses per entity. """
+
+    def __init__(self, user_scopes: list[str]):
+        self._accesses: dict[str, set] = {}
+        for scope in user_scopes or ():
+            parsed = parse_scope(scope)
+            if parsed:
+                self._accesses.setdefault(parsed[0], set()).add(parsed[1])
+        # Endpoint entity "*" matches the accesses of any entity.
+        self._any_entity_accesses = set().union(*self._accesses.values())
+        self._all_entities_accesses = self._accesses.get(ALL, set())
+
+    def is_allowed(self, endpoint_scope: str) -> bool:
+        """ The user has the endpoint scope. """
+        parsed = parse_scope(endpoint_scope)
+        if not parsed:
+            return False
+        entity, access = parsed
+        accesses = self._any_entity_accesses if entity == ALL else self._accesses.get(entity, ())
+        return (ALL in self._all_entities_accesses or access in self._all_entities_accesses
+                or ALL in accesses or access in accesses)
+
+
+def warm_up_endpoint_scopes(routes) -> int:
+    """ Parse the Security scopes of all the routes. Returns the number of endpoint scopes. """
+    scopes = set()
+    for route in routes:
+        dependant = getattr(route, 'dependant', None)
+        if dependant is not None:
+            scopes.update(_get_security_scopes(dependant))
+    for scope in scopes:
+        parse_scope(scope)
+    return len(scopes)
+
+
+def _get_security_scopes(dependant) -> set:
+    scopes = set(dependant.security_scopes or ())
+    for sub_dependant in dependant.dependencies:
+        scopes.update(_get_security_scopes(sub_dependant))
+    return scopes
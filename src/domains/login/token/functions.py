@@ -1,5 +1,7 @@
 import datetime
+import hashlib
 import os
+import time
 from typing import Annotated
 
 import jwt
@@ -11,7 +13,7 @@ from starlette import status
 from starlette.requests import Request
 from starlette.responses import Response
 
-from src.constants import ALL, AUTHORIZATION, X_REFRESH_TOKEN, MSG_TOKEN_EXPIRED
+from src.constants import AUTHORIZATION, X_REFRESH_TOKEN, MSG_TOKEN_EXPIRED
 from src.db import crud
 from src.db.db import get_db_session
 from src.domains.base.models import session_data_var
@@ -21,9 +23,14 @@ from src.domains.login.token.constants import JWT_SECRET_KEY, JWT_ALGORITHM, BEA
 from src.domains.login.token.models import SessionData, Authentication
 from src.domains.login.user.functions import set_user_status
 from src.domains.login.user.models import User, UserStatus
+from src.domains.login.user.status_cache import user_status_cache
+from src.utils.cache import LRUCache
 
 security = HTTPBearer()
 
+# Verified tokens {sha256 of the token: SessionData}, until the token expires, at most JWT_CACHE_TTL_SECONDS.
+token_cache = LRUCache(int(os.getenv('JWT_CACHE_SIZE', 10000)))
+
 
 async def session_login(db, user: User, set_status=False) -> Response:
     """ Login into the session during user login or refresh token renewal. """
@@ -78,14 +85,21 @@ def _get_expiration_time(expiration_time_name):
 
 
 def set_session_from_header_token(
+        request: Request,
         credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
 ) -> SessionData:
-    session_data: SessionData = decode_jwt(credentials.credentials)
+    # The middleware (auto_token_refresh) has decoded the same authorization header already.
+    session_data: SessionData = getattr(request.state, 'session_data', None) or decode_jwt(credentials.credentials)
     session_data_var.set(session_data)
     return session_data
 
 
 def decode_jwt(token):
+    """ The signature is verified once per token: the result is cached until the token expires (see token_cache). """
+    key = hashlib.sha256(token.encode()).digest()
+    session_data = token_cache.get(key)
+    if session_data is not None:
+        return session_data
     try:
         payload = jwt.decode(
             token,
@@ -95,7 +109,10 @@ def decode_jwt(token):
             options={'verify_signature': True,
                      'verify_aud': False,
                      'verify_iss': False})
-        return SessionData(scopes=payload.get('scopes', []), email=payload.get('sub'))
+        session_data = SessionData(scopes=payload.get('scopes', []), email=payload.get('sub'))
+        expires_at = time.time() + float(os.getenv('JWT_CACHE_TTL_SECONDS', 300))
+        token_cache.put(key, session_data, expires_at=min(payload.get('exp', expires_at), expires_at))
+        return session_data
     except ExpiredSignatureError:
         _raise(detail=MSG_TOKEN_EXPIRED)
     except InvalidTokenError:
@@ -114,43 +131,18 @@ async def is_authorized(
         _raise(detail='Not authorized: No email')
 
     # Check permissions
-    # - User must exist
-    if not await crud.get_one_where(db, User, User.email, token_data.email):
+    # - User must exist (status projection, cached)
+    if await user_status_cache.get_status(db, token_data.email) is None:
         _raise(detail='Not authorized: User does not exist')
 
     # - All endpoint security scopes must be present in the token scopes (user)
-    if not security_scopes or not all(_is_valid_scope(scope, token_data.scopes) for scope in security_scopes.scopes):
+    if not security_scopes or not all(token_data.scope_matcher.is_allowed(scope) for scope in security_scopes.scopes):
         _raise(
             security_scopes,
             detail=f'Not authorized: security_scopes "{security_scopes}" <> user_scopes "{token_data.scopes}"')
     return True
 
 
-def _is_valid_scope(endpoint_scope, user_scopes) -> bool:
-    """ Compare endpoint scope with user_scopes. """
-    # Validation
-    if not endpoint_scope or not user_scopes:
-        return False
-    ep_entity, ep_access = endpoint_scope.split('_', maxsplit=1)
-    if not ep_entity or not ep_access:
-        return False
-    # Evaluate user_scopes
-    for scope in user_scopes:
-        # Validation
-        entity, access = scope.split('_', maxsplit=1)
-        if not entity or not access:
-            continue
-        if entity == ALL:  # E.g. "*_*" or "*_read"
-            if access in (ALL, ep_access):
-                return True
-        else:  # E.g. "fish_*" or "fish_read"
-            if entity == ep_entity or ep_entity == ALL:
-                if access in (ALL, ep_access):
-                    return True
-    # No match
-    return False
-
-
 def remove_authorization_header(request: Request):
     request_headers = dict(request.scope['headers'])
     request.scope['headers'] = [(k, v) for k, v in request_headers.items() if k != b'authorization']
@@ -1,7 +1,8 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, PrivateAttr
 
+from src.domains.login.scope.scope_matcher import ScopeMatcher
 from src.domains.login.token.constants import BEARER
 
 
@@ -19,3 +20,11 @@ class Authorization(Authentication):
 class SessionData(BaseModel):
     email: EmailStr | None = None
     scopes: list[str] = []
+    _scope_matcher: ScopeMatcher | None = PrivateAttr(default=None)
+
+    @property
+    def scope_matcher(self) -> ScopeMatcher:
+        """ The scopes compiled once. """
+        if self._scope_matcher is None:
+            self._scope_matcher = ScopeMatcher(self.scopes)
+        return self._scope_matcher
@@ -1,12 +1,15 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Security, Header
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
-from src.domains.base.functions import get_delete_response
+from src.domains.base.functions import get_delete_response, get_page_response, get_update_response, set_etag
 from src.domains.login.token.functions import is_authorized
 from src.domains.login.user.models import User, UserRead, UserBase
+from src.domains.login.user.status_cache import invalidate_user_status_on_commit
 from src.db import crud
 from src.db.db import get_db_session
 
@@ -25,31 +28,40 @@ async def create_user(
 
 @user.get('/', response_model=list[UserRead])
 async def read_users(
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['user_readall'])],
         skip: int = 0,
-        limit: int = 10
+        limit: int = 10,
+        cursor: str | None = None
 ):
-    return await crud.get_all(db, User, skip=skip, limit=limit)
+    return await get_page_response(db, response, User, skip=skip, limit=limit, cursor=cursor)
 
 
 @user.get('/{id}', response_model=UserRead)
 async def read_user(
         id: UUID,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
         _: Annotated[bool, Security(is_authorized, scopes=['user_read'])]
 ):
-    return await crud.get_one(db, User, id)
+    return set_etag(response, await crud.get_one(db, User, id))
 
 
 @user.put('/{id}', response_model=UserRead)
 async def update_user(
         id: UUID, user_update: UserRead,
+        response: Response,
         db: Annotated[AsyncSession, Depends(get_db_session)],
-        _: Annotated[bool, Security(is_authorized, scopes=['user_update'])]
+        _: Annotated[bool, Security(is_authorized, scopes=['user_update'])],
+        if_match: Annotated[str | None, Header()] = None
 ):
     user_update.id = id
-    return await crud.upd(db, User, user_update)
+    # The status or the email may change: invalidate the current and the new email.
+    current_email = (await db.execute(select(User.email).where(User.id == id))).scalar_one_or_none()
+    for email in {current_email, user_update.email} - {None}:
+        invalidate_user_status_on_commit(db, email)
+    return await get_update_response(db, response, User, user_update, if_match)
 
 
 @user.delete('/{id}')
@@ -5,10 +5,14 @@ from fastapi import HTTPException
 from starlette import status
 
 from src.db import crud
+from src.db.db import get_session_maker
+from src.db.unit_of_work import is_unit_of_work
 from src.domains.login.user.models import User, UserRead, UserStatus
+from src.domains.login.user.status_cache import invalidate_user_status_on_commit
 from src.utils.functions import find_filename_path, is_debug_mode, get_otp_expiration, get_password_expiration
 from src.utils.mail.mail import send_mail
-from src.utils.security.crypto import get_salted_hash, get_random_password
+from src.utils.security.crypto import get_salted_hash_async, get_random_password
+from src.utils.security.link_token import get_link_token
 
 
 def send_otp(email, otp):
@@ -20,7 +24,7 @@ def send_otp(email, otp):
     # Populate substitution variables like OTP and the link to receive_otp endpoint.
     substitutions = {
                 '*APP_NAME*': os.getenv('APP_NAME'),
-                '*OTP_URL*': f'{os.getenv('OTP_URL')}?email={email}&token={get_salted_hash(email)}',
+                '*OTP_URL*': f'{os.getenv('OTP_URL')}?email={email}&token={get_link_token(email)}',
                 '*OTP*': otp
             }
     # Send email
@@ -93,7 +97,7 @@ async def set_user_status(
     # c. Handle error
     if error_message:
         if update_fail_count:
-            await update_user_status(db, user, target_status, renew_expiration)
+            await persist_failed_login(db, user, target_status, renew_expiration)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=error_message)
 
     # Still blocked: error
@@ -105,12 +109,29 @@ async def set_user_status(
     return await update_user_status(db, user, target_status, renew_expiration)
 
 
+async def persist_failed_login(db, user, target_status, renew_expiration) -> User:
+    """
+    The fail count (and a block) must persist, although the request fails.
+    A unit of work is rolled back on the failure: that is done now, so its locks (e.g. on the user, updated
+    by validate_user) are released. The other work of the request is not committed. The user keeps its
+    changes and is written in a transaction of its own.
+    """
+    if not is_unit_of_work(db):
+        return await update_user_status(db, user, target_status, renew_expiration)
+    db.expunge(user)
+    await db.rollback()
+    async with get_session_maker()() as own_db:
+        own_db.add(user)
+        return await update_user_status(own_db, user, target_status, renew_expiration)
+
+
 async def update_user_status(db, user, target_status, renew_expiration):
-    user = set_user_status_related_attributes(user, target_status, renew_expiration=renew_expiration)
+    user = await set_user_status_related_attributes(user, target_status, renew_expiration=renew_expiration)
+    invalidate_user_status_on_commit(db, user.email)
     return await crud.upd(db, User, user)
 
 
-def set_user_status_related_attributes(user: User, target_status=None, renew_expiration=False) -> User:
+async def set_user_status_related_attributes(user: User, target_status=None, renew_expiration=False) -> User:
     if not target_status or (user.status == target_status and not renew_expiration):
         return user  # Nothing to do
 
@@ -118,7 +139,7 @@ def set_user_status_related_attributes(user: User, target_status=None, renew_exp
         user = _reset_user_attributes(user)
         # Create the one time password (not hashed, 10 long)
         otp = get_random_password()
-        user.password = get_salted_hash(otp)
+        user.password = await get_salted_hash_async(otp)
         user.password_expiration = get_otp_expiration()  # Short ttl
         # Mail the OTP to the specified address.
         send_otp(user.email, otp)
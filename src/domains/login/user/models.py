@@ -2,11 +2,12 @@ from datetime import datetime
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel, UUID4, Field, EmailStr, SecretStr, conint
+from pydantic import BaseModel, Field, EmailStr, SecretStr, conint
 from sqlalchemy import (Column, String, func, DateTime, Integer, ForeignKey, Table)
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
 
 from src.domains.base.models import Base
+from src.utils.functions import get_uuid7
 
 
 class UserStatus:
@@ -24,13 +25,14 @@ user_role = Table('user_role', Base.metadata,
                   Column('user_id',
                          ForeignKey('user.id', ondelete='CASCADE'), primary_key=True),
                   Column('role_id',
-                         ForeignKey('role.id', ondelete='CASCADE'), primary_key=True))
+                         ForeignKey('role.id', ondelete='CASCADE'), primary_key=True, index=True))
 
 
 # noinspection PyUnresolvedReferences
 class User(Base):
     __tablename__ = 'user'
-    id: Mapped[UUID] = mapped_column(nullable=False, primary_key=True, server_default=func.gen_random_uuid())
+    id: Mapped[UUID] = mapped_column(
+        nullable=False, primary_key=True, default=get_uuid7, server_default=func.uuid_generate_v7())
     email = Column(String, nullable=False, index=True, unique=True)
     password = Column(String, nullable=True)
     password_expiration = Column(DateTime(timezone=True), nullable=True)
@@ -39,7 +41,12 @@ class User(Base):
     blocked_until = Column(DateTime(timezone=True), nullable=True)
     status = Column(Integer, default=UserStatus.Inactive)
     # Relations
-    roles: Mapped[List['Role']] = relationship(secondary=user_role, back_populates='users', lazy='selectin')
+    roles: Mapped[List['Role']] = relationship(secondary=user_role, back_populates='users', lazy='raise_on_sql')
+
+
+# Loading profile. Built on use, the options need all mappers to be configured.
+def get_user_roles_profile() -> tuple:
+    return selectinload(User.roles),
 
 
 # Pydantic models
@@ -57,4 +64,5 @@ class UserUpdate(UserBase):
 
 
 class UserRead(UserUpdate):
-    id: UUID4
+    id: UUID
+    update_count: Optional[int] = None  # Version: the precondition of an update
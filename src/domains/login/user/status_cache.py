@@ -0,0 +1,80 @@
+import os
+
+from sqlalchemy import event, select, inspect
+from sqlalchemy.orm import Session
+
+from src.domains.login.user.models import User
+from src.utils.cache import TTLCache
+
+"""
+User status cache for the authorization of every request: the status of a user is read with one tiny query
+(no user row, no relations) and kept for USER_STATUS_CACHE_TTL_SECONDS.
+An entry is invalidated when a transaction that deleted the user or changed its status (e.g. logout) is committed.
+"""
+
+CHANGED_USER_EMAILS = 'changed_user_emails'
+ALL_USERS = None
+
+
+class UserStatusCache:
+    def __init__(self):
+        self._cache = TTLCache(float(os.getenv('USER_STATUS_CACHE_TTL_SECONDS', 10)))
+
+    async def get_status(self, db, email) -> int | None:
+        """ The status of the user, None if the user does not exist. """
+        version = self._cache.get_version(email)
+        user_status = self._cache.get(email)
+        if user_status is None:
+            user_status = (await db.execute(select(User.status).where(User.email == email))).scalar_one_or_none()
+            # Not existing users are not cached.
+            if user_status is not None:
+                self._cache.put(email, user_status, version)
+        return user_status
+
+    def invalidate(self, emails):
+        if ALL_USERS in emails:
+            self._cache.clear()
+            return
+        for email in emails:
+            self._cache.invalidate(email)
+
+    def clear(self):
+        self._cache.clear()
+
+    def get_statistics(self) -> dict:
+        return {'users': len(self._cache), 'hits': self._cache.hits, 'misses': self._cache.misses}
+
+
+user_status_cache = UserStatusCache()
+
+
+def invalidate_user_status_on_commit(session, email=ALL_USERS):
+    """ For changes the ORM does not see (Core statements, e.g. crud.upd). Without email: all users. """
+    session.info.setdefault(CHANGED_USER_EMAILS, set()).add(email)
+
+
+def collect_changed_users(session, _):
+    """ Event listener: remember the users that are deleted or have another status in the transaction. """
+    emails = {user.email for user in session.deleted if isinstance(user, User)}
+    emails.update(
+        user.email for user in session.dirty
+        if isinstance(user, User) and inspect(user).attrs.status.history.has_changes())
+    if emails:
+        session.info.setdefault(CHANGED_USER_EMAILS, set()).update(emails)
+
+
+def invalidate_changed_users(session):
+    """ Event listener """
+    emails = session.info.pop(CHANGED_USER_EMAILS, ())
+    if emails:
+        user_status_cache.invalidate(emails)
+
+
+def discard_changed_users(session):
+    """ Event listener """
+    session.info.pop(CHANGED_USER_EMAILS, None)
+
+
+event.listen(Session, 'after_flush', collect_changed_users)
+event.listen(Session, 'after_commit', invalidate_changed_users)
+event.listen(Session, 'after_rollback', discard_changed_users)
@@ -1,4 +1,5 @@
 import os
+from contextlib import asynccontextmanager
 from typing import cast
 
 import uvicorn as uvicorn
@@ -7,9 +8,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from src.db.db import dispose_engines
+from src.db.reference_cache import reference_cache
+from src.domains.entities.fish_species.models import FishSpecies
+from src.domains.entities.fishingday.models import FishingDay
+from src.domains.login.scope.scope_matcher import warm_up_endpoint_scopes
 from src.domains.entities.fishingday.api import fishingday
 from src.domains.entities.fish_species.api import fish_species
+from src.services.health.api import health, metrics
 from src.services.simulation.api import simulation
+from src.services.stats.api import stats
 from src.services.test.fake_user_login.api import fake_user_login
 from src.domains.entities.fish.api import fish
 from src.domains.entities.fisherman.api import fisherman
@@ -23,19 +31,38 @@ from src.domains.login.scope.api import scope
 from src.domains.login.user.api import user
 from src.middleware import add_process_time_header, auto_token_refresh, add_log_entry
 from src.services.test.populate_fishing.api import fake_fishing_data
+from src.utils.logging.log import logger
 
 load_dotenv()
 env = os.getenv('ENV')
 origins = os.getenv('CORS_ORIGINS')
 os.environ['DATABASE_URI'] = os.getenv(f'DATABASE_URI_{env}')
+os.environ['DATABASE_REPLICA_URI'] = os.getenv(f'DATABASE_REPLICA_URI_{env}', '')
 
 
-app = FastAPI(openapi_url="/openapi.json", docs_url="/docs", root_path=os.getenv('API_V1_PREFIX'))
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Startup: parse the endpoint scopes and load the reference data.
+    warm_up_endpoint_scopes(application.routes)
+    try:
+        await reference_cache.warm_up(FishSpecies, FishingDay)
+    except Exception as e:
+        logger.warning(f'{__name__}: Reference cache warm-up failed, it is loaded on first use. {e}')
+    yield
+    # Shutdown: close the pooled database connections.
+    await dispose_engines()
+
+
+app = FastAPI(openapi_url="/openapi.json", docs_url="/docs", root_path=os.getenv('API_V1_PREFIX'), lifespan=lifespan)
 
 
 # Add routes
 # - Services
 app.include_router(simulation, prefix='/simulation', tags=['Services'])
+app.include_router(stats, prefix='/stats', tags=['Services'])
+# - Health
+app.include_router(health, prefix='/health', tags=['Health'])
+app.include_router(metrics, prefix='/metrics', tags=['Health'])
 # - Test
 app.include_router(fake_user_login, prefix='/test/login', tags=['Test'])
 app.include_router(fake_fishing_data, prefix='/test/populate_db', tags=['Test'])
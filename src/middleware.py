@@ -2,15 +2,14 @@ import os
 import time
 
 from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import sessionmaker
 from starlette import status
 from starlette.requests import Request
 from starlette.responses import Response
 
 from src.constants import AUTHORIZATION, X_REFRESH_TOKEN, MSG_TOKEN_EXPIRED
 from src.db import crud
-from src.db.db import get_async_engine
+from src.db.db import get_session_maker
+from src.db.slow_query import route_var
 from src.domains.login.token.constants import BEARER
 from src.domains.login.token.functions import decode_jwt, session_login
 from src.domains.login.token.models import SessionData
@@ -26,7 +25,8 @@ async def auto_token_refresh(request: Request, call_next) -> Response:
     # If the access token is expired, try to refreh it automatically.
     try:
         if access_token:
-            decode_jwt(access_token)
+            # Reused by the is_authorized dependency
+            request.state.session_data = decode_jwt(access_token)
     except HTTPException as e:
         if (e.status_code == status.HTTP_401_UNAUTHORIZED
                 and e.detail == MSG_TOKEN_EXPIRED
@@ -35,7 +35,7 @@ async def auto_token_refresh(request: Request, call_next) -> Response:
             try:
                 session_data: SessionData = decode_jwt(refresh_token)
                 # The refresh token is valid. Log the session in with the new access- and refresh tokens.
-                async_session = sessionmaker(bind=get_async_engine(), class_=AsyncSession, expire_on_commit=False)
+                async_session = get_session_maker()
                 async with async_session() as db:
                     user = await crud.get_one_where(db, User, User.email, session_data.email)
                     logger.info(f'{__name__}: User "{session_data.email}" tokens are auto-refreshed.')
@@ -68,6 +68,8 @@ async def add_log_entry(request: Request, call_next):
     if len(formatted_url) > url_length:
         formatted_url = f'{formatted_url[:url_length - 3]}...'
     method = request.method.ljust(6)
+    # For the slow query log
+    route_var.set(f'{request.method} {request.url.path}')
     # Log before
     logger.info(f'{__name__}: Str {method} {formatted_url}')
     start_time = time.perf_counter()
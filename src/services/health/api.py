@@ -0,0 +1,74 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Security
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.db.db import get_db_session, get_async_engine
+from src.db.pool import get_pool_status
+from src.db.reference_cache import reference_cache
+from src.db.replica import get_replica_uri, get_replica_health, is_replica_healthy
+from src.db.slow_query import get_slow_query_status
+from src.domains.login.token.functions import is_authorized
+from src.domains.login.user.status_cache import user_status_cache
+from src.services.health.functions import probe_database
+from src.services.health.models import (
+    Readiness, DatabaseMetrics, PoolStatus, ReplicaStatus, CacheMetrics, SlowQueryStatus, BcryptMetrics)
+from src.utils.security.crypto import bcrypt_executor
+
+health = APIRouter()
+metrics = APIRouter()
+
+
+@health.get('/ready', response_model=Readiness)
+async def ready(
+        db: AsyncSession = Depends(get_db_session)
+):
+    """ Readiness probe: the database must be reachable. """
+    latency_ms = await probe_database(db)
+    if latency_ms is None:
+        raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, detail='The database is not available.')
+    return Readiness(status='ready', database_latency_ms=latency_ms)
+
+
+@metrics.get('/db', response_model=DatabaseMetrics)
+async def database_metrics(
+        db: Annotated[AsyncSession, Depends(get_db_session)],
+        _: Annotated[bool, Security(is_authorized, scopes=['metrics_read'])]
+):
+    """
+    Connection pool statistics of the engine behind get_db_session, plus a round trip probe.
+    With a read replica configured, also its health and pool. And the slow query counters of this process.
+    """
+    replica = None
+    replica_uri = get_replica_uri()
+    if replica_uri:
+        replica_engine = get_async_engine(replica_uri)
+        healthy = await is_replica_healthy(replica_uri, replica_engine)
+        replica = ReplicaStatus(
+            healthy=healthy,
+            lag_seconds=get_replica_health(replica_uri).lag_seconds,
+            pool=PoolStatus(**get_pool_status(replica_engine.pool))
+        )
+    return DatabaseMetrics(
+        pool=PoolStatus(**get_pool_status(get_async_engine().pool)),
+        database_latency_ms=await probe_database(db),
+        replica=replica,
+        slow_queries=SlowQueryStatus(**get_slow_query_status())
+    )
+
+
+@metrics.get('/cache', response_model=CacheMetrics)
+async def cache_metrics(
+        _: Annotated[bool, Security(is_authorized, scopes=['metrics_read'])]
+):
+    """ Hit/miss counters and state of the reference data cache and the user status cache. """
+    return CacheMetrics(**reference_cache.get_statistics(), user_status=user_status_cache.get_statistics())
+
+
+@metrics.get('/bcrypt', response_model=BcryptMetrics)
+async def bcrypt_metrics(
+        _: Annotated[bool, Security(is_authorized, scopes=['metrics_read'])]
+):
+    """ Password hashing thread pool: running and waiting (queue depth) calls of this process. """
+    return BcryptMetrics(**bcrypt_executor.get_statistics())
@@ -0,0 +1,17 @@
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.utils.logging.log import logger
+
+
+async def probe_database(db: AsyncSession) -> float | None:
+    """ Database round trip in milliseconds, or None when the database can not be reached. """
+    start_time = time.perf_counter()
+    try:
+        await db.execute(text('SELECT 1'))
+    except Exception as e:
+        logger.warning(f'{__name__}: Database probe failed. {e}')
+        return None
+    return round((time.perf_counter() - start_time) * 1000, 3)
@@ -0,0 +1,71 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+# Pydantic models
+class PoolStatus(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    checkouts: Optional[int] = None
+    checkout_failures: Optional[int] = None
+    slow_checkouts: Optional[int] = None
+    average_wait_ms: Optional[float] = None
+    max_wait_ms: Optional[float] = None
+
+
+class Readiness(BaseModel):
+    status: str
+    database_latency_ms: float
+
+
+class ReplicaStatus(BaseModel):
+    healthy: bool
+    lag_seconds: Optional[float] = None
+    pool: PoolStatus
+
+
+class SlowQueryStatus(BaseModel):
+    statements: int
+    slow_statements: int
+    logged_statements: int
+    max_duration_ms: float
+
+
+class DatabaseMetrics(BaseModel):
+    pool: PoolStatus
+    database_latency_ms: Optional[float] = None
+    replica: Optional[ReplicaStatus] = None
+    slow_queries: Optional[SlowQueryStatus] = None
+
+
+class CachedTable(BaseModel):
+    name: str
+    cached: bool
+    version: int
+    age_seconds: Optional[float] = None
+
+
+class UserCacheStatus(BaseModel):
+    users: int
+    hits: int
+    misses: int
+
+
+class CacheMetrics(BaseModel):
+    hits: int
+    misses: int
+    tables: list[CachedTable]
+    user_status: Optional[UserCacheStatus] = None
+
+
+class BcryptMetrics(BaseModel):
+    max_workers: int
+    max_concurrency: int
+    running: int
+    waiting: int
+    max_waiting: int
+    completed: int
+    average_wait_ms: float
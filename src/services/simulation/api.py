@@ -3,6 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from src.db.db import get_db_session
+from src.db.replica import get_read_session, is_replicated
+from src.db.unit_of_work import unit_of_work
 from src.services.simulation.classes.simulator import Simulator
 from src.services.test.populate_fishing.api import populate_fishing_with_random_data
 
@@ -12,6 +14,7 @@ simulation = APIRouter()
 @simulation.post('/')
 async def start_simulation(
         db: AsyncSession = Depends(get_db_session),
+        read_db: AsyncSession = Depends(get_read_session),
         no_of_fishing_waters='2',
         no_of_fishermen='3',
         no_of_fish_species='5',
@@ -36,14 +39,19 @@ async def start_simulation(
     if not no_of_fishing_days.isnumeric() or int(no_of_fishing_days) == 0 or int(no_of_fishing_days) > 3650:
         raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, 'Number of fishing days must be a valid integer.')
 
-    await populate_fishing_with_random_data(
-        db,
-        no_of_fishingwaters=int(no_of_fishing_waters),
-        no_of_fishermen=int(no_of_fishermen),
-        no_of_fish_species=int(no_of_fish_species),
-        no_of_fishes=int(no_of_fishes),
-        no_of_catches=int(no_of_initial_catches)
-    )
-
-    await simulator.run(db, int(start_year), int(no_of_fishing_days))
+    # The world is populated in one transaction. It is committed before the simulation reads it.
+    async with unit_of_work() as populate_db:
+        await populate_fishing_with_random_data(
+            populate_db,
+            no_of_fishingwaters=int(no_of_fishing_waters),
+            no_of_fishermen=int(no_of_fishermen),
+            no_of_fish_species=int(no_of_fish_species),
+            no_of_fishes=int(no_of_fishes),
+            no_of_catches=int(no_of_initial_catches)
+        )
+
+    # Load the populated data from the replica only when it has been replicated there.
+    if not await is_replicated(db, read_db):
+        read_db = db
+    await simulator.run(db, int(start_year), int(no_of_fishing_days), read_db=read_db)
 
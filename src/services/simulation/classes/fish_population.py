@@ -21,11 +21,13 @@ class FishPopulation:
         default_species = [e for e in SpeciesEnum]
         if no_of_fish_species < len(default_species):
             default_species = [default_species[i] for i in range(no_of_fish_species)]
-        [await crud.add(db, self.create_default_fish_species(s)) for s in default_species]
+        fish_specieses = [self.create_default_fish_species(s) for s in default_species]
 
         # Random species
-        [await crud.add(db, self.create_a_random_fish_species())
-         for _ in range(no_of_fish_species - len(default_species))]
+        fish_specieses.extend(
+            [self.create_a_random_fish_species() for _ in range(no_of_fish_species - len(default_species))])
+        await crud.add_many(db, FishSpecies, fish_specieses)
+        # Not from the reference cache: within a unit of work the new species are not committed yet.
         return await crud.get_all(db, FishSpecies)
 
     def create_default_fish_species(self, species_name) -> FishSpecies:
@@ -82,32 +84,42 @@ class FishPopulation:
         if no_of_fish_species is None:
             no_of_fish_species = len(specieses)
 
+        # Create the random fishes
+        await crud.add_many(db, Fish, [
+            self.get_random_fish_values(specieses[i])
+            for i, count in self.get_fish_count_per_species(specieses, no_of_fishes, no_of_fish_species).items()
+            for _ in range(count)])
+
+        return await crud.get_all(db, Fish)
+
+    @staticmethod
+    def get_fish_count_per_species(specieses: [FishSpecies], no_of_fishes: int, no_of_fish_species: int) -> dict:
+        """ Fish count per index of a random selection of species """
         # Determine max = species with max. relative density (0-100)
         species_random_index_set = get_random_index_set(specieses, no_of_fish_species)
 
         relative_density_max = max(d for d in [specieses[i].relative_density for i in species_random_index_set])
         # Calculate fish count per species, where the species with the highest density gets the full no_of_fishes.
-        fish_count_per_selected_species = {
+        return {
             s: int((specieses[s].relative_density / relative_density_max) * no_of_fishes)
             for s in species_random_index_set
         }
-        # Create the random fishes
-        [await crud.add(db, self.create_random_fish(specieses[i]))
-         for i, count in fish_count_per_selected_species.items() for _ in range(count)]
-
-        return await crud.get_all(db, Fish)
 
     @staticmethod
     def create_random_fish(species: FishSpecies, water_id=None) -> Fish:
+        return Fish(**FishPopulation.get_random_fish_values(species, water_id))
+
+    @staticmethod
+    def get_random_fish_values(species: FishSpecies, water_id=None) -> dict:
         age = random.randint(1, 50)
-        return Fish(
-            fishspecies_id=species.id,
-            age=age,
-            length_cm=min(age * species.yearly_growth_in_cm, species.max_length_cm),
-            weight_g=min(age * species.yearly_growth_in_g, species.max_weight_g),
-            caught_count=0,
-            fishingwater_id=water_id
-        )
+        return {
+            'fishspecies_id': species.id,
+            'age': age,
+            'length_cm': min(age * species.yearly_growth_in_cm, species.max_length_cm),
+            'weight_g': min(age * species.yearly_growth_in_g, species.max_weight_g),
+            'caught_count': 0,
+            'fishingwater_id': water_id
+        }
 
     @staticmethod
     def _get_random_growth(growth_rate):
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db import crud
 from src.domains.entities.enums import Frequency
-from src.domains.entities.fisherman.models import Fisherman
+from src.domains.entities.fisherman.models import Fisherman, get_fisherman_simulation_profile
 from src.utils.logging.log import logger
 from src.utils.tests.round_robin import RoundRobin
 
@@ -29,7 +29,7 @@ class Planning:
         self._get_daily_schedule_for_a_year(year, no_of_fishing_days)
 
         # Get all active fishermen
-        fishermen = [f for f in await crud.get_all(db, Fisherman)
+        fishermen = [f for f in await crud.get_all(db, Fisherman, options=get_fisherman_simulation_profile())
                      if f.fishingwaters
                      and f.fishing_days
                      and species_names and f.fish_species in species_names]
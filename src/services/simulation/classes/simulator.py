@@ -2,6 +2,7 @@ import random
 
 from src.constants import STRIPE
 from src.db import crud
+from src.db.reference_cache import reference_cache
 from src.domains.entities.enums import ActiveAt
 from src.domains.entities.fish.models import Fish
 from src.domains.entities.fish_species.models import FishSpecies
@@ -9,6 +10,7 @@ from src.domains.entities.fishingwater.models import FishingWater, FLOATING_WATE
 from src.services.simulation.classes.fish_population import FishPopulation
 from src.services.simulation.classes.planning import Planning
 from src.services.simulation.models.sim_session import FishingSession
+from src.services.stats.functions import get_fish_count_per_species
 from src.utils.functions import get_random_item
 from src.utils.logging.log import logger
 
@@ -32,35 +34,34 @@ class Simulator:
         self._db = None
         self._fish_population = None
 
-    async def run(self, db, start_year: int, no_of_fishing_days: int):
+    async def run(self, db, start_year: int, no_of_fishing_days: int, read_db=None):
         """
         The simulation runs from the data in the db.
         The data is created in API method "populate_fishing_with_random_data".
+        It is loaded from read_db (e.g. a read replica) if specified.
         """
         self._db = db
         self._fish_population = FishPopulation(db)
+        read_db = read_db or db
 
-        # Get fish specieses
-        self._fish_specieses = {species.id: species for species in await crud.get_all(db, FishSpecies)}
+        # Get fish specieses (reference data)
+        self._fish_specieses = {species.id: species for species in await reference_cache.get_all(FishSpecies)}
         self._fish_specieses_by_name = \
-            {species.species_name: species for species in await crud.get_all(db, FishSpecies)}
+            {species.species_name: species for species in self._fish_specieses.values()}
 
         # Get fishing waters.
-        self._fishing_waters = {water.id: water for water in await crud.get_all(db, FishingWater)}
+        self._fishing_waters = {water.id: water for water in await crud.get_all(read_db, FishingWater)}
 
-        # List fishes per species - {species_id: [Fish]}
-        fishes = await crud.get_all(db, Fish)
-        species_fishes = {
-            species_id: [fish for fish in fishes if fish.fishspecies_id == species_id]
-            for species_id in self._fish_specieses
-        }
+        # Number of fishes per species - {species_id: count}
+        fish_counts = await get_fish_count_per_species(read_db)
+        species_fish_counts = {species_id: fish_counts.get(species_id, 0) for species_id in self._fish_specieses}
 
         # Initialize simulation data.
         self._fishes_per_species_per_water = {}
         [self._initialize_simulation_data(water_id=water_id, species_id=species_id)
             for water_id, water in self._fishing_waters.items()
-            for species_id, fishes in species_fishes.items()
-            for _ in fishes]
+            for species_id, fish_count in species_fish_counts.items()
+            for _ in range(fish_count)]
 
         # Add a random fish per water per species occurrence (in MEMORY).
         [self._add_simulation_data(
@@ -70,13 +71,13 @@ class Simulator:
             att_value=self._fish_population.create_random_fish(self._fish_specieses[species_id], water_id)
         )
             for water_id, water in self._fishing_waters.items()
-            for species_id, fishes in species_fishes.items()
-            for _ in fishes]
+            for species_id, fish_count in species_fish_counts.items()
+            for _ in range(fish_count)]
 
         # Create fishing planning
         planning = Planning()
         species_names = [n for n in self._fish_specieses_by_name]
-        calendar = await planning.create_planning(db, start_year, no_of_fishing_days, species_names)
+        calendar = await planning.create_planning(read_db, start_year, no_of_fishing_days, species_names)
 
         # Get fisherman names from the calendar planning.
         fishermen_names = {
@@ -93,8 +94,8 @@ class Simulator:
         for water_id, water in self._fishing_waters.items():
             logger.info(
                 (f'  {self._get_water_name(water_id)} m3={water.m3}, fish_density={round(water.density, 2)}: '
-                 f'{", ".join([f'{self._fish_specieses[fish_species_id].species_name}({len(fishes)})' 
-                    for fish_species_id, fishes in species_fishes.items()])}'))
+                 f'{", ".join([f'{self._fish_specieses[fish_species_id].species_name}({fish_count})' 
+                    for fish_species_id, fish_count in species_fish_counts.items()])}'))
         logger.info(f'Start year . . . : {start_year}')
         logger.info(f'Fishing days . . : {no_of_fishing_days}')
         logger.info(STRIPE)
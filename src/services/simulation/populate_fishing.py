@@ -1,17 +1,20 @@
+import itertools
+import os
 import random
 
 from fastapi import HTTPException
 from starlette import status
 
 from src.db import crud
+from src.db.copy_loader import copy_rows
 from src.domains.entities.enums import Day, WaterType, FishStatus, Frequency
 from src.domains.entities.fish.models import Fish, FishModel
 from src.domains.entities.fish_species.models import FishSpecies
-from src.domains.entities.fisherman.models import Fisherman
-from src.domains.entities.fishingday.models import FishingDay
+from src.domains.entities.fisherman.models import Fisherman, get_fisherman_simulation_profile, fishingwater_fisherman
+from src.domains.entities.fishingday.models import FishingDay, fisherman_fishingday
 from src.domains.entities.fishingwater.models import FishingWater, FLOATING_WATER
 from src.services.simulation.classes.fish_population import FishPopulation
-from src.utils.functions import get_random_item, get_random_index_set
+from src.utils.functions import get_random_item, get_random_index_set, get_uuid7
 
 rng = random.SystemRandom()
 
@@ -29,15 +32,22 @@ days = [FishingDay(name=Day.Sunday), FishingDay(name=Day.Monday), FishingDay(nam
         FishingDay(name=Day.Wednesday), FishingDay(name=Day.Thursday), FishingDay(name=Day.Friday),
         FishingDay(name=Day.Saturday)]
 
+# Fish columns of the COPY load
+FISH_COLUMNS = ['fishspecies_id', 'status', 'age', 'length_cm', 'weight_g', 'caught_count', 'fisherman_id',
+                'fishingwater_id']
+
 
 async def populate_fishing_with_random_data(
         db, no_of_fishingwaters, no_of_fishermen, no_of_fish_species, no_of_fishes, no_of_catches=0):
 
-    # Delete in sequence
-    [await crud.delete(db, Fish, item.id) for item in await crud.get_all(db, Fish)]
-    [await crud.delete(db, FishSpecies, item.id) for item in await crud.get_all(db, FishSpecies)]
-    [await crud.delete(db, FishingWater, item.id) for item in await crud.get_all(db, FishingWater)]
-    [await crud.delete(db, Fisherman, item.id) for item in await crud.get_all(db, Fisherman)]
+    # Start with an empty world
+    await truncate_world(db)
+
+    # Large worlds are loaded with COPY
+    if no_of_fishes >= int(os.getenv('POPULATE_COPY_THRESHOLD', 10000)):
+        await _populate_with_copy(
+            db, no_of_fishingwaters, no_of_fishermen, no_of_fish_species, no_of_fishes, no_of_catches)
+        return
 
     # Create random data
     fish_population = FishPopulation(db)
@@ -56,16 +66,88 @@ async def populate_fishing_with_random_data(
     [await _catch_random_fish(db, all_fishes, all_fishermen) for _ in range(target_catch_count)]
 
 
+async def truncate_world(db):
+    """ Delete all fishes, fish species, fishing waters and fishermen, children first. """
+    await crud.truncate(db, Fish, FishSpecies, FishingWater, Fisherman)
+
+
+async def _populate_with_copy(
+        db, no_of_fishingwaters, no_of_fishermen, no_of_fish_species, no_of_fishes, no_of_catches):
+    """
+    The fishermen, fishes and relations are streamed into the tables with COPY, and committed at once.
+    The data is distributed like in the ORM path.
+    """
+    fish_population = FishPopulation(db)
+    all_fishingwaters = await _create_random_fishingwaters(db, no_of_fishingwaters, no_of_fishes)
+    all_fishspecieses = await fish_population.create_fishspecieses(db, no_of_fish_species)
+    all_fishermen = [
+        {'id': get_uuid7(), **values} for values in _get_random_fishermen(no_of_fishermen, all_fishspecieses)]
+
+    # Validate
+    if not all_fishspecieses or not all_fishermen or not all_fishingwaters:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, 'Random initial data could not be created.')
+    await copy_rows(db, Fisherman, list(all_fishermen[0]), all_fishermen)
+
+    # Create random relations: the selected fishermen fish in all the waters.
+    fisherman_count = rng.randint(1, len(all_fishermen))  # 1-all fishermen
+    fisherman_ids = [all_fishermen[i]['id'] for i in get_random_index_set(all_fishermen, fisherman_count)]
+    fishingday_ids = await _get_fishingday_ids(db)
+    await copy_rows(db, fisherman_fishingday, ['fisherman_id', 'fishingday_id'], (
+        {'fisherman_id': fisherman_id, 'fishingday_id': fishingday_ids[day.name]}
+        for fisherman_id in fisherman_ids for day in _get_random_days()))
+    await copy_rows(db, fishingwater_fisherman, ['fishingwater_id', 'fisherman_id'], (
+        {'fishingwater_id': fishingwater.id, 'fisherman_id': fisherman_id}
+        for fishingwater in all_fishingwaters for fisherman_id in fisherman_ids))
+
+    # Create the random fishes, some of them caught
+    if not await copy_rows(db, Fish, FISH_COLUMNS, _get_random_fishes(
+            all_fishingwaters, all_fishspecieses, no_of_fishes, no_of_fish_species, fisherman_ids, no_of_catches)):
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, 'Random initial data could not be created.')
+    await crud.commit(db)
+
+
+def _get_random_fishes(all_fishingwaters, all_fishspecieses, no_of_fishes, no_of_fish_species, fisherman_ids,
+                       no_of_catches):
+    """ Generate the fish rows, per species, divided over the waters like in _create_random_fishing_relations. """
+    fish_count_per_species = FishPopulation.get_fish_count_per_species(
+        all_fishspecieses, no_of_fishes, no_of_fish_species)
+    fish_count = sum(fish_count_per_species.values())
+    fishingwater_ids = itertools.chain.from_iterable(
+        itertools.repeat(fishingwater.id, count)
+        for fishingwater, count in zip(all_fishingwaters, _get_fishes_per_water(all_fishingwaters, fish_count)))
+    caught = set(rng.sample(range(fish_count), min(no_of_catches, fish_count)))
+    species_indexes = (i for i, count in fish_count_per_species.items() for _ in range(count))
+    for n, i in enumerate(species_indexes):
+        fish = FishPopulation.get_random_fish_values(all_fishspecieses[i], next(fishingwater_ids, None))
+        fish['status'], fish['fisherman_id'] = FishStatus.Sleeping, None
+        # Only fishes in a water can be caught
+        if n in caught and fish['fishingwater_id']:
+            fish['status'], fish['fisherman_id'] = FishStatus.Feeding, get_random_item(fisherman_ids)
+        yield fish
+
+
+async def _get_fishingday_ids(db) -> dict:
+    """ Fishing day id per day name. The missing days are added. """
+    fishingday_ids = {fishingday.name: fishingday.id for fishingday in await crud.get_all(db, FishingDay)}
+    missing_days = [day for day in Day if day not in fishingday_ids]
+    if missing_days:
+        await crud.add_many(db, FishingDay, [{'name': day} for day in missing_days])
+        fishingday_ids = {fishingday.name: fishingday.id for fishingday in await crud.get_all(db, FishingDay)}
+    return fishingday_ids
+
+
 async def _create_random_fishingwaters(db, no_of_fishingwaters: int, no_of_fishes: int) -> [FishingWater]:
     locations = list({
         _concat_random_items([fake_city_names, [e for e in WaterType], fake_direction])
         for _ in range(no_of_fishingwaters)})
 
-    [await _add_fishing_water(db, location=locations[i], no_of_fishes=no_of_fishes) for i in range(no_of_fishingwaters)]
+    await crud.add_many(db, FishingWater, [
+        _get_random_fishing_water(location=locations[i], no_of_fishes=no_of_fishes)
+        for i in range(len(locations))])
     return await crud.get_all(db, FishingWater)
 
 
-async def _add_fishing_water(db, location, no_of_fishes: int):
+def _get_random_fishing_water(location, no_of_fishes: int) -> FishingWater:
     water_type = get_random_item([e for e in WaterType])
     if water_type in FLOATING_WATER:
         m3 = 0  # Endless water
@@ -74,15 +156,20 @@ async def _add_fishing_water(db, location, no_of_fishes: int):
     else:
         m3 = rng.randint(1000, max(1001, int(no_of_fishes * 10)))
         density = no_of_fishes / m3
-    await crud.add(db, FishingWater(
+    return FishingWater(
         location=location,
         water_type=water_type,
         fishes_count=no_of_fishes,
         density=density,
-        m3=m3))
+        m3=m3)
 
 
 async def _create_fishermen(db, no_of_fishermen: int, specieses: [FishSpecies]) -> [Fisherman]:
+    await crud.add_many(db, Fisherman, _get_random_fishermen(no_of_fishermen, specieses))
+    return await crud.get_all(db, Fisherman, options=get_fisherman_simulation_profile())
+
+
+def _get_random_fishermen(no_of_fishermen: int, specieses: [FishSpecies]) -> [dict]:
     species_names = [i.species_name for i in specieses]
     fisherman_names = list(
         {_concat_random_items([fake_forenames, fake_surnames], separator=' ') for _ in range(no_of_fishermen)})
@@ -90,15 +177,14 @@ async def _create_fishermen(db, no_of_fishermen: int, specieses: [FishSpecies])
     if len(fisherman_names) < no_of_fishermen:
         no_of_fishermen = len(fisherman_names)
 
-    [await crud.add(db, Fisherman(
-        forename=fisherman_names[i].split()[0],
-        surname=fisherman_names[i].split()[1],
-        fish_species=get_random_item([n for n in species_names]),
-        frequency=get_random_item([e for e in Frequency]),
-        fishing_session_duration=rng.randint(3, 12),
-        status=get_random_item([e for e in FishStatus])))
-     for i in range(no_of_fishermen)]
-    return await crud.get_all(db, Fisherman)
+    return [{
+        'forename': fisherman_names[i].split()[0],
+        'surname': fisherman_names[i].split()[1],
+        'fish_species': get_random_item([n for n in species_names]),
+        'frequency': get_random_item([e for e in Frequency]),
+        'fishing_session_duration': rng.randint(3, 12),
+        'status': get_random_item([e for e in FishStatus])}
+        for i in range(no_of_fishermen)]
 
 
 async def _catch_random_fish(db, all_fishes, all_fishermen):
@@ -136,19 +222,24 @@ async def _create_random_fishing_relations(db, all_fishingwaters, all_fishermen,
      for d in _get_random_days()]
     # Select the fishermen
     s = 0
-    # Mean density of fishes over all the waters.
-    mean_density = sum(fw.density for fw in all_fishingwaters) / len(all_fishingwaters)
     # Process fishingwaters
-    for fishingwater in all_fishingwaters:
-        # Divide fishes over the waters depending on fish density of the water.
-        fishes_per_water = int((len(all_fishes) / len(all_fishingwaters)) * (fishingwater.density / mean_density))
-        # Add fishermen
-        [fishingwater.fishermen.append(all_fishermen[i]) for i in fisherman_random_index_set]
+    all_fishes_per_water = _get_fishes_per_water(all_fishingwaters, len(all_fishes))
+    for fishingwater, fishes_per_water in zip(all_fishingwaters, all_fishes_per_water):
+        # Add fishermen (the fishes and fishermen of the water are not loaded)
+        [all_fishermen[i].fishingwaters.append(fishingwater) for i in fisherman_random_index_set]
         # Add fishes
         e = min(s + fishes_per_water, len(all_fishes))
-        [fishingwater.fishes.append(fish) for fish in all_fishes[s:e]]
+        for fish in all_fishes[s:e]:
+            fish.fishingwater_id = fishingwater.id
         s = e
-    await db.commit()
+    await crud.commit(db)
+
+
+def _get_fishes_per_water(all_fishingwaters, fish_count: int) -> [int]:
+    """ Divide the fishes over the waters depending on the fish density of the water. """
+    # Mean density of fishes over all the waters.
+    mean_density = sum(fw.density for fw in all_fishingwaters) / len(all_fishingwaters)
+    return [int((fish_count / len(all_fishingwaters)) * (fw.density / mean_density)) for fw in all_fishingwaters]
 
 
 def _concat_random_items(lists: list, separator='-') -> str:
@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Security
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.replica import get_read_session
+from src.domains.login.token.functions import is_authorized
+from src.services.stats.functions import get_fish_per_water, get_fish_per_species, get_catches_per_fisherman
+from src.services.stats.models import FishPerWater, FishPerSpecies, CatchesPerFisherman
+
+stats = APIRouter()
+
+
+@stats.get('/fish_per_water', response_model=list[FishPerWater])
+async def fish_per_water(
+        db: Annotated[AsyncSession, Depends(get_read_session)],
+        _: Annotated[bool, Security(is_authorized, scopes=['fish_readall'])],
+        fishingwater_id: UUID | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None
+):
+    """ Number of fishes per fishing water per species. """
+    return await get_fish_per_water(db, fishingwater_id, date_from, date_to)
+
+
+@stats.get('/fish_per_species', response_model=list[FishPerSpecies])
+async def fish_per_species(
+        db: Annotated[AsyncSession, Depends(get_read_session)],
+        _: Annotated[bool, Security(is_authorized, scopes=['fish_readall'])],
+        fishingwater_id: UUID | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None
+):
+    """ Number of fishes, average length and weight per species. """
+    return await get_fish_per_species(db, fishingwater_id, date_from, date_to)
+
+
+@stats.get('/catches_per_fisherman', response_model=list[CatchesPerFisherman])
+async def catches_per_fisherman(
+        db: Annotated[AsyncSession, Depends(get_read_session)],
+        _: Annotated[bool, Security(is_authorized, scopes=['fish_readall'])],
+        fishingwater_id: UUID | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None
+):
+    """ Number and total weight of the caught fishes per fisherman. The period is the one of the catch. """
+    return await get_catches_per_fisherman(db, fishingwater_id, date_from, date_to)
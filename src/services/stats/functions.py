@@ -0,0 +1,72 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domains.entities.fish.models import Fish
+from src.domains.entities.fish_species.models import FishSpecies
+from src.domains.entities.fisherman.models import Fisherman
+from src.domains.entities.fishingwater.models import FishingWater
+
+"""
+Aggregates of the fish table, computed by the database (GROUP BY). Only the aggregated rows are returned.
+Filters: the fishing water, and a period [date_from, date_to) of the creation of the fish, or for catches
+of the last update (that is when the fish was caught).
+"""
+
+
+async def get_fish_per_water(
+        db: AsyncSession, fishingwater_id: UUID = None, date_from: datetime = None, date_to: datetime = None) -> list:
+    """ Number of fishes per fishing water per species. """
+    statement = _filter(
+        select(Fish.fishingwater_id, FishingWater.location, Fish.fishspecies_id, FishSpecies.species_name,
+               func.count().label('count'))
+        .join(FishSpecies, Fish.fishspecies_id == FishSpecies.id)
+        .outerjoin(FishingWater, Fish.fishingwater_id == FishingWater.id)
+        .group_by(Fish.fishingwater_id, FishingWater.location, Fish.fishspecies_id, FishSpecies.species_name)
+        .order_by(FishingWater.location, FishSpecies.species_name),
+        Fish.created_at, fishingwater_id, date_from, date_to)
+    return (await db.execute(statement)).mappings().all()
+
+
+async def get_fish_per_species(
+        db: AsyncSession, fishingwater_id: UUID = None, date_from: datetime = None, date_to: datetime = None) -> list:
+    """ Number of fishes, average length and weight per species. """
+    statement = _filter(
+        select(Fish.fishspecies_id, FishSpecies.species_name, func.count().label('count'),
+               func.avg(Fish.length_cm).label('average_length_cm'), func.avg(Fish.weight_g).label('average_weight_g'))
+        .join(FishSpecies, Fish.fishspecies_id == FishSpecies.id)
+        .group_by(Fish.fishspecies_id, FishSpecies.species_name)
+        .order_by(FishSpecies.species_name),
+        Fish.created_at, fishingwater_id, date_from, date_to)
+    return (await db.execute(statement)).mappings().all()
+
+
+async def get_catches_per_fisherman(
+        db: AsyncSession, fishingwater_id: UUID = None, date_from: datetime = None, date_to: datetime = None) -> list:
+    """ Number and total weight of the caught fishes per fisherman. """
+    statement = _filter(
+        select(Fish.fisherman_id, Fisherman.forename, Fisherman.surname, func.count().label('count'),
+               func.sum(Fish.weight_g).label('total_weight_g'))
+        .join(Fisherman, Fish.fisherman_id == Fisherman.id)
+        .group_by(Fish.fisherman_id, Fisherman.forename, Fisherman.surname)
+        .order_by(func.count().desc(), Fisherman.surname),
+        Fish.updated_at, fishingwater_id, date_from, date_to)
+    return (await db.execute(statement)).mappings().all()
+
+
+async def get_fish_count_per_species(db: AsyncSession) -> dict:
+    """ {fishspecies_id: number of fishes} """
+    result = await db.execute(select(Fish.fishspecies_id, func.count()).group_by(Fish.fishspecies_id))
+    return {species_id: count for species_id, count in result.all()}
+
+
+def _filter(statement: Select, date_column, fishingwater_id, date_from, date_to) -> Select:
+    if fishingwater_id:
+        statement = statement.where(Fish.fishingwater_id == fishingwater_id)
+    if date_from:
+        statement = statement.where(date_column >= date_from)
+    if date_to:
+        statement = statement.where(date_column < date_to)
+    return statement
@@ -0,0 +1,29 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+# Pydantic models
+class FishPerWater(BaseModel):
+    fishingwater_id: Optional[UUID] = None
+    location: Optional[str] = None
+    fishspecies_id: UUID
+    species_name: str
+    count: int
+
+
+class FishPerSpecies(BaseModel):
+    fishspecies_id: UUID
+    species_name: str
+    count: int
+    average_length_cm: Optional[float] = None
+    average_weight_g: Optional[float] = None
+
+
+class CatchesPerFisherman(BaseModel):
+    fisherman_id: UUID
+    forename: str
+    surname: str
+    count: int
+    total_weight_g: Optional[int] = None
@@ -11,9 +11,9 @@ from src.domains.login.scope.functions import get_scope_name
 from src.domains.login.scope.models import Scope, Access
 from src.domains.login.token.functions import get_authentication
 from src.domains.login.token.models import Authentication
-from src.domains.login.user.models import User, UserStatus
+from src.domains.login.user.models import User, UserStatus, get_user_roles_profile
 from src.utils.functions import get_password_expiration
-from src.utils.security.crypto import get_salted_hash
+from src.utils.security.crypto import get_salted_hash_async
 from src.utils.tests.functions import get_user_from_db
 
 fake_scopes = [{'fake_admin': ['*', Access.all.value]},
@@ -86,10 +86,10 @@ async def create_fake_role_set(db) -> [Role]:
 
 
 async def add_user_roles(db, email, role_names: list):
-    user = await get_user_from_db(db, email)
+    user = await crud.get_one_where(db, User, User.email, email, options=get_user_roles_profile())
     roles = [await crud.get_one_where(db, Role, Role.name, role_name) for role_name in role_names]
     user.roles = roles
-    await db.commit()
+    await crud.commit(db)
 
 
 async def _insert_logged_in_user(credentials: Login, roles, db) -> Authentication:
@@ -100,7 +100,7 @@ async def _insert_logged_in_user(credentials: Login, roles, db) -> Authenticatio
     # Create user as LoggedIn
     user = User(
         email=credentials.email,
-        password=get_salted_hash(credentials.password.get_secret_value()),
+        password=await get_salted_hash_async(credentials.password.get_secret_value()),
         password_expiration=get_password_expiration(),
         fail_count=0,
         status=UserStatus.LoggedIn,
@@ -127,6 +127,6 @@ async def _create_acls(acls: list, scopes, db) -> [ACL]:
 
 
 async def _create_scopes(scopes: list, db) -> [Scope]:
-    [await crud.delete(db, Scope, scope.id) for scope in await crud.get_all(db, Scope)]
+    await crud.delete_where(db, Scope)
     [await crud.add(db, Scope(entity=v[0], access=v[1])) for scope in scopes for k, v in scope.items()]
     return await crud.get_all(db, Scope)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.db import get_db_session
+from src.db.unit_of_work import get_unit_of_work
 from src.services.simulation.populate_fishing import populate_fishing_with_random_data
 from src.services.test.functions import login_with_fake_admin
 
@@ -10,7 +10,7 @@ fake_fishing_data = APIRouter()
 
 @fake_fishing_data.post('/')
 async def create_random_fishing_data(
-        db: AsyncSession = Depends(get_db_session),
+        db: AsyncSession = Depends(get_unit_of_work),
         no_of_fishing_waters='2',
         no_of_fishermen='10',
         no_of_fish_species='5',
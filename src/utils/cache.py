@@ -0,0 +1,98 @@
+import time
+from collections import OrderedDict
+
+"""
+In-process caches. Every process (worker) has its own, so across processes an entry can be stale until its TTL ends.
+"""
+
+
+class TTLCache:
+    """
+    Key-value cache with a time to live per entry and hit/miss counters.
+    Keys are versioned: invalidate() increments the version, so a value that was loaded before the invalidation
+    is not stored afterwards (see put).
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict = {}  # {key: (expires_at, value)}
+        self._versions: dict = {}
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return default
+
+    def put(self, key, value, version: int = None) -> bool:
+        """ Store the value, unless the key has been invalidated since version (see get_version). """
+        if version is not None and version != self.get_version(key):
+            return False
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        return True
+
+    def get_version(self, key) -> int:
+        return self._versions.get(key, 0)
+
+    def get_age_seconds(self, key) -> float | None:
+        entry = self._entries.get(key)
+        return None if entry is None else round(time.monotonic() - (entry[0] - self.ttl_seconds), 3)
+
+    def invalidate(self, key):
+        self._versions[key] = self.get_version(key) + 1
+        self._entries.pop(key, None)
+
+    def clear(self):
+        for key in list(self._entries):
+            self.invalidate(key)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+class LRUCache:
+    """
+    Bounded key-value cache: when it is full, the least recently used entry is evicted.
+    Every entry has its own expiry time (unix time), with hit/miss counters. max_size 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()  # {key: (expires_at, value)}
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value, expires_at: float):
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
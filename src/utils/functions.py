@@ -1,6 +1,9 @@
 import datetime
 import os
 import random
+import threading
+import time
+import uuid
 
 from dateutil.relativedelta import relativedelta
 from src.utils.tests.constants import PAYLOAD
@@ -10,6 +13,9 @@ rng = random.SystemRandom()
 NAME_CHARS = 'aaaaaabbcddeeeeeeffgghhiiiiijjkkllmmnnnooooooppqrrsssttuuuuuuvvwwxyyz'
 NAME_CHARS_LIST = [item for item in NAME_CHARS]
 
+_uuid7_lock = threading.Lock()
+_uuid7_last = 0
+
 
 def is_debug_mode() -> bool:
     return os.getenv('DEBUG') == 'True' and os.getenv('ENV') == 'DEV'
@@ -110,3 +116,20 @@ def get_random_index_set(items: list, random_subset_count: int) -> set:
         count += 1
         index_set.add(rng.randint(0, set_count - 1))  # get an index
     return index_set
+
+
+def get_uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48 bits unix time in ms, then random bits.
+    Within a process the ids are monotonic (the random part is incremented within the same ms),
+    so new keys are appended to the right side of the primary key index instead of scattered over it.
+    """
+    global _uuid7_last
+    with _uuid7_lock:
+        # 48 bits time + 74 bits random, without the version and variant bits
+        payload = (time.time_ns() // 1_000_000) << 74 | int.from_bytes(os.urandom(10), 'big') >> 6
+        if payload <= _uuid7_last:
+            payload = _uuid7_last + 1
+        _uuid7_last = payload
+    return uuid.UUID(int=(
+        (payload >> 74) << 80 | 0x7 << 76 | ((payload >> 62) & 0xFFF) << 64 | 0x2 << 62 | payload & ((1 << 62) - 1)))
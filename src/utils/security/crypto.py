@@ -10,21 +10,112 @@ print(f"Hashed Password: {hashed_password}")
 is_correct = validate_password(plain_text, hashed_password)
 print(f"Password Match: {is_correct}")
 """
+import asyncio
 import os
 import secrets
 import string
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 
 
+class BcryptExecutor:
+    """
+    Runs bcrypt off the event loop, in a thread pool of BCRYPT_MAX_WORKERS threads.
+    At most BCRYPT_MAX_CONCURRENCY calls are submitted to the pool at once, the other calls wait (queue depth).
+    bcrypt releases the GIL, so the threads hash in parallel.
+    """
+
+    def __init__(self, max_workers: int, max_concurrency: int):
+        self.max_workers = max_workers
+        self.max_concurrency = max(max_concurrency, 1)
+        self.running = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.completed = 0
+        self.wait_seconds = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bcrypt')
+        self._loop = None
+        self._semaphore = None
+
+    async def run(self, function, *args):
+        semaphore = self._get_semaphore()
+        started_at = time.monotonic()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.wait_seconds += time.monotonic() - started_at
+        self.running += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def get_statistics(self) -> dict:
+        return {
+            'max_workers': self.max_workers,
+            'max_concurrency': self.max_concurrency,
+            'running': self.running,
+            'waiting': self.waiting,
+            'max_waiting': self.max_waiting,
+            'completed': self.completed,
+            'average_wait_ms': round(self.wait_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+        }
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # A semaphore belongs to an event loop.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._semaphore = loop, asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+
+_max_workers = int(os.getenv('BCRYPT_MAX_WORKERS', min(4, os.cpu_count() or 1)))
+bcrypt_executor = BcryptExecutor(_max_workers, int(os.getenv('BCRYPT_MAX_CONCURRENCY', 2 * _max_workers)))
+
+
+async def get_salted_hash_async(password: str) -> str:
+    """ get_salted_hash, without blocking the event loop. """
+    if not password:
+        return password
+    return await bcrypt_executor.run(get_salted_hash, password)
+
+
+async def verify_hash_async(plain_text: str, hashed_password: str) -> bool:
+    """ verify_hash, without blocking the event loop. """
+    return await bcrypt_executor.run(verify_hash, plain_text, hashed_password)
+
+
+def get_bcrypt_rounds() -> int:
+    """ The cost of a hash: 2^rounds iterations. See benchmarks/bcrypt_cost.py. """
+    return int(os.getenv('BCRYPT_ROUNDS', 12))
+
+
 def get_salted_hash(password: str) -> str:
     if not password:
         return password
     # Generate a salt and hash the password with the salt
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=get_bcrypt_rounds()))
     return hashed_password.decode('utf-8')
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    The hash ("$2b$<rounds>$<salt and hash>") has a lower cost than BCRYPT_ROUNDS.
+    A hash with a higher cost is kept: lowering BCRYPT_ROUNDS does not weaken the existing hashes.
+    """
+    try:
+        return int(hashed_password.split('$')[2]) < get_bcrypt_rounds()
+    except (AttributeError, IndexError, ValueError):
+        return False
+
+
 def verify_hash(plain_text: str, hashed_password: str) -> bool:
     # Compare the plain password with the hashed password
     try:
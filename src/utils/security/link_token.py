@@ -0,0 +1,60 @@
+import base64
+import hashlib
+import hmac
+import os
+import time
+from functools import lru_cache
+
+from src.utils.functions import get_otp_expiration
+
+"""
+Signed link token for the acknowledge link in the OTP mail: "<key id>.<expires at (unix time)>.<signature>".
+The signature is an HMAC-SHA256 of the key id, the expiry and the email, so it is verified in microseconds.
+Keys: LINK_TOKEN_KEYS="<key id>:<secret>,...". The first key signs, all keys verify (rotation: prepend a new key,
+remove the old one after OTP_EXPIRATION_MINUTES). Without keys, a key derived from JWT_SECRET_KEY is used.
+"""
+
+DERIVED_KEY_ID = '0'
+
+
+@lru_cache(maxsize=8)
+def _get_keys(link_token_keys: str, jwt_secret_key: str) -> tuple:
+    """ ((key id, secret), ...), the signing key first. """
+    keys = tuple(
+        (key_id.strip(), secret.strip().encode('utf-8'))
+        for key_id, _, secret in (item.partition(':') for item in link_token_keys.split(','))
+        if key_id.strip() and secret.strip())
+    if keys:
+        return keys
+    return (DERIVED_KEY_ID, hmac.new(jwt_secret_key.encode('utf-8'), b'link_token', hashlib.sha256).digest()),
+
+
+def get_keys() -> tuple:
+    return _get_keys(os.getenv('LINK_TOKEN_KEYS', ''), os.getenv('JWT_SECRET_KEY', ''))
+
+
+def get_link_token(email: str, expires_at: int = None) -> str:
+    """ Default expiry: the OTP expiration. """
+    key_id, secret = get_keys()[0]
+    expires_at = int(get_otp_expiration().timestamp()) if expires_at is None else expires_at
+    return f'{key_id}.{expires_at}.{_sign(secret, key_id, expires_at, email)}'
+
+
+def verify_link_token(email: str, token: str) -> bool:
+    """ The token is signed for the email with a known key and has not expired. """
+    try:
+        key_id, expires_at, signature = token.split('.')
+        expires_at = int(expires_at)
+    except (AttributeError, ValueError):
+        return False
+    if expires_at < time.time():
+        return False
+    secret = dict(get_keys()).get(key_id)
+    if secret is None:
+        return False
+    return hmac.compare_digest(signature.encode('utf-8'), _sign(secret, key_id, expires_at, email).encode('ascii'))
+
+
+def _sign(secret: bytes, key_id: str, expires_at: int, email: str) -> str:
+    digest = hmac.new(secret, f'{key_id}.{expires_at}.{email}'.encode('utf-8'), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
@@ -12,6 +12,7 @@ from starlette import status
 
 from src.constants import AUTHORIZATION, X_REFRESH_TOKEN
 from src.db import crud
+from src.db.reference_cache import invalidate_on_commit
 from src.domains.login.user.functions import set_user_status_related_attributes
 from src.domains.login.user.models import User, UserStatus
 from src.utils.functions import get_otp_expiration, get_password_expiration, find_filename_path, get_pk
@@ -45,7 +46,7 @@ async def _initialize_user(db, pk, target_status: int | None, plain_text_passwor
         return
     # b. Set attributes
     # - Status related attributes
-    user = set_user_status_related_attributes(User(email=pk, fail_count=0), target_status)
+    user = await set_user_status_related_attributes(User(email=pk, fail_count=0), target_status)
     # - Password
     if not plain_text_password and target_status > 10:
         plain_text_password = get_random_password()
@@ -76,6 +77,7 @@ def get_fixture_path(domain, ext, automatic_tests=False) -> str:
 async def insert_record(db: AsyncSession, entity, payload: dict):
     statement = insert(entity).values(payload)
     await db.execute(statement=statement)
+    invalidate_on_commit(db, entity)
     await db.commit()
 
 
@@ -6,10 +6,10 @@ from src.db import crud
 from src.domains.entities.enums import Frequency, SpeciesEnum
 from src.domains.entities.fish.models import Fish
 from src.domains.entities.fisherman.models import Fisherman
-from src.domains.entities.fishingwater.models import FishingWater
+from src.domains.entities.fishingwater.models import FishingWater, get_fishingwater_detail_profile
 from src.domains.entities.fish_species.models import FishSpecies
 from src.domains.login.role.models import Role
-from src.domains.login.user.models import User
+from src.domains.login.user.models import User, get_user_roles_profile
 from src.services.simulation.classes.fish_population import FishPopulation
 
 
@@ -28,7 +28,7 @@ async def test_cascading_user(client: AsyncClient, db: AsyncSession):
     # c. Delete role-1
     await crud.delete(db, Role, user_1.roles[0].id)
     #    User 1 must still exist with 2 roles (unfortunately) - but table "user_role" has 1 link.
-    user_1 = await crud.get_one(db, User, user_1.id)
+    user_1 = await crud.get_one(db, User, user_1.id, options=get_user_roles_profile())
     assert user_1 and len(user_1.roles) == 2
     #    Only role-2 must exist
     assert not await crud.get_one_where(db, Role, Role.name, 'role_1')
@@ -62,7 +62,7 @@ async def add_user_with_roles(db, email, roles: list = None) -> User:
             user.roles.append(role)
             await db.commit()
     # Verify
-    user = await crud.get_one(db, User, user.id)
+    user = await crud.get_one(db, User, user.id, options=get_user_roles_profile())
     assert len(user.roles) == len(roles) if roles else 0
     return user
 
@@ -106,7 +106,7 @@ async def test_cascading_fishingwater(client: AsyncClient, db: AsyncSession):
     fishingwater_2.fishermen.append(fisherman_2)
     await db.commit()
     # - Check population
-    fishingwater_1 = await crud.get_one(db, FishingWater, fishingwater_1.id)
+    fishingwater_1 = await crud.get_one(db, FishingWater, fishingwater_1.id, options=get_fishingwater_detail_profile())
     assert len(fishingwater_1.fishermen) == 1
     assert len(fishingwater_1.fishes) == 2
     # c. Catch fish-1
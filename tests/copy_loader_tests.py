@@ -0,0 +1,69 @@
+import pytest
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.db.copy_loader import copy_rows
+from src.db.unit_of_work import unit_of_work
+from src.domains.entities.enums import WaterType, FishStatus
+from src.domains.entities.fish.models import Fish
+from src.domains.entities.fish_species.models import FishSpecies
+from src.domains.entities.fisherman.models import Fisherman, fishingwater_fisherman
+from src.domains.entities.fishingwater.models import FishingWater
+from src.services.simulation.populate_fishing import populate_fishing_with_random_data
+
+
+async def _count(db: AsyncSession, table) -> int:
+    return (await db.execute(select(func.count()).select_from(table))).scalar()
+
+
+@pytest.mark.asyncio
+async def test_copy_rows(db: AsyncSession):
+    species_id = (await crud.add_many(db, FishSpecies, [{
+        'species_name': 'Carp', 'active_at': 'Day', 'relative_density': 5, 'minimum_length_to_keep_cm': 10,
+        'max_length_cm': 100, 'max_weight_g': 1000, 'yearly_growth_in_cm': 2, 'yearly_growth_in_g': 10}]))[0]
+    water_id = (await crud.add_many(db, FishingWater, [
+        {'location': 'Leiden', 'water_type': WaterType.Lake, 'density': 1, 'm3': 1000}]))[0]
+    rows = ({'fishspecies_id': species_id, 'status': FishStatus.Sleeping, 'age': i, 'fishingwater_id': water_id}
+            for i in range(2500))
+    assert await copy_rows(db, Fish, ['fishspecies_id', 'status', 'age', 'fishingwater_id'], rows) == 2500
+    await crud.commit(db)
+    fishes = await crud.get_all(db, Fish)
+    assert sorted(fish.age for fish in fishes) == list(range(2500))
+    # Server side id, audit columns set
+    assert all(fish.id and fish.created_at and fish.updated_at and fish.created_by for fish in fishes)
+
+
+@pytest.mark.asyncio
+async def test_copy_rows_rolled_back(db: AsyncSession):
+    with pytest.raises(ValueError):
+        async with unit_of_work() as uow:
+            water_id = (await crud.add_many(uow, FishingWater, [
+                {'location': 'Leiden', 'water_type': WaterType.Lake, 'density': 1, 'm3': 1000}]))[0]
+            fisherman = {'forename': 'Petri', 'surname': 'Heil', 'fish_species': 'Carp', 'frequency': 'Weekly',
+                         'fishing_session_duration': 8, 'status': 'Sleeping'}
+            await copy_rows(uow, Fisherman, list(fisherman), [fisherman])
+            fisherman_id = (await crud.get_all(uow, Fisherman))[0].id
+            await copy_rows(uow, fishingwater_fisherman, ['fishingwater_id', 'fisherman_id'],
+                            [{'fishingwater_id': water_id, 'fisherman_id': fisherman_id}])
+            assert await _count(uow, fishingwater_fisherman) == 1
+            raise ValueError('Request failed')
+    assert await _count(db, Fisherman) == 0
+    assert await _count(db, fishingwater_fisherman) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('threshold', ['1000', '1000000'])
+async def test_populate(db: AsyncSession, monkeypatch, threshold):
+    """ Both paths, COPY and ORM, create the same world. """
+    monkeypatch.setenv('POPULATE_COPY_THRESHOLD', threshold)
+    async with unit_of_work() as uow:
+        await populate_fishing_with_random_data(
+            uow, no_of_fishingwaters=3, no_of_fishermen=10, no_of_fish_species=5, no_of_fishes=2000)
+    fishes = await crud.get_all(db, Fish, limit=99999)
+    assert 2000 <= len(fishes) <= 2000 * 5
+    assert 1 <= await _count(db, FishingWater) <= 3
+    assert await _count(db, FishSpecies) == 5
+    assert 1 <= await _count(db, Fisherman) <= 10
+    assert await _count(db, fishingwater_fisherman) >= 1
+    assert any(fish.fishingwater_id for fish in fishes)
@@ -0,0 +1,191 @@
+import uuid
+
+import pytest
+from sqlalchemy import select, func, insert, event, update
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.db.db import get_async_engine, get_session_maker
+from src.db.reference_cache import reference_cache
+from src.domains.base.models import session_data_var
+from src.domains.entities.enums import WaterType, Frequency, FishermanStatus, FishStatus
+from src.domains.entities.fish.models import Fish
+from src.domains.entities.fish_species.models import FishSpecies
+from src.domains.entities.fisherman.models import Fisherman, fishingwater_fisherman
+from src.domains.entities.fishingwater.models import FishingWater
+from src.domains.login.role.models import Role, RoleRead
+from src.domains.login.token.models import SessionData
+from src.domains.login.user.models import User, UserStatus
+from src.services.simulation.populate_fishing import truncate_world
+from src.utils import functions
+from src.utils.functions import get_uuid7
+
+EMAIL = 'tester@example.com'
+
+
+@pytest.fixture
+def session_email():
+    token = session_data_var.set(SessionData(email=EMAIL, scopes=[]))
+    yield EMAIL
+    session_data_var.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_add_many(db: AsyncSession, session_email):
+    names = ['role_c', 'role_a', 'role_e', 'role_b', 'role_d']
+    ids = await crud.add_many(db, Role, [{'name': name} for name in names], chunk_size=2)
+    rows = {row.id: row for row in (await db.execute(
+        select(Role.id, Role.name, Role.created_by, Role.created_at))).all()}
+    # The ids in the order of the rows, over the chunks.
+    assert [rows[id].name for id in ids] == names
+    assert all(row.created_by == session_email and row.created_at for row in rows.values())
+
+
+async def _count(db, table) -> int:
+    return (await db.execute(select(func.count()).select_from(table))).scalar_one()
+
+
+async def _create_world(db):
+    species_id = (await crud.add_many(db, FishSpecies, [{
+        'species_name': 'Carp', 'active_at': 'Day', 'relative_density': 5, 'minimum_length_to_keep_cm': 10,
+        'max_length_cm': 100, 'max_weight_g': 1000, 'yearly_growth_in_cm': 2, 'yearly_growth_in_g': 10,
+        'hours_of_activity': [8]}]))[0]
+    water_ids = await crud.add_many(db, FishingWater, [
+        {'location': f'water {i}', 'water_type': WaterType.Lake, 'density': 1, 'm3': 1000, 'fishes_count': 2}
+        for i in range(2)])
+    fisherman_id = (await crud.add_many(db, Fisherman, [{
+        'forename': 'Petri', 'surname': 'Heil', 'fish_species': 'Carp', 'frequency': Frequency.Weekly,
+        'fishing_session_duration': 8, 'status': FishermanStatus.Sleeping}]))[0]
+    await crud.add_many(db, Fish, [{
+        'fishspecies_id': species_id, 'fishingwater_id': water_id, 'fisherman_id': fisherman_id,
+        'status': FishStatus.Feeding, 'age': 2, 'length_cm': 10, 'weight_g': 100, 'caught_count': 0}
+        for water_id in water_ids for _ in range(2)])
+    await db.execute(insert(fishingwater_fisherman), [
+        {'fishingwater_id': water_id, 'fisherman_id': fisherman_id} for water_id in water_ids])
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_delete_where(db: AsyncSession):
+    await crud.add_many(db, Role, [{'name': f'role_{i}'} for i in range(5)])
+    assert await crud.delete_where(db, Role, Role.name.in_(['role_0', 'role_1'])) == 2
+    assert await crud.delete_where(db, Role, Role.name == 'unknown') == 0
+    assert await _count(db, Role) == 3
+    # No criteria: all rows
+    assert await crud.delete_where(db, Role) == 3
+    assert await _count(db, Role) == 0
+
+
+@pytest.mark.asyncio
+async def test_truncate_cascade(db: AsyncSession):
+    await _create_world(db)
+    assert len(await reference_cache.get_all(FishSpecies)) == 1
+    # CASCADE empties the tables that refer to the truncated tables.
+    await crud.truncate(db, FishingWater, FishSpecies)
+    assert await _count(db, Fish) == 0
+    assert await _count(db, fishingwater_fisherman) == 0
+    assert await _count(db, Fisherman) == 1
+    # Reference cache invalidated
+    assert await reference_cache.get_all(FishSpecies) == []
+
+
+@pytest.mark.asyncio
+async def test_truncate_world(db: AsyncSession):
+    await _create_world(db)
+    await crud.add(db, Role(name='role_1'))
+    await truncate_world(db)
+    for table in (Fish, FishSpecies, FishingWater, Fisherman, fishingwater_fisherman):
+        assert await _count(db, table) == 0
+    assert await _count(db, Role) == 1
+
+
+class Statements:
+    def __init__(self):
+        self.statements = []
+
+    def _add(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(get_async_engine().sync_engine, 'before_cursor_execute', self._add)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(get_async_engine().sync_engine, 'before_cursor_execute', self._add)
+
+
+@pytest.mark.asyncio
+async def test_upd(db: AsyncSession, session_email):
+    user = await crud.add(db, User(email='user@example.com', status=UserStatus.Inactive))
+    created_at, updated_at = user.created_at, user.updated_at
+    # Someone else changes the status.
+    async with get_session_maker()() as other_db:
+        await other_db.execute(update(User).where(User.id == user.id).values(status=UserStatus.Blocked))
+        await other_db.commit()
+    # Only the dirty column is sent, in one statement.
+    user.fail_count = 3
+    with Statements() as statements:
+        user = await crud.upd(db, User, user)
+    assert len([s for s in statements.statements if s.startswith('UPDATE')]) == 1
+    assert 'status' not in statements.statements[0].split('RETURNING')[0]
+    assert (user.fail_count, user.status) == (3, UserStatus.Blocked)
+    # Audit columns
+    assert (user.update_count, user.updated_by, user.created_at) == (1, session_email, created_at)
+    assert user.updated_at > updated_at
+    # Not flushed again
+    assert not db.dirty
+
+
+@pytest.mark.asyncio
+async def test_upd_stale(db: AsyncSession, session_email):
+    role = await crud.add(db, Role(name='role_1'))
+    role.name = 'role_2'
+    role = await crud.upd(db, Role, role, expected_update_count=0)
+    assert role.update_count == 1
+    role.name = 'role_3'
+    with pytest.raises(StaleDataError):
+        await crud.upd(db, Role, role, expected_update_count=0)
+    # The pending change is discarded.
+    assert (await db.execute(select(Role.name))).scalar_one() == 'role_2'
+
+
+@pytest.mark.asyncio
+async def test_upd_not_found(db: AsyncSession, session_email):
+    role = await crud.add(db, Role(name='role_1'))
+    other_role = await crud.add(db, Role(name='role_2'))
+    await crud.delete(db, Role, other_role.id)
+    # Unrelated pending work in the session is kept.
+    role.name = 'role_3'
+    assert await crud.upd(db, Role, RoleRead(id=other_role.id, name='role_4')) is None
+    assert await crud.upd(db, Role, RoleRead(id=other_role.id, name='role_4'), expected_update_count=0) is None
+    assert role.name == 'role_3'
+    await db.commit()
+    assert (await db.execute(select(Role.name))).scalar_one() == 'role_3'
+
+
+def test_uuid7(monkeypatch):
+    id = get_uuid7()
+    assert (id.version, id.variant) == (7, uuid.RFC_4122)
+    # The first 48 bits are the unix time in ms.
+    assert abs((id.int >> 80) - functions.time.time_ns() // 1_000_000) < 1000
+    # Ordered, also within the same ms
+    ms = (id.int >> 80) + 1000
+    monkeypatch.setattr(functions.time, 'time_ns', lambda: ms * 1_000_000)
+    ids = [get_uuid7() for _ in range(1000)]
+    assert ids == sorted(ids, key=str) and len(set(ids)) == 1000
+    assert {id.int >> 80 for id in ids} == {ms}
+    assert all((id.version, id.variant) == (7, uuid.RFC_4122) for id in ids)
+
+
+@pytest.mark.asyncio
+async def test_add(db: AsyncSession, session_email):
+    with Statements() as statements:
+        role = await crud.add(db, Role(name='role_1'))
+        user = await crud.add(db, User(email='user@example.com'))
+        # Id, defaults and empty collections without a refresh.
+        assert role.id.version == 7 and role.acls == [] and role.users == []
+        assert role.created_by == session_email and role.created_at and role.updated_at
+        assert (user.fail_count, user.status, user.roles) == (0, UserStatus.Inactive, [])
+    assert not [s for s in statements.statements if s.startswith('SELECT')]
+    assert len([s for s in statements.statements if s.startswith('INSERT')]) == 2
@@ -0,0 +1,49 @@
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from src.db import db as db_module
+from src.db.db import get_async_engine, get_session_maker, dispose_engines
+from src.db.pool import InstrumentedPool
+
+
+def _get_uri(command_timeout: int) -> str:
+    """ The test database under another URI. """
+    return make_url(os.getenv('DATABASE_URI')).update_query_dict(
+        {'command_timeout': str(command_timeout)}).render_as_string(hide_password=False)
+
+
+@pytest.mark.asyncio
+async def test_engine_per_uri(monkeypatch):
+    # Own registries: the engine of the other tests is not disposed.
+    monkeypatch.setattr(db_module, '_engines', {})
+    monkeypatch.setattr(db_module, '_session_makers', {})
+    monkeypatch.setenv('DB_POOL_SIZE', '3')
+    monkeypatch.setenv('DB_POOL_MAX_OVERFLOW', '4')
+    monkeypatch.setenv('DB_POOL_TIMEOUT_SECONDS', '5')
+    monkeypatch.setenv('DB_POOL_RECYCLE_SECONDS', '6')
+    monkeypatch.setenv('DB_POOL_PRE_PING', 'False')
+    uri, other_uri = _get_uri(61), _get_uri(62)
+    monkeypatch.setenv('DATABASE_URI', uri)
+    engine = get_async_engine()
+    # Reused per URI
+    assert get_async_engine() is engine
+    assert get_session_maker() is get_session_maker()
+    assert get_session_maker().kw['bind'] is engine
+    # Another URI, another engine
+    monkeypatch.setenv('DATABASE_URI', other_uri)
+    assert get_async_engine() is not engine
+    monkeypatch.setenv('DATABASE_URI', uri)
+    # Pool settings from the env
+    pool = engine.pool
+    assert isinstance(pool, InstrumentedPool)
+    assert (pool.size(), pool._max_overflow, pool._timeout, pool._recycle, pool._pre_ping) == (3, 4, 5, 6, False)
+    async with get_session_maker()() as session:
+        assert (await session.execute(text('SELECT 1'))).scalar_one() == 1
+    # Disposed: all engines and session factories are forgotten.
+    await dispose_engines()
+    assert db_module._engines == {}
+    assert db_module._session_makers == {}
+    assert get_async_engine() is not engine
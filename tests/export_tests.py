@@ -0,0 +1,52 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.db.pagination import encode_cursor
+from src.domains.entities.enums import WaterType
+from src.domains.entities.fishingwater.models import FishingWater, FishingWaterSummary
+from src.services.test.functions import login_with_fake_admin
+
+COLUMNS = [FishingWater.__table__.c[name] for name in FishingWaterSummary.model_fields]
+
+
+async def _add_fishingwaters(db: AsyncSession, count: int) -> list:
+    return await crud.add_many(db, FishingWater, [
+        {'location': f'water {i}', 'water_type': WaterType.Lake, 'density': 1, 'm3': 1000, 'fishes_count': 1000}
+        for i in range(count)])
+
+
+@pytest.mark.asyncio
+async def test_stream_in_chunks(db: AsyncSession):
+    ids = await _add_fishingwaters(db, 25)
+    chunks = [rows async for rows in crud.stream(db, FishingWater, COLUMNS, chunk_size=10)]
+    assert [len(rows) for rows in chunks] == [10, 10, 5]
+    assert [row['id'] for rows in chunks for row in rows] == ids
+    # Cursor and limit as in the list
+    chunks = [rows async for rows in crud.stream(db, FishingWater, COLUMNS, cursor=encode_cursor(ids[9]), limit=3)]
+    assert [row['id'] for rows in chunks for row in rows] == ids[10:13]
+
+
+@pytest.mark.asyncio
+async def test_export(client: AsyncClient, db: AsyncSession):
+    headers = (await login_with_fake_admin(db)).headers
+    ids = await _add_fishingwaters(db, 1500)
+    # NDJSON
+    response = await client.get('fishingwater/export', headers=headers)
+    assert response.status_code == 200 and response.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['id'] for row in rows] == [str(id) for id in ids]
+    assert FishingWaterSummary(**rows[0])
+    # CSV
+    response = await client.get('fishingwater/export?format=csv&limit=10', headers=headers)
+    assert response.status_code == 200 and response.headers['content-type'].startswith('text/csv')
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row['id'] for row in rows] == [str(id) for id in ids[:10]]
+    # Invalid cursor
+    response = await client.get('fishingwater/export?cursor=invalid', headers=headers)
+    assert response.status_code == 422
@@ -0,0 +1,119 @@
+import re
+from collections import Counter
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.db.db import get_async_engine
+from src.domains.entities.enums import WaterType, Frequency, FishermanStatus, FishStatus, Day
+from src.domains.entities.fish.models import Fish
+from src.domains.entities.fish_species.models import FishSpecies
+from src.domains.entities.fisherman.models import Fisherman, fishingwater_fisherman
+from src.domains.entities.fishingday.models import FishingDay, fisherman_fishingday
+from src.domains.entities.fishingwater.models import FishingWater
+from src.domains.login.acl.models import ACL
+from src.domains.login.role.models import Role
+from src.domains.login.scope.models import Scope
+from src.domains.login.scope.scope_manager import ScopeManager
+from src.domains.login.user.models import User
+from src.services.test.functions import login_with_fake_admin
+
+"""
+The loading profiles are locked in by counting the statements per table.
+"""
+
+ENTITY_TABLES = ('fishingwater', 'fisherman', 'fish', 'fishingday')
+LOGIN_TABLES = ('user', 'role', 'acl', 'scope')
+
+
+class StatementCounter:
+    """ Counts the statements that read from or join a table. """
+
+    def __init__(self, tables):
+        self._tables = tables
+        self.counts = Counter()
+
+    def __enter__(self):
+        event.listen(get_async_engine().sync_engine, 'before_cursor_execute', self._count)
+        return self
+
+    def __exit__(self, *_):
+        event.remove(get_async_engine().sync_engine, 'before_cursor_execute', self._count)
+
+    def _count(self, _conn, _cursor, statement, *_):
+        tables = set(re.findall(r'(?:FROM|JOIN) "?(\w+)"?', statement))
+        self.counts.update(table for table in tables if table in self._tables)
+
+
+async def _create_world(db: AsyncSession, no_of_waters=10, no_of_fishes_per_water=5) -> (list, list):
+    species_id = (await crud.add_many(db, FishSpecies, [{
+        'species_name': 'Carp', 'active_at': 'Day', 'relative_density': 5, 'minimum_length_to_keep_cm': 10,
+        'max_length_cm': 100, 'max_weight_g': 1000, 'yearly_growth_in_cm': 2, 'yearly_growth_in_g': 10,
+        'hours_of_activity': [8]}]))[0]
+    water_ids = await crud.add_many(db, FishingWater, [
+        {'location': f'water {i}', 'water_type': WaterType.Lake, 'density': 1, 'm3': 1000, 'fishes_count': 1000}
+        for i in range(no_of_waters)])
+    fisherman_ids = await crud.add_many(db, Fisherman, [{
+        'forename': 'Petri', 'surname': 'Heil', 'fish_species': 'Carp', 'frequency': Frequency.Weekly,
+        'fishing_session_duration': 8, 'status': FishermanStatus.Sleeping}])
+    day_ids = await crud.add_many(db, FishingDay, [{'name': Day.Sunday}])
+    await crud.add_many(db, Fish, [{
+        'fishspecies_id': species_id, 'fishingwater_id': water_id, 'fisherman_id': fisherman_ids[0],
+        'status': FishStatus.Feeding, 'age': 2, 'length_cm': 10, 'weight_g': 100, 'caught_count': 0}
+        for water_id in water_ids for _ in range(no_of_fishes_per_water)])
+    await db.execute(insert(fishingwater_fisherman), [
+        {'fishingwater_id': water_id, 'fisherman_id': fisherman_ids[0]} for water_id in water_ids])
+    await db.execute(insert(fisherman_fishingday), [{'fisherman_id': fisherman_ids[0], 'fishingday_id': day_ids[0]}])
+    await db.commit()
+    return water_ids, fisherman_ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('url, expected', [
+    # List summary: only the entity itself.
+    ('fishingwater/?limit=10', {'fishingwater': 1}),
+    ('fisherman/?limit=10', {'fisherman': 1}),
+    # Detail: the entity, plus one select-in per relation (the many-to-many ones join the entity).
+    ('fishingwater/{water_id}', {'fishingwater': 2, 'fish': 1, 'fisherman': 1}),
+    ('fisherman/{fisherman_id}', {'fisherman': 2, 'fish': 1, 'fishingday': 1}),
+])
+async def test_entity_endpoint_statements(client: AsyncClient, db: AsyncSession, url, expected):
+    headers = (await login_with_fake_admin(db)).headers
+    water_ids, fisherman_ids = await _create_world(db)
+    with StatementCounter(ENTITY_TABLES) as counter:
+        response = await client.get(
+            url.format(water_id=water_ids[0], fisherman_id=fisherman_ids[0]), headers=headers)
+    assert response.status_code == 200
+    assert counter.counts == Counter(expected)
+
+
+@pytest.mark.asyncio
+async def test_update_response_relations(client: AsyncClient, db: AsyncSession):
+    """ An update returns the detail, like a read. """
+    headers = (await login_with_fake_admin(db)).headers
+    water_ids, fisherman_ids = await _create_world(db)
+    water = (await client.get(f'fishingwater/{water_ids[0]}', headers=headers)).json()
+    response = await client.put(f'fishingwater/{water_ids[0]}', json={**water, 'm3': 2000}, headers=headers)
+    assert response.status_code == 200
+    assert (response.json()['m3'], len(response.json()['fishes']), len(response.json()['fishermen'])) == (2000, 5, 1)
+    fisherman = (await client.get(f'fisherman/{fisherman_ids[0]}', headers=headers)).json()
+    response = await client.put(
+        f'fisherman/{fisherman_ids[0]}', json={**fisherman, 'forename': 'Piet'}, headers=headers)
+    assert response.status_code == 200
+    assert (response.json()['forename'], len(response.json()['fishes'])) == ('Piet', 5 * 10)
+
+
+@pytest.mark.asyncio
+async def test_user_scopes_statements(db: AsyncSession):
+    scope = await crud.add(db, Scope(entity='fish', access='read'))
+    acl = await crud.add(db, ACL(name='acl_1', scopes=[scope]))
+    role = await crud.add(db, Role(name='role_1', acls=[acl]))
+    await crud.add(db, User(email='profile@example.nl', roles=[role]))
+    db.expunge_all()
+    with StatementCounter(LOGIN_TABLES) as counter:
+        assert await ScopeManager(db, 'profile@example.nl').get_user_scopes() == ['fish_read']
+    # One indexed read of the effective scopes of the user.
+    assert counter.counts == Counter({'user': 1})
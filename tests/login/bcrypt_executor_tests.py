@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import pytest
+
+from src.utils.security.crypto import BcryptExecutor, get_salted_hash_async, verify_hash_async, verify_hash
+
+
+@pytest.mark.asyncio
+async def test_hash_async():
+    hashed = await get_salted_hash_async('Secret_123')
+    assert verify_hash('Secret_123', hashed)
+    assert await verify_hash_async('Secret_123', hashed)
+    assert not await verify_hash_async('Other_123', hashed)
+    assert not await verify_hash_async('Secret_123', None)
+    assert await get_salted_hash_async('') == ''
+
+
+@pytest.mark.asyncio
+async def test_event_loop_not_blocked():
+    executor = BcryptExecutor(max_workers=1, max_concurrency=1)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    await executor.run(time.sleep, 0.2)
+    ticker.cancel()
+    # The loop kept running while the pool was busy.
+    assert ticks >= 5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap():
+    executor = BcryptExecutor(max_workers=2, max_concurrency=1)
+    await asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(3)))
+    statistics = executor.get_statistics()
+    assert statistics['max_waiting'] == 2
+    assert statistics['completed'] == 3
+    assert statistics['running'] == statistics['waiting'] == 0
+    # Serialized by the cap, despite 2 workers.
+    assert statistics['average_wait_ms'] >= 40
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.db import crud
+from src.db.db import get_session_maker
+from src.domains.login.acl.models import ACL
+from src.domains.login.role.models import Role
+from src.domains.login.scope.effective_scope import check_user_effective_scope, rebuild_user_effective_scope
+from src.domains.login.scope.models import Scope, user_effective_scope
+from src.domains.login.scope.scope_manager import ScopeManager
+from src.domains.login.user.models import User, user_role
+
+
+async def _get_effective_scopes(db, user_id) -> list:
+    result = await db.execute(
+        select(user_effective_scope.c.entity, user_effective_scope.c.access)
+        .where(user_effective_scope.c.user_id == user_id))
+    return sorted(f'{entity}_{access}' for entity, access in result)
+
+
+async def _assert_consistent(db):
+    assert await check_user_effective_scope(db) == {'missing': 0, 'extra': 0}
+
+
+@pytest.mark.asyncio
+async def test_user_effective_scope_maintained(db: AsyncSession):
+    read = await crud.add(db, Scope(entity='fish', access='read'))
+    update = await crud.add(db, Scope(entity='fish', access='update'))
+    acl_1 = await crud.add(db, ACL(name='acl_1', scopes=[read]))
+    acl_2 = await crud.add(db, ACL(name='acl_2', scopes=[read, update]))
+    role_1 = await crud.add(db, Role(name='role_1', acls=[acl_1]))
+    role_2 = await crud.add(db, Role(name='role_2', acls=[acl_2]))
+    user = await crud.add(db, User(email='tester@example.com', roles=[role_1]))
+    other = await crud.add(db, User(email='other@example.com', roles=[role_2]))
+    user_id, other_id = user.id, other.id
+    # user_role
+    assert await _get_effective_scopes(db, user_id) == ['fish_read']
+    assert await _get_effective_scopes(db, other_id) == ['fish_read', 'fish_update']
+    # role_acl
+    role_1 = await crud.get_one(db, Role, role_1.id, options=(selectinload(Role.acls),))
+    role_1.acls.append(acl_2)
+    await db.commit()
+    assert await _get_effective_scopes(db, user_id) == ['fish_read', 'fish_update']
+    # acl_scope
+    acl_2 = await crud.get_one(db, ACL, acl_2.id, options=(selectinload(ACL.scopes),))
+    acl_2.scopes.remove(update)
+    await db.commit()
+    assert await _get_effective_scopes(db, user_id) == ['fish_read']
+    assert await _get_effective_scopes(db, other_id) == ['fish_read']
+    # scope (Core update)
+    read.access = 'readall'
+    await crud.upd(db, Scope, read)
+    assert await _get_effective_scopes(db, user_id) == ['fish_readall']
+    # Cascaded deletes
+    await crud.delete(db, ACL, acl_1.id)
+    await crud.delete(db, Role, role_2.id)
+    assert await _get_effective_scopes(db, user_id) == ['fish_readall']
+    assert await _get_effective_scopes(db, other_id) == []
+    await _assert_consistent(db)
+    await crud.delete(db, User, user_id)
+    assert await _get_effective_scopes(db, user_id) == []
+    await _assert_consistent(db)
+
+
+@pytest.mark.asyncio
+async def test_user_effective_scope_rebuild(db: AsyncSession):
+    scope = await crud.add(db, Scope(entity='fish', access='read'))
+    acl = await crud.add(db, ACL(name='acl_1', scopes=[scope]))
+    role = await crud.add(db, Role(name='role_1', acls=[acl]))
+    user = await crud.add(db, User(email='tester@example.com', roles=[role]))
+    await db.execute(delete(user_effective_scope))
+    await db.execute(insert(user_effective_scope).values(user_id=user.id, entity='fish', access='delete'))
+    await db.commit()
+    assert await check_user_effective_scope(db) == {'missing': 1, 'extra': 1}
+    assert await rebuild_user_effective_scope(db) == 1
+    await _assert_consistent(db)
+    assert await ScopeManager(db, user.email).get_user_scopes() == ['fish_read']
+
+
+@pytest.mark.asyncio
+async def test_user_effective_scope_concurrent_links(db: AsyncSession):
+    """ The refreshes of a user are serialized: a concurrent link change waits for the other transaction. """
+    read = await crud.add(db, Scope(entity='fish', access='read'))
+    update = await crud.add(db, Scope(entity='fish', access='update'))
+    role_1 = await crud.add(db, Role(name='role_1', acls=[await crud.add(db, ACL(name='acl_1', scopes=[read]))]))
+    role_2 = await crud.add(db, Role(name='role_2', acls=[await crud.add(db, ACL(name='acl_2', scopes=[update]))]))
+    user_id = (await crud.add(db, User(email='tester@example.com'))).id
+
+    async def add_role(session, role_id):
+        await session.execute(insert(user_role).values(user_id=user_id, role_id=role_id))
+
+    async with get_session_maker()() as db_1, get_session_maker()() as db_2:
+        await add_role(db_1, role_1.id)
+        task = asyncio.create_task(add_role(db_2, role_2.id))
+        await asyncio.sleep(0.2)
+        assert not task.done()
+        await db_1.commit()
+        await task
+        await db_2.commit()
+    assert await _get_effective_scopes(db, user_id) == ['fish_read', 'fish_update']
+    await _assert_consistent(db)
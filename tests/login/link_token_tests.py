@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from src.utils.security.link_token import get_link_token, verify_link_token
+
+EMAIL = 'tester@example.com'
+
+
+def test_link_token(monkeypatch):
+    monkeypatch.setenv('LINK_TOKEN_KEYS', '2:new_secret,1:old_secret')
+    token = get_link_token(EMAIL)
+    key_id, expires_at, _ = token.split('.')
+    assert key_id == '2'
+    assert int(expires_at) > time.time()
+    assert verify_link_token(EMAIL, token)
+    assert not verify_link_token('other@example.com', token)
+    # Expired
+    assert not verify_link_token(EMAIL, get_link_token(EMAIL, expires_at=int(time.time()) - 1))
+
+
+def test_link_token_rotation(monkeypatch):
+    monkeypatch.setenv('LINK_TOKEN_KEYS', '1:old_secret')
+    token = get_link_token(EMAIL)
+    # New signing key, the old key still verifies.
+    monkeypatch.setenv('LINK_TOKEN_KEYS', '2:new_secret,1:old_secret')
+    assert verify_link_token(EMAIL, token)
+    # Old key removed
+    monkeypatch.setenv('LINK_TOKEN_KEYS', '2:new_secret')
+    assert not verify_link_token(EMAIL, token)
+
+
+def test_link_token_derived_key(monkeypatch):
+    monkeypatch.delenv('LINK_TOKEN_KEYS', raising=False)
+    monkeypatch.setenv('JWT_SECRET_KEY', 'secret')
+    token = get_link_token(EMAIL)
+    assert token.startswith('0.')
+    assert verify_link_token(EMAIL, token)
+    monkeypatch.setenv('JWT_SECRET_KEY', 'other_secret')
+    assert not verify_link_token(EMAIL, token)
+
+
+@pytest.mark.parametrize('token', [
+    None, '', 'x', '1.2', '1.not_a_number.signature', '1.9999999999.signature', '1.9999999999.sïgnature',
+    '1.9999999999.a.b'])
+def test_link_token_invalid(monkeypatch, token):
+    monkeypatch.setenv('LINK_TOKEN_KEYS', '1:secret')
+    assert not verify_link_token(EMAIL, token)
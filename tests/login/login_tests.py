@@ -11,7 +11,8 @@ from src.db import crud
 from src.domains.login.token.functions import session_login
 from src.domains.login.user.models import User
 from src.services.test.functions import create_fake_role_set, add_user_roles
-from src.utils.security.crypto import get_salted_hash
+from src.utils.security.crypto import get_salted_hash, needs_rehash
+from src.utils.security.link_token import get_link_token
 from src.utils.tests.constants import SUCCESS, PAYLOAD, LOGIN, PASSWORD, LOGOUT, FISHINGWATER
 from src.utils.tests.expiration import Expiration
 from src.utils.tests.functions import post_check, get_leaf, get_json, get_model, get_user_from_db, get_check, \
@@ -81,6 +82,28 @@ async def test_login_happy_flow(client: AsyncClient, db: AsyncSession, test_data
     await expect_expiration_days_around(db, email, exp)
 
 
+@pytest.mark.asyncio
+async def test_login_rehash(client: AsyncClient, db: AsyncSession, test_data_login: dict, monkeypatch):
+    """ A password hashed with a lower cost is rehashed on login. """
+    ts = get_test_set()
+    kwargs = {'expected_http_status': 200, 'client': client, 'db': db, 'headers': None}
+    monkeypatch.setenv('BCRYPT_ROUNDS', '4')
+    await post_check([LOGIN, 'register'], ts.login_data, **kwargs)
+    await get_check([LOGIN, 'acknowledge'], client, params=ts.params)
+    await change_password(db, ts.credentials)
+    await post_check([PASSWORD, 'change'], ts.password_data, **kwargs)
+    email = ts.login_data[LOGIN]['register'][SUCCESS][PAYLOAD][EMAIL]
+    await create_fake_role_set(db)
+    await add_user_roles(db, email, ['fake_fisherman'])
+    # Login with a higher cost
+    monkeypatch.setenv('BCRYPT_ROUNDS', '5')
+    await post_check([LOGIN], ts.login_data, **kwargs)
+    db.expunge_all()
+    user = await get_user_from_db(db, email)
+    assert user.password.startswith('$2b$05$')
+    assert not needs_rehash(user.password)
+
+
 async def expect_expiration_days_around(db, email, exp):
     user = await crud.get_one_where(db, User, User.email, email)
     now = datetime.datetime.now(datetime.timezone.utc)
@@ -156,4 +179,4 @@ def get_test_credentials(fixture_set):
     fixture = get_leaf(fixture_set, [PASSWORD, 'change'], SUCCESS, PAYLOAD)
     return {EMAIL: fixture[EMAIL],
             PASSWORD: fixture[PASSWORD],
-            TOKEN: get_salted_hash(fixture[EMAIL])}
+            TOKEN: get_link_token(fixture[EMAIL])}
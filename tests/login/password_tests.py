@@ -1,3 +1,26 @@
+import pytest
 
+from src.utils.security.crypto import get_salted_hash, needs_rehash, verify_hash
 
 
+@pytest.mark.parametrize('rounds', [4, 5])
+def test_bcrypt_rounds(monkeypatch, rounds):
+    monkeypatch.setenv('BCRYPT_ROUNDS', str(rounds))
+    hashed_password = get_salted_hash('Password1!')
+    assert hashed_password.startswith(f'$2b$0{rounds}$')
+    assert verify_hash('Password1!', hashed_password)
+    assert not needs_rehash(hashed_password)
+
+
+def test_needs_rehash(monkeypatch):
+    monkeypatch.setenv('BCRYPT_ROUNDS', '4')
+    hashed_password = get_salted_hash('Password1!')
+    monkeypatch.setenv('BCRYPT_ROUNDS', '5')
+    assert needs_rehash(hashed_password)
+    # A higher cost is not lowered.
+    hashed_password = get_salted_hash('Password1!')
+    monkeypatch.setenv('BCRYPT_ROUNDS', '4')
+    assert not needs_rehash(hashed_password)
+    # No bcrypt hash: nothing to rehash.
+    assert not needs_rehash(None)
+    assert not needs_rehash('plain')
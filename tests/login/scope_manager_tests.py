@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.db import crud
+from src.db.db import get_async_engine, get_session_maker
+from src.domains.login.acl.models import ACL
+from src.domains.login.role.models import Role
+from src.domains.login.scope.models import Scope
+from src.domains.login.scope.scope_manager import ScopeManager
+from src.domains.login.user.models import User, get_user_roles_profile
+
+EMAIL = 'tester@example.com'
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(get_async_engine().sync_engine, 'before_cursor_execute', self._count)
+        return self
+
+    def __exit__(self, *_):
+        event.remove(get_async_engine().sync_engine, 'before_cursor_execute', self._count)
+
+    def _count(self, _conn, _cursor, statement, *_):
+        self.statements.append(statement)
+
+
+async def _create_user(db) -> tuple:
+    read = await crud.add(db, Scope(entity='fish', access='read'))
+    update = await crud.add(db, Scope(entity='fish', access='update'))
+    acl_1 = await crud.add(db, ACL(name='acl_1', scopes=[read]))
+    acl_2 = await crud.add(db, ACL(name='acl_2', scopes=[read]))
+    role_1 = await crud.add(db, Role(name='role_1', acls=[acl_1, acl_2]))
+    role_2 = await crud.add(db, Role(name='role_2', acls=[]))
+    user = await crud.add(db, User(email=EMAIL, roles=[role_1]))
+    return user, (role_1, role_2), (acl_1, acl_2), (read, update)
+
+
+async def _get_scopes(db) -> list:
+    return sorted(await ScopeManager(db, EMAIL).get_user_scopes())
+
+
+@pytest.mark.asyncio
+async def test_user_scopes_statement(db: AsyncSession):
+    await _create_user(db)
+    with StatementCounter() as counter:
+        # Distinct, "fish_read" is linked via 2 acls.
+        assert await _get_scopes(db) == ['fish_read']
+        assert await _get_scopes(db) == ['fish_read']
+    # Per login one read of the effective scopes, not cached in the process.
+    assert len(counter.statements) == 2
+    assert ' '.join(counter.statements[0].split()).startswith(
+        'SELECT user_effective_scope.entity, user_effective_scope.access FROM user_effective_scope JOIN')
+
+
+@pytest.mark.asyncio
+async def test_user_scopes_changed_elsewhere(db: AsyncSession):
+    """ Changes committed by another session (e.g. another worker) are seen by the next login. """
+    user, (role_1, role_2), (acl_1, acl_2), (read, update) = await _create_user(db)
+    assert await _get_scopes(db) == ['fish_read']
+    async with get_session_maker()() as other_db:
+        # acl_scope link
+        acl = await crud.get_one(other_db, ACL, acl_2.id, options=(selectinload(ACL.scopes),))
+        acl.scopes.append(await crud.get_one(other_db, Scope, update.id))
+        await other_db.commit()
+        assert await _get_scopes(db) == ['fish_read', 'fish_update']
+        # role_acl link
+        role = await crud.get_one(other_db, Role, role_1.id, options=(selectinload(Role.acls),))
+        role.acls.remove(acl)
+        await other_db.commit()
+        assert await _get_scopes(db) == ['fish_read']
+        # user_role link
+        other_user = await crud.get_one_where(other_db, User, User.email, EMAIL, options=get_user_roles_profile())
+        other_user.roles = [await crud.get_one(other_db, Role, role_2.id)]
+        await other_db.commit()
+        assert await _get_scopes(db) == []
+        # Scope (Core update)
+        other_user.roles = [role]
+        await other_db.commit()
+        scope = await crud.get_one(other_db, Scope, read.id)
+        scope.access = 'readall'
+        await crud.upd(other_db, Scope, scope)
+        assert await _get_scopes(db) == ['fish_readall']
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from src.constants import ALL
+from src.domains.login.scope.scope_matcher import ScopeMatcher, parse_scope, warm_up_endpoint_scopes
+from src.domains.login.token.models import SessionData
+
+ENTITIES = ['fish', 'fisherman', 'fishingwater', 'fishspecies', 'user', ALL, '']
+ACCESSES = ['read', 'readall', 'create', 'update', 'delete', 'fish_read', ALL, '']
+
+
+def _is_valid_scope(endpoint_scope, user_scopes) -> bool:
+    """ The former implementation, split per request. """
+    if not endpoint_scope or not user_scopes:
+        return False
+    ep_entity, ep_access = endpoint_scope.split('_', maxsplit=1)
+    if not ep_entity or not ep_access:
+        return False
+    for scope in user_scopes:
+        entity, access = scope.split('_', maxsplit=1)
+        if not entity or not access:
+            continue
+        if entity == ALL:
+            if access in (ALL, ep_access):
+                return True
+        else:
+            if entity == ep_entity or ep_entity == ALL:
+                if access in (ALL, ep_access):
+                    return True
+    return False
+
+
+def _get_random_scope(rng) -> str:
+    return f'{rng.choice(ENTITIES)}_{rng.choice(ACCESSES)}'
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_equivalent_to_split(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        user_scopes = [_get_random_scope(rng) for _ in range(rng.randint(0, 6))]
+        matcher = ScopeMatcher(user_scopes)
+        for _ in range(10):
+            endpoint_scope = _get_random_scope(rng)
+            assert matcher.is_allowed(endpoint_scope) == _is_valid_scope(endpoint_scope, user_scopes), \
+                f'{endpoint_scope} <> {user_scopes}'
+
+
+@pytest.mark.parametrize('endpoint_scope, user_scopes, expected', [
+    ('fish_read', ['fish_read'], True),
+    ('fish_read', ['fish_update'], False),
+    ('fish_read', ['fish_*'], True),
+    ('fish_read', ['*_read'], True),
+    ('fish_read', ['*_*'], True),
+    ('*_read', ['user_read'], True),
+    ('fish_read', [], False),
+    ('', ['*_*'], False),
+    # No separator: invalid, not an error.
+    ('fish', ['*_*'], False),
+    ('fish_read', ['fish', 'fish_read'], True),
+])
+def test_scope_matcher(endpoint_scope, user_scopes, expected):
+    assert ScopeMatcher(user_scopes).is_allowed(endpoint_scope) == expected
+
+
+def test_session_data_compiled_once():
+    session_data = SessionData(email='tester@example.com', scopes=['fish_read'])
+    assert session_data.scope_matcher is session_data.scope_matcher
+    assert session_data.scope_matcher.is_allowed('fish_read')
+
+
+def test_warm_up_endpoint_scopes():
+    from fastapi import FastAPI, Security
+
+    def is_allowed():
+        return True
+
+    app = FastAPI()
+
+    @app.get('/fish')
+    async def read_fish(_: bool = Security(is_allowed, scopes=['fish_readall'])):
+        return []
+
+    parse_scope.cache_clear()
+    assert warm_up_endpoint_scopes(app.routes) == 1
+    assert parse_scope.cache_info().currsize == 1
+    assert parse_scope('fish_readall') == ('fish', 'readall')
+    assert parse_scope.cache_info().hits == 1
@@ -0,0 +1,85 @@
+import datetime
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from src.constants import MSG_TOKEN_EXPIRED
+from src.domains.login.token import functions
+from src.domains.login.token.functions import decode_jwt, token_cache, _get_jwt
+from src.utils.cache import LRUCache
+
+
+class DecodeCounter:
+    def __init__(self, monkeypatch):
+        self.count = 0
+        self._decode = jwt.decode
+        monkeypatch.setattr(functions.jwt, 'decode', self._count)
+
+    def _count(self, *args, **kwargs):
+        self.count += 1
+        return self._decode(*args, **kwargs)
+
+
+def _get_token(email='tester@example.com', seconds=60) -> str:
+    expiration_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=seconds)
+    return _get_jwt(email, ['fish_read'], expiration_time)
+
+
+def test_token_verified_once(monkeypatch):
+    token_cache.clear()
+    counter = DecodeCounter(monkeypatch)
+    token = _get_token()
+    session_data = decode_jwt(token)
+    assert (session_data.email, session_data.scopes) == ('tester@example.com', ['fish_read'])
+    assert decode_jwt(token) is session_data
+    assert counter.count == 1
+    # Another token
+    assert decode_jwt(_get_token(email='other@example.com')).email == 'other@example.com'
+    assert counter.count == 2
+
+
+def test_token_cache_ttl(monkeypatch):
+    token_cache.clear()
+    counter = DecodeCounter(monkeypatch)
+    monkeypatch.setenv('JWT_CACHE_TTL_SECONDS', '0')
+    token = _get_token()
+    decode_jwt(token)
+    decode_jwt(token)
+    assert counter.count == 2
+
+
+def test_expired_token_evicted(monkeypatch):
+    token_cache.clear()
+    token = _get_token(seconds=1)
+    decode_jwt(token)
+    assert len(token_cache) == 1
+    time.sleep(1.1)
+    with pytest.raises(HTTPException) as e:
+        decode_jwt(token)
+    assert e.value.status_code == 401 and e.value.detail == MSG_TOKEN_EXPIRED
+    assert len(token_cache) == 0
+
+
+def test_invalid_token_not_cached():
+    token_cache.clear()
+    with pytest.raises(HTTPException) as e:
+        decode_jwt(f'{_get_token()}x')
+    assert e.value.status_code == 401
+    assert len(token_cache) == 0
+
+
+def test_lru_cache():
+    cache = LRUCache(max_size=2)
+    expires_at = time.time() + 60
+    cache.put('a', 1, expires_at)
+    cache.put('b', 2, expires_at)
+    assert cache.get('a') == 1
+    # "b" is the least recently used
+    cache.put('c', 3, expires_at)
+    assert 'b' not in cache and cache.get('a') == 1 and cache.get('c') == 3
+    # Expired
+    cache.put('d', 4, time.time() - 1)
+    assert cache.get('d') is None and 'd' not in cache
+    assert (cache.hits, cache.misses) == (3, 1)
@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.db.db import get_async_engine
+from src.domains.login.user.models import User, UserStatus
+from src.domains.login.user.status_cache import user_status_cache, invalidate_user_status_on_commit, ALL_USERS
+
+EMAIL = 'tester@example.com'
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(get_async_engine().sync_engine, 'before_cursor_execute', self._count)
+        return self
+
+    def __exit__(self, *_):
+        event.remove(get_async_engine().sync_engine, 'before_cursor_execute', self._count)
+
+    def _count(self, _conn, _cursor, statement, *_):
+        self.statements.append(statement)
+
+
+@pytest.mark.asyncio
+async def test_user_status_cached(db: AsyncSession):
+    user_status_cache.clear()
+    assert await user_status_cache.get_status(db, EMAIL) is None
+    await crud.add(db, User(email=EMAIL, status=UserStatus.Active))
+    with StatementCounter() as counter:
+        assert await user_status_cache.get_status(db, EMAIL) == UserStatus.Active
+        assert await user_status_cache.get_status(db, EMAIL) == UserStatus.Active
+    # One query, only the status
+    assert len(counter.statements) == 1
+    assert ' '.join(counter.statements[0].split()).startswith('SELECT "user".status FROM "user" WHERE')
+
+
+@pytest.mark.asyncio
+async def test_user_status_invalidated(db: AsyncSession):
+    user_status_cache.clear()
+    user = await crud.add(db, User(email=EMAIL, status=UserStatus.Active))
+    user_id = user.id
+    assert await user_status_cache.get_status(db, EMAIL) == UserStatus.Active
+    # Core update (e.g. logout)
+    user.status = UserStatus.LoggedIn
+    invalidate_user_status_on_commit(db, EMAIL)
+    await crud.upd(db, User, user)
+    assert await user_status_cache.get_status(db, EMAIL) == UserStatus.LoggedIn
+    # Rolled back: still cached
+    invalidate_user_status_on_commit(db, EMAIL)
+    await db.rollback()
+    assert EMAIL in user_status_cache._cache
+    # ORM delete
+    await crud.delete(db, User, user_id)
+    assert await user_status_cache.get_status(db, EMAIL) is None
+
+
+@pytest.mark.asyncio
+async def test_user_status_invalidate(db: AsyncSession):
+    other_email = 'other@example.com'
+    await crud.add_many(db, User, [{'email': email, 'status': UserStatus.Active} for email in (EMAIL, other_email)])
+    for email in (EMAIL, other_email):
+        await user_status_cache.get_status(db, email)
+    # One user
+    user_status_cache.invalidate({EMAIL})
+    assert EMAIL not in user_status_cache._cache and other_email in user_status_cache._cache
+    # All users
+    user_status_cache.invalidate({ALL_USERS})
+    assert other_email not in user_status_cache._cache
@@ -0,0 +1,58 @@
+import asyncio
+import os
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.domains.base.models import Base
+from src.domains.entities.fishingday.models import FishingDay  # noqa: F401 (table in the metadata)
+from src.main import app  # noqa: F401 (all models in the metadata)
+
+ROOT = Path(__file__).parent.parent
+
+
+def _get_fk_indexes() -> set:
+    """ The indexes declared on the models with a foreign key column: {(table, index name)}. """
+    return {
+        (table.name, index.name)
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if any(column.foreign_keys for column in index.columns)}
+
+
+async def _execute(uri: str, statement: str):
+    engine = create_async_engine(uri, poolclass=NullPool, isolation_level='AUTOCOMMIT')
+    try:
+        async with engine.connect() as connection:
+            result = await connection.execute(text(statement))
+            return result.all() if result.returns_rows else None
+    finally:
+        await engine.dispose()
+
+
+def test_fk_indexes_migrated(monkeypatch):
+    """ Model/migration drift: the FK indexes of the models exist after "alembic upgrade head". """
+    test_url = make_url(os.getenv('DATABASE_URI'))
+    database = f'{test_url.database}_migration'
+    test_uri, uri = (url.render_as_string(hide_password=False) for url in (test_url, test_url.set(database=database)))
+    drop_database = f'DROP DATABASE IF EXISTS {database} WITH (FORCE)'
+    asyncio.run(_execute(test_uri, drop_database))
+    asyncio.run(_execute(test_uri, f'CREATE DATABASE {database}'))
+    try:
+        monkeypatch.setenv('DATABASE_URI', uri)
+        # Without alembic.ini: its logging configuration would disable the loggers of the other tests.
+        config = Config()
+        config.set_main_option('script_location', str(ROOT / 'alembic'))
+        command.upgrade(config, 'head')
+        indexes = set(asyncio.run(_execute(
+            uri, "SELECT tablename, indexname FROM pg_indexes WHERE schemaname = 'public'")))
+    finally:
+        asyncio.run(_execute(test_uri, drop_database))
+    fk_indexes = _get_fk_indexes()
+    assert ('fish', 'ix_fish_fishingwater_id_fishspecies_id') in fk_indexes
+    assert fk_indexes - indexes == set()
@@ -0,0 +1,34 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.constants import X_NEXT_CURSOR
+from src.db import crud
+from src.domains.login.user.models import User
+from src.services.test.functions import login_with_fake_admin
+
+
+@pytest.mark.asyncio
+async def test_keyset_pages(client: AsyncClient, db: AsyncSession):
+    headers = (await login_with_fake_admin(db)).headers
+    for i in range(4):
+        await crud.add(db, User(email=f'user{i}@example.com'))
+    # Pages are ordered by id.
+    expected_ids = sorted(str(user.id) for user in await crud.get_all(db, User))
+    # 5 users, 2 per page: the cursor advances, the last page has no cursor.
+    ids, cursors, params = [], [], {'limit': 2}
+    while True:
+        response = await client.get('user/', params=params, headers=headers)
+        assert response.status_code == 200
+        ids.extend(user['id'] for user in response.json())
+        cursor = response.headers.get(X_NEXT_CURSOR)
+        if not cursor:
+            break
+        assert cursor not in cursors
+        cursors.append(cursor)
+        params = {'limit': 2, 'cursor': cursor}
+    assert len(cursors) == 2
+    assert ids == expected_ids
+    # Malformed cursor
+    response = await client.get('user/', params={'cursor': 'not-a-cursor'}, headers=headers)
+    assert response.status_code == 422
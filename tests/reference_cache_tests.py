@@ -0,0 +1,76 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.db import crud
+from src.db.db import get_async_engine
+from src.db.reference_cache import reference_cache
+from src.domains.entities.enums import Day, Frequency, FishermanStatus
+from src.domains.entities.fisherman.models import Fisherman
+from src.domains.entities.fishingday.models import FishingDay, FishingDayRead
+from src.domains.login.acl.models import ACL
+from src.domains.login.role.models import Role
+from src.domains.login.scope.models import Scope
+from src.services.test.functions import login_with_fake_admin
+
+
+@pytest.mark.asyncio
+async def test_reference_cache_invalidation(db: AsyncSession):
+    assert await reference_cache.get_all(FishingDay) == []
+    # ORM insert, Core update, ORM delete
+    day = await crud.add(db, FishingDay(name=Day.Sunday))
+    assert [d.name for d in await reference_cache.get_all(FishingDay)] == [Day.Sunday]
+    await crud.upd(db, FishingDay, FishingDayRead(id=day.id, name=Day.Monday))
+    assert (await reference_cache.get_one(FishingDay, day.id)).name == Day.Monday
+    await crud.delete(db, FishingDay, day.id)
+    assert await reference_cache.get_one(FishingDay, day.id) is None
+    # Bulk insert, paging
+    await crud.add_many(db, FishingDay, [{'name': Day.Sunday} for _ in range(15)])
+    page = await reference_cache.get_page(FishingDay, limit=10)
+    assert len(page.items) == 10 and page.next_cursor
+    page = await reference_cache.get_page(FishingDay, limit=10, cursor=page.next_cursor)
+    assert len(page.items) == 5 and not page.next_cursor
+    # Link change
+    day = await crud.get_one(db, FishingDay, page.items[0].id, options=[selectinload(FishingDay.fisherman)])
+    await reference_cache.get_all(FishingDay)
+    day.fisherman.append(await crud.add(db, Fisherman(
+        forename='Petri', surname='Heil', fish_species='Carp', frequency=Frequency.Weekly,
+        fishing_session_duration=8, status=FishermanStatus.Sleeping)))
+    await db.commit()
+    assert 'fishingday' not in [t['name'] for t in reference_cache.get_statistics()['tables'] if t['cached']]
+
+
+@pytest.mark.asyncio
+async def test_security_tables_not_cached(client: AsyncClient, db: AsyncSession):
+    """ A change of a role, ACL or scope applies at once, also when it is made by another process. """
+    assert not any(reference_cache.is_reference(obj_def) for obj_def in (Role, ACL, Scope))
+    headers = (await login_with_fake_admin(db)).headers
+    role = await crud.add(db, Role(name='role_1'))
+    assert (await client.get(f'role/{role.id}', headers=headers)).json()['name'] == 'role_1'
+    # Not through crud: nothing is invalidated in this process.
+    await db.execute(update(Role).where(Role.id == role.id).values(name='role_2'))
+    await db.commit()
+    assert (await client.get(f'role/{role.id}', headers=headers)).json()['name'] == 'role_2'
+    assert 'role_2' in [r['name'] for r in (await client.get('role/?limit=100', headers=headers)).json()]
+
+
+@pytest.mark.asyncio
+async def test_reference_cache_without_round_trips(db: AsyncSession):
+    await crud.add(db, FishingDay(name=Day.Sunday))
+    await reference_cache.warm_up(FishingDay)
+    statements = []
+
+    def count(*_):
+        statements.append(1)
+
+    event.listen(get_async_engine().sync_engine, 'before_cursor_execute', count)
+    try:
+        hits = reference_cache.get_statistics()['hits']
+        for _ in range(10):
+            assert len(await reference_cache.get_all(FishingDay)) == 1
+        assert not statements
+        assert reference_cache.get_statistics()['hits'] == hits + 10
+    finally:
+        event.remove(get_async_engine().sync_engine, 'before_cursor_execute', count)
@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.slow_query import slow_query_statistics, route_var
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log(db: AsyncSession, monkeypatch, caplog):
+    monkeypatch.setenv('DB_SLOW_QUERY_MS', '50')
+    monkeypatch.setenv('DB_SLOW_QUERY_SAMPLE_RATE', '1')
+    route_var.set('GET /fish/')
+    slow = slow_query_statistics.slow_statements
+    with caplog.at_level(logging.WARNING):
+        await db.execute(text('SELECT 1'))
+        assert slow_query_statistics.slow_statements == slow
+        await db.execute(text('SELECT pg_sleep(0.1)'))
+    assert slow_query_statistics.slow_statements == slow + 1
+    assert 'Slow query' in caplog.text and 'rows=1' in caplog.text and 'route="GET /fish/"' in caplog.text
+    assert 'SELECT pg_sleep(0.1)' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_slow_query_sampling(db: AsyncSession, monkeypatch):
+    monkeypatch.setenv('DB_SLOW_QUERY_MS', '0')
+    monkeypatch.setenv('DB_SLOW_QUERY_SAMPLE_RATE', '0')
+    slow, logged = slow_query_statistics.slow_statements, slow_query_statistics.logged_statements
+    await db.execute(text('SELECT 1'))
+    assert slow_query_statistics.slow_statements == slow + 1
+    assert slow_query_statistics.logged_statements == logged
+    # A failing statement does not disturb the timing of the next one.
+    with pytest.raises(Exception):
+        await db.execute(text('SELECT * FROM no_such_table'))
+    await db.rollback()
+    await db.execute(text('SELECT 1'))
+    assert slow_query_statistics.slow_statements == slow + 2
@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.domains.entities.enums import WaterType, Frequency, FishermanStatus, FishStatus
+from src.domains.entities.fish.models import Fish
+from src.domains.entities.fish_species.models import FishSpecies
+from src.domains.entities.fisherman.models import Fisherman
+from src.domains.entities.fishingwater.models import FishingWater
+from src.services.stats.functions import (
+    get_fish_per_water, get_fish_per_species, get_catches_per_fisherman, get_fish_count_per_species)
+from src.services.test.functions import login_with_fake_admin
+
+
+async def _create_fishes(db: AsyncSession) -> dict:
+    species_ids = await crud.add_many(db, FishSpecies, [{
+        'species_name': name, 'active_at': 'Day', 'relative_density': 5, 'minimum_length_to_keep_cm': 10,
+        'max_length_cm': 100, 'max_weight_g': 1000, 'yearly_growth_in_cm': 2, 'yearly_growth_in_g': 10,
+        'hours_of_activity': [8]} for name in ('Carp', 'Pike')])
+    water_ids = await crud.add_many(db, FishingWater, [
+        {'location': location, 'water_type': WaterType.Lake, 'density': 1, 'm3': 1000}
+        for location in ('Leiden', 'Delft')])
+    fisherman_ids = await crud.add_many(db, Fisherman, [{
+        'forename': 'Petri', 'surname': 'Heil', 'fish_species': 'Carp', 'frequency': Frequency.Weekly,
+        'fishing_session_duration': 8, 'status': FishermanStatus.Sleeping}])
+    # Leiden: 3 carps (1 caught) of 10 and 20 cm, Delft: 1 pike of 60 cm.
+    await crud.add_many(db, Fish, [
+        {'fishspecies_id': species_ids[0], 'fishingwater_id': water_ids[0], 'length_cm': 10, 'weight_g': 100,
+         'status': FishStatus.Feeding, 'fisherman_id': fisherman_ids[0]},
+        {'fishspecies_id': species_ids[0], 'fishingwater_id': water_ids[0], 'length_cm': 20, 'weight_g': 200,
+         'status': FishStatus.Feeding},
+        {'fishspecies_id': species_ids[0], 'fishingwater_id': water_ids[0], 'length_cm': 30, 'weight_g': 300,
+         'status': FishStatus.Feeding},
+        {'fishspecies_id': species_ids[1], 'fishingwater_id': water_ids[1], 'length_cm': 60, 'weight_g': 2000,
+         'status': FishStatus.Feeding}])
+    return {'species_ids': species_ids, 'water_ids': water_ids, 'fisherman_ids': fisherman_ids}
+
+
+@pytest.mark.asyncio
+async def test_stats(db: AsyncSession):
+    ids = await _create_fishes(db)
+    rows = await get_fish_per_water(db)
+    assert [(row['location'], row['species_name'], row['count']) for row in rows] == [
+        ('Delft', 'Pike', 1), ('Leiden', 'Carp', 3)]
+    rows = await get_fish_per_species(db, fishingwater_id=ids['water_ids'][0])
+    assert [(row['species_name'], row['count'], row['average_length_cm']) for row in rows] == [('Carp', 3, 20)]
+    rows = await get_catches_per_fisherman(db)
+    assert [(row['surname'], row['count'], row['total_weight_g']) for row in rows] == [('Heil', 1, 100)]
+    assert await get_fish_count_per_species(db) == {ids['species_ids'][0]: 3, ids['species_ids'][1]: 1}
+    # Period
+    tomorrow = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=1)
+    assert await get_fish_per_water(db, date_from=tomorrow) == []
+    assert len(await get_fish_per_water(db, date_to=tomorrow)) == 2
+
+
+@pytest.mark.asyncio
+async def test_stats_endpoints(client: AsyncClient, db: AsyncSession):
+    headers = (await login_with_fake_admin(db)).headers
+    ids = await _create_fishes(db)
+    response = await client.get(f'stats/fish_per_species?fishingwater_id={ids["water_ids"][1]}', headers=headers)
+    assert response.status_code == 200
+    assert response.json() == [{
+        'fishspecies_id': str(ids['species_ids'][1]), 'species_name': 'Pike', 'count': 1,
+        'average_length_cm': 60.0, 'average_weight_g': 2000.0}]
+    for url in ('stats/fish_per_water', 'stats/catches_per_fisherman'):
+        response = await client.get(url, headers=headers)
+        assert response.status_code == 200 and response.json()
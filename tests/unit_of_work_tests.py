@@ -0,0 +1,98 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db import crud
+from src.db.db import get_async_engine
+from src.db.reference_cache import reference_cache
+from src.db.unit_of_work import unit_of_work, savepoint
+from src.domains.entities.enums import Day
+from src.domains.entities.fishingday.models import FishingDay, FishingDayRead
+from src.domains.login.role.models import Role, RoleRead
+from src.domains.login.user.functions import set_user_status
+from src.domains.login.user.models import User, UserStatus
+from src.utils.functions import get_uuid7
+
+
+class CommitCounter:
+    def __init__(self):
+        self.commits = 0
+
+    def __enter__(self):
+        event.listen(get_async_engine().sync_engine, 'commit', self._count)
+        return self
+
+    def __exit__(self, *_):
+        event.remove(get_async_engine().sync_engine, 'commit', self._count)
+
+    def _count(self, _):
+        self.commits += 1
+
+
+async def _get_role_names(db: AsyncSession) -> list:
+    return sorted(role.name for role in await crud.get_all(db, Role))
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once(db: AsyncSession):
+    with CommitCounter() as counter:
+        async with unit_of_work() as uow:
+            role = await crud.add(uow, Role(name='role_1'))
+            await crud.add_many(uow, Role, [{'name': 'role_2'}, {'name': 'role_3'}])
+            await crud.upd(uow, Role, RoleRead(id=role.id, name='role_4'))
+            await crud.delete_where(uow, Role, Role.name == 'role_3')
+            # Not committed yet
+            assert await _get_role_names(db) == []
+    assert counter.commits == 1
+    assert await _get_role_names(db) == ['role_2', 'role_4']
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_exception(db: AsyncSession):
+    with pytest.raises(ValueError):
+        async with unit_of_work() as uow:
+            await crud.add(uow, Role(name='role_1'))
+            raise ValueError('Request failed')
+    assert await _get_role_names(db) == []
+
+
+@pytest.mark.asyncio
+async def test_savepoint(db: AsyncSession):
+    async with unit_of_work() as uow:
+        role = await crud.add(uow, Role(name='role_1'))
+        with pytest.raises(ValueError):
+            async with savepoint(uow):
+                await crud.add(uow, Role(name='role_2'))
+                raise ValueError('Partial work failed')
+        # Updating a record that does not exist does not discard the work either.
+        assert await crud.upd(uow, Role, RoleRead(id=role.id, name='role_3')) is not None
+        assert await crud.upd(uow, Role, RoleRead(id=get_uuid7(), name='role_4')) is None
+    assert await _get_role_names(db) == ['role_3']
+
+
+@pytest.mark.asyncio
+async def test_reference_cache_invalidated_on_commit(db: AsyncSession):
+    day = await crud.add(db, FishingDay(name=Day.Sunday))
+    assert [d.name for d in await reference_cache.get_all(FishingDay)] == [Day.Sunday]
+    async with unit_of_work() as uow:
+        await crud.upd(uow, FishingDay, FishingDayRead(id=day.id, name=Day.Monday))
+        # Not committed: the cache still has the committed state.
+        assert [d.name for d in await reference_cache.get_all(FishingDay)] == [Day.Sunday]
+    assert [d.name for d in await reference_cache.get_all(FishingDay)] == [Day.Monday]
+
+
+@pytest.mark.asyncio
+async def test_failed_login_in_unit_of_work(db: AsyncSession):
+    user_id = (await crud.add(db, User(email='tester@example.com', status=UserStatus.Active))).id
+    with pytest.raises(HTTPException):
+        async with unit_of_work() as uow:
+            await crud.add(uow, Role(name='role_1'))
+            user = await crud.get_one(uow, User, user_id)
+            # As validate_user: the user is updated (and locked) in the unit of work before the failure.
+            await crud.upd(uow, User, user)
+            await set_user_status(uow, user, 'Invalid login attempt.')
+    # The fail count persists, the other work of the request is rolled back.
+    db.expire_all()
+    assert (await crud.get_one(db, User, user_id)).fail_count == 1
+    assert await _get_role_names(db) == []
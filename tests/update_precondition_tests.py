@@ -0,0 +1,80 @@
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
+
+from src.db import crud
+from src.domains.base.functions import get_update_response
+from src.domains.login.role.models import Role, RoleRead
+from src.services.test.functions import login_with_fake_admin
+from src.utils.functions import get_uuid7
+
+
+async def _update(db: AsyncSession, role_update: RoleRead, if_match: str = None) -> tuple:
+    response = Response()
+    role = await get_update_response(db, response, Role, role_update, if_match)
+    return role, response.headers.get('etag')
+
+
+@pytest.mark.asyncio
+async def test_update_precondition(db: AsyncSession):
+    role = await crud.add(db, Role(name='role_1'))
+    # No precondition
+    role, etag = await _update(db, RoleRead(id=role.id, name='role_2'))
+    assert (role.name, etag) == ('role_2', '"1"')
+    # If-Match
+    role, etag = await _update(db, RoleRead(id=role.id, name='role_3'), if_match=etag)
+    assert (role.name, etag) == ('role_3', '"2"')
+    role, etag = await _update(db, RoleRead(id=role.id, name='role_4'), if_match='*')
+    assert (role.name, etag) == ('role_4', '"3"')
+    # update_count in the body
+    role, etag = await _update(db, RoleRead(id=role.id, name='role_5', update_count=3))
+    assert (role.name, etag) == ('role_5', '"4"')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('if_match, update_count, status_code', [
+    ('"0"', None, 412),
+    ('W/"0"', None, 412),
+    ('invalid', None, 412),
+    (None, 0, 412),
+    # If-Match has priority
+    ('"1"', 0, 200),
+])
+async def test_update_precondition_failed(db: AsyncSession, if_match, update_count, status_code):
+    role_id = (await crud.add(db, Role(name='role_1'))).id
+    await _update(db, RoleRead(id=role_id, name='role_2'))
+    role_update = RoleRead(id=role_id, name='role_3', update_count=update_count)
+    if status_code == 200:
+        assert (await _update(db, role_update, if_match=if_match))[0].name == 'role_3'
+        return
+    with pytest.raises(HTTPException) as e:
+        await _update(db, role_update, if_match=if_match)
+    assert e.value.status_code == status_code
+    assert (await crud.get_one(db, Role, role_id)).name == 'role_2'
+
+
+@pytest.mark.asyncio
+async def test_update_not_found(db: AsyncSession):
+    with pytest.raises(HTTPException) as e:
+        await _update(db, RoleRead(id=get_uuid7(), name='role_1'), if_match='"0"')
+    assert e.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_etag(client: AsyncClient, db: AsyncSession):
+    headers = (await login_with_fake_admin(db)).headers
+    role = await crud.add(db, Role(name='role_1'))
+    response = await client.get(f'role/{role.id}', headers=headers)
+    etag = response.headers['etag']
+    payload = {'id': str(role.id), 'name': 'role_2'}
+    response = await client.put(f'role/{role.id}', json=payload, headers={**headers, 'If-Match': etag})
+    assert response.status_code == 200 and response.json()['update_count'] == 1
+    assert response.headers['etag'] == '"1"'
+    # A concurrent editor with the old ETag
+    payload = {'id': str(role.id), 'name': 'role_3'}
+    response = await client.put(f'role/{role.id}', json=payload, headers={**headers, 'If-Match': etag})
+    assert response.status_code == 412
+    response = await client.get(f'role/{role.id}', headers=headers)
+    assert (response.json()['name'], response.headers['etag']) == ('role_2', '"1"')